@@ -0,0 +1,81 @@
+"""Long sessions in MoltpyConversation.
+
+Appends turns of varying length to a token-budgeted conversation and
+times appends (compaction included) and building a context window. The
+unbounded list it replaced is timed for comparison: it keeps every turn
+and recounts the tokens of the history for each window.
+
+Run from the repository root:
+
+    python benchmarks/bench_conversation.py [turns ...]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.memory.Conversation import MoltpyConversation, estimate_tokens  # noqa: E402
+
+BUDGET = 32_000
+WINDOW = 8_000
+WINDOWS = 200
+
+
+def turns(count: int) -> list[str]:
+    rng = random.Random(7)
+    words = ["tool", "result", "memory", "note", "heartbeat", "search", "agent", "the", "a", "of"]
+    return [" ".join(rng.choices(words, k=rng.randint(5, 400))) for _ in range(count)]
+
+
+def list_window(history: list[dict[str, str]], budget: int) -> list[dict[str, str]]:
+    """The previous approach: count every turn again, keep the newest that fit."""
+    counts = [estimate_tokens(turn["content"]) for turn in history]
+    picked: list[dict[str, str]] = []
+    for turn, tokens in zip(reversed(history), reversed(counts)):
+        if tokens > budget:
+            break
+        budget -= tokens
+        picked.append(turn)
+    picked.reverse()
+    return picked
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(arg) for arg in argv] or [10_000, 100_000]
+    print(f"{'turns':>8} {'store':>8} {'append (us)':>12} {'window (us)':>12} {'kept':>6} {'tokens':>8}")
+    for count in sizes:
+        texts = turns(count)
+        conversation = MoltpyConversation(max_tokens=BUDGET, max_turns=count)
+        started = time.perf_counter()
+        for index, text in enumerate(texts):
+            conversation.append("user" if index % 2 else "assistant", text)
+        append = (time.perf_counter() - started) / count
+
+        started = time.perf_counter()
+        for _ in range(WINDOWS):
+            conversation.window(WINDOW)
+        window = (time.perf_counter() - started) / WINDOWS
+        print(
+            f"{count:>8} {'ring':>8} {append * 1e6:>12.2f} {window * 1e6:>12.2f} "
+            f"{len(conversation):>6} {conversation.total_tokens:>8}"
+        )
+
+        history: list[dict[str, str]] = []
+        started = time.perf_counter()
+        for index, text in enumerate(texts):
+            history.append({"role": "user" if index % 2 else "assistant", "content": text})
+        append = (time.perf_counter() - started) / count
+        started = time.perf_counter()
+        for _ in range(WINDOWS):
+            list_window(history, WINDOW)
+        window = (time.perf_counter() - started) / WINDOWS
+        tokens = sum(estimate_tokens(turn["content"]) for turn in history)
+        print(f"{count:>8} {'list':>8} {append * 1e6:>12.2f} {window * 1e6:>12.2f} {len(history):>6} {tokens:>8}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
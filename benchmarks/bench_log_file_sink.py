@@ -0,0 +1,81 @@
+"""Throughput of MoltpyFileSink versus the previous per-line file_sink closure.
+
+Run from the repository root:
+
+    python benchmarks/bench_log_file_sink.py [lines ...]
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core import LogLevel  # noqa: E402
+from core.logs import MoltpyFileSink  # noqa: E402
+
+LOG_FORMAT = "[{asctime}] [{levelname}] {message}"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+MAX_BYTES = 1024 * 1024 * 1024
+BACKUP_COUNT = 5
+
+
+def legacy_sink(log_path: Path) -> Callable[[int, str, Any], None]:
+    """The closure configure_logging used before MoltpyFileSink."""
+
+    def file_sink(level: int, line: str, _rich: Any) -> None:
+        asctime = datetime.now().strftime(DATE_FORMAT)
+        levelname = LogLevel.name(level)
+        rendered = LOG_FORMAT.format(asctime=asctime, levelname=levelname, message=line)
+        if log_path.exists():
+            try:
+                current_size = log_path.stat().st_size
+            except OSError:
+                current_size = 0
+            if current_size + len(rendered.encode("utf-8")) + 1 > MAX_BYTES:
+                raise RuntimeError("benchmark does not rotate")
+        with log_path.open("a", encoding="utf-8") as f:
+            f.write(rendered + "\n")
+
+    return file_sink
+
+
+def run(sink: Callable[[int, str, Any], None], lines: int) -> float:
+    line = "2026-01-01 00:00:00 [INFO] MoltpyRuntime: MoltpyRuntime heartbeat cycle executed"
+    started = time.perf_counter()
+    for _ in range(lines):
+        sink(LogLevel.INFO, line, None)
+    return time.perf_counter() - started
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(arg) for arg in argv] or [10_000, 100_000, 1_000_000]
+    print(f"{'lines':>10} {'legacy (s)':>12} {'lines/s':>12} {'buffered (s)':>13} {'lines/s':>12} {'speedup':>8}")
+    for lines in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy_path = Path(tmp) / "legacy.log"
+            legacy = run(legacy_sink(legacy_path), lines)
+
+            sink = MoltpyFileSink(
+                Path(tmp) / "buffered.log",
+                log_format=LOG_FORMAT,
+                date_format=DATE_FORMAT,
+                max_bytes=MAX_BYTES,
+                backup_count=BACKUP_COUNT,
+            )
+            buffered = run(sink, lines)
+            started = time.perf_counter()
+            sink.close()
+            buffered += time.perf_counter() - started
+        print(
+            f"{lines:>10} {legacy:>12.3f} {lines / legacy:>12,.0f} "
+            f"{buffered:>13.3f} {lines / buffered:>12,.0f} {legacy / buffered:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
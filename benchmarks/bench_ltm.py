@@ -0,0 +1,88 @@
+"""Ingestion and full-text search on the SQLite long-term memory store.
+
+Writes synthetic notes whose words follow a Zipf distribution, so queries
+range from rare terms (few matches) to very common ones (a large share of
+all notes), then times searches for the top 10 results. One million notes
+take a few minutes to write.
+
+Run from the repository root:
+
+    python benchmarks/bench_ltm.py [notes ...]
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.memory.Database import MoltpyDatabase  # noqa: E402
+
+VOCABULARY = [f"w{rank}" for rank in range(50_000)]
+CUMULATIVE = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(VOCABULARY))))
+# label, query, raw FTS5 syntax, ranking window (None = the store default)
+QUERIES = [
+    ("rare", "w40000", False, None),
+    ("medium", "w900", False, None),
+    ("common", "w3", False, None),
+    ("common, all", "w3", False, 0),
+    ("two words", "w12 w700", False, None),
+    ("phrase", '"w1 w2"', True, None),
+]
+CHUNK = 10_000
+
+
+def notes(rng: random.Random, start: int, count: int) -> list[tuple[str, str, str]]:
+    batch = []
+    for index in range(start, start + count):
+        words = rng.choices(VOCABULARY, cum_weights=CUMULATIVE, k=40)
+        batch.append(("text", f"note {index} {words[0]}", " ".join(words)))
+    return batch
+
+
+async def run(count: int, root: Path) -> None:
+    db = MoltpyDatabase(root / f"ltm{count}.sqlite3")
+    rng = random.Random(count)
+    ingest = 0.0
+    stored = 0
+    for start in range(0, count, CHUNK):
+        batch = notes(rng, start, min(CHUNK, count - start))
+        started = time.perf_counter()
+        stored += db.add_notes_nowait(batch).result()
+        ingest += time.perf_counter() - started
+    started = time.perf_counter()
+    await db.optimize()
+    ingest += time.perf_counter() - started
+    print(f"{count} notes: stored {stored} in {ingest:.1f}s ({stored / ingest:,.0f} notes/s), {db.transactions} transactions")
+
+    for label, query, raw, window in QUERIES:
+        await db.search(query, limit=10, raw=raw, window=window)
+        timings = []
+        for _ in range(20):
+            begun = time.perf_counter()
+            hits = await db.search(query, limit=10, raw=raw, window=window)
+            timings.append(time.perf_counter() - begun)
+        timings.sort()
+        print(f"  search {label:<13} p50 {timings[10] * 1000:8.2f} ms  max {timings[-1] * 1000:8.2f} ms  hits {len(hits)}")
+
+    begun = time.perf_counter()
+    singles = await asyncio.gather(*(db.add_note("text", f"single {index}", f"single note {index}") for index in range(1_000)))
+    elapsed = time.perf_counter() - begun
+    print(f"  1000 concurrent add_note: {elapsed * 1000:.0f} ms, {sum(1 for s in singles if s)} stored, {db.stats_text()}")
+    db.close()
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(arg) for arg in argv] or [100_000, 1_000_000]
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in sizes:
+            asyncio.run(run(count, Path(tmp)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
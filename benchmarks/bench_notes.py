@@ -0,0 +1,90 @@
+"""Bulk ingestion into MoltpyNotes.
+
+Adds unique notes with large ``CODE`` contents, then times duplicate
+rejection, lookup and deletion by title. The linear store that MoltpyNotes
+replaced is timed on a smaller count for comparison, since it scans every
+note on each add.
+
+Run from the repository root:
+
+    python benchmarks/bench_notes.py [notes ...]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.Types import NoteType  # noqa: E402
+from core.memory.Notes import MoltpyNotes  # noqa: E402
+
+CONTENT_BYTES = 2_000
+
+
+class LinearNotes:
+    """The previous list-backed store: every add compares against all notes."""
+
+    def __init__(self) -> None:
+        self.stm: list[tuple[str, str]] = []
+
+    def note_add(self, note_type: NoteType, title: str, content: str) -> bool:
+        for note_title, note_content in self.stm:
+            if note_title == title or note_content == content:
+                return False
+        self.stm.append((title, content))
+        return True
+
+
+def contents(count: int) -> list[str]:
+    # Contents share a long prefix, so equality checks cannot bail out early.
+    body = "x" * CONTENT_BYTES
+    return [f"{body}{index}" for index in range(count)]
+
+
+def ingest(store, texts: list[str]) -> float:
+    started = time.perf_counter()
+    for index, text in enumerate(texts):
+        store.note_add(NoteType.CODE, f"note-{index}", text)
+    return time.perf_counter() - started
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(arg) for arg in argv] or [10_000, 100_000]
+    print(f"{'notes':>8} {'store':>7} {'add (us)':>9} {'dup (us)':>9} {'get (us)':>9} {'del (us)':>9} {'total (s)':>10}")
+    for count in sizes:
+        texts = contents(count)
+        notes = MoltpyNotes()
+        total = ingest(notes, texts)
+
+        started = time.perf_counter()
+        for index in range(0, count, 10):
+            assert notes.note_add(NoteType.CODE, f"other-{index}", texts[index]) is None
+        duplicate = (time.perf_counter() - started) / len(range(0, count, 10))
+
+        started = time.perf_counter()
+        for index in range(count):
+            notes.note_get_by_title(f"note-{index}")
+        lookup = (time.perf_counter() - started) / count
+
+        started = time.perf_counter()
+        for index in range(0, count, 2):
+            notes.note_del_by_title(f"note-{index}")
+        delete = (time.perf_counter() - started) / len(range(0, count, 2))
+        assert len(notes) == count - len(range(0, count, 2))
+        print(
+            f"{count:>8} {'indexed':>7} {total / count * 1e6:>9.2f} {duplicate * 1e6:>9.2f} "
+            f"{lookup * 1e6:>9.2f} {delete * 1e6:>9.2f} {total:>10.2f}"
+        )
+
+        linear_count = min(count, 5_000)
+        linear_total = ingest(LinearNotes(), texts[:linear_count])
+        print(
+            f"{linear_count:>8} {'linear':>7} {linear_total / linear_count * 1e6:>9.2f} {'':>9} {'':>9} {'':>9} "
+            f"{linear_total:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
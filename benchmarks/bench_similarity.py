@@ -0,0 +1,88 @@
+"""Recall and near-duplicate detection with MoltpySimilarityIndex.
+
+Indexes synthetic notes whose words follow a Zipf distribution, then
+times ``similar`` for whole notes used as queries, and checks that edited
+copies of indexed notes are found as near-duplicates. Also times saving
+and loading the index.
+
+Run from the repository root:
+
+    python benchmarks/bench_similarity.py [notes ...]
+"""
+from __future__ import annotations
+
+import itertools
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.memory.Similarity import MoltpySimilarityIndex  # noqa: E402
+
+VOCABULARY = [f"w{rank}" for rank in range(50_000)]
+CUMULATIVE = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(VOCABULARY))))
+QUERIES = 500
+THRESHOLD = 0.8
+
+
+def texts(rng: random.Random, count: int) -> list[str]:
+    return [" ".join(rng.choices(VOCABULARY, cum_weights=CUMULATIVE, k=rng.randint(10, 120))) for _ in range(count)]
+
+
+def edited(rng: random.Random, text: str) -> str:
+    """``text`` with about one word in twenty replaced."""
+    words = text.split()
+    for _ in range(max(1, len(words) // 20)):
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    return " ".join(words)
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(arg) for arg in argv] or [10_000, 100_000]
+    for count in sizes:
+        rng = random.Random(count)
+        corpus = texts(rng, count)
+        index = MoltpySimilarityIndex()
+        started = time.perf_counter()
+        for start in range(0, count, 1_000):
+            index.add_many((f"n{at}", text) for at, text in enumerate(corpus[start : start + 1_000], start))
+        ingest = time.perf_counter() - started
+        print(f"{count} notes: indexed in {ingest:.1f}s ({count / ingest:,.0f} notes/s), {index.stats_text()}")
+
+        picks = rng.sample(range(count), min(QUERIES, count))
+        for label, make in (("exact", lambda text: text), ("edited", lambda text: edited(rng, text)), ("fresh", None)):
+            queries = [make(corpus[at]) if make else texts(rng, 1)[0] for at in picks]
+            timings = []
+            found = 0
+            for at, query in zip(picks, queries):
+                begun = time.perf_counter()
+                hits = index.similar(query, k=10)
+                timings.append(time.perf_counter() - begun)
+                if hits and hits[0][0] == f"n{at}" and hits[0][1] >= THRESHOLD:
+                    found += 1
+            timings.sort()
+            print(
+                f"  similar {label:<7} p50 {timings[len(timings) // 2] * 1000:6.2f} ms  "
+                f"p95 {timings[int(len(timings) * 0.95)] * 1000:6.2f} ms  "
+                f"max {timings[-1] * 1000:6.2f} ms  near-duplicate {found}/{len(picks)}"
+            )
+
+        with tempfile.TemporaryDirectory() as root:
+            index.path = Path(root) / "similarity.json"
+            started = time.perf_counter()
+            index.save()
+            saved = time.perf_counter() - started
+            size = index.path.stat().st_size
+            started = time.perf_counter()
+            loaded = MoltpySimilarityIndex(index.path).load()
+            print(
+                f"  save {saved:.2f}s, load {time.perf_counter() - started:.2f}s, "
+                f"{size / 1e6:.1f} MB, {len(loaded)} texts"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
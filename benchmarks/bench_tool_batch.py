@@ -0,0 +1,84 @@
+"""Latency of one agent iteration with many independent tool calls.
+
+Each synthetic tool sleeps for a random 10-100 ms, standing in for network
+I/O. Sequential execution costs the sum of those delays; the batch runner
+should approach the slowest call, unless a capability limit serializes part
+of the batch.
+
+Run from the repository root:
+
+    python benchmarks/bench_tool_batch.py [calls ...]
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.tools import MoltpyTool, MoltpyToolBatchRunner, MoltpyToolExecutor, MoltpyToolRegistry  # noqa: E402
+
+
+def sleepy(delay: float, **_: Any) -> dict[str, float]:
+    time.sleep(delay)
+    return {"delay": delay}
+
+
+def build_registry() -> MoltpyToolRegistry:
+    registry = MoltpyToolRegistry()
+    for name, requires in (("fetch", ["network"]), ("compute", [])):
+        tool = MoltpyTool.from_dict(
+            {
+                "tool_name": name,
+                "description": "Sleeps for the given delay.",
+                "tool": {
+                    "name": name,
+                    "input_schema": {"type": "object", "properties": {"delay": {"type": "number"}}, "required": ["delay"]},
+                },
+                "runtime": {"handler": "bench_tool_batch:sleepy", "timeout_ms": 5000, "requires": requires},
+            }
+        )
+        registry.add(tool)
+    return registry
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(arg) for arg in argv] or [4, 16, 64]
+    rng = random.Random(7)
+    registry = build_registry()
+    executor = MoltpyToolExecutor(registry, max_workers=64, per_tool_limit=64)
+    print(f"{'calls':>6} {'sum (s)':>8} {'slowest':>8} {'sequential':>11} {'batch':>8} {'batch net<=4':>13}")
+    for count in sizes:
+        calls = [
+            {"name": "fetch" if index % 2 else "compute", "arguments": {"delay": rng.uniform(0.01, 0.1)}}
+            for index in range(count)
+        ]
+        delays = [call["arguments"]["delay"] for call in calls]
+
+        started = time.perf_counter()
+        for call in calls:
+            executor.execute_call(call)
+        sequential = time.perf_counter() - started
+
+        async def batched(limit: int) -> float:
+            runner = MoltpyToolBatchRunner(executor, {"network": limit})
+            started = time.perf_counter()
+            results = await runner.run_batch(calls)
+            assert all(result.ok for result in results), [result.error for result in results if not result.ok]
+            return time.perf_counter() - started
+
+        unlimited = asyncio.run(batched(count))
+        limited = asyncio.run(batched(4))
+        print(
+            f"{count:>6} {sum(delays):>8.3f} {max(delays):>8.3f} {sequential:>11.3f} "
+            f"{unlimited:>8.3f} {limited:>13.3f}"
+        )
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,83 @@
+"""Tool loading time for a synthetic manifest tree.
+
+Compares single-threaded loading with the thread pool, each without the
+manifest cache (cold) and with a populated cache (warm). A few malformed and
+duplicate manifests are mixed in so the error and conflict paths are timed too.
+
+Run from the repository root:
+
+    python benchmarks/bench_tool_loading.py [manifests ...]
+"""
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.tools import MoltpyManifestCache, MoltpyToolRegistry  # noqa: E402
+
+TOOLS_PER_DIR = 100
+
+
+def build_tree(root: Path, count: int) -> None:
+    for index in range(count):
+        folder = root / f"group{index // TOOLS_PER_DIR:03d}" / f"tool{index:05d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"tool{index:05d}.json"
+        if index % 1000 == 999:
+            path.write_text("{ not json", encoding="utf-8")
+            continue
+        name = f"tool_{index % (count - 10)}" if count > 10 else f"tool_{index}"
+        manifest = {
+            "tool_name": name,
+            "description": f"Synthetic tool {index}",
+            "tool": {
+                "name": f"bench.tool{index}",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {"text": {"type": "string"}, "limit": {"type": "integer", "default": 10}},
+                    "required": ["text"],
+                },
+            },
+            "runtime": {"handler": f"tools.bench.tool{index}:run", "timeout_ms": 1000},
+        }
+        path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def timed(root: Path, workers: int, cache_path: Path | None) -> tuple[float, MoltpyToolRegistry]:
+    cache = MoltpyManifestCache(cache_path).load() if cache_path is not None else None
+    started = time.perf_counter()
+    registry = MoltpyToolRegistry().load_tools([root], cache=cache, max_workers=workers)
+    return time.perf_counter() - started, registry
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(arg) for arg in argv] or [10_000]
+    print(f"{'manifests':>10} {'mode':>22} {'seconds':>9} {'files/s':>10} {'loaded':>7} {'errors':>7} {'conflicts':>9}")
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "tools"
+            build_tree(root, count)
+            cache_path = Path(tmp) / "cache" / "tools.manifest.json"
+            runs = [
+                ("sequential, no cache", 1, None),
+                ("threaded, no cache", None, None),
+                ("threaded, cold cache", None, cache_path),
+                ("threaded, warm cache", None, cache_path),
+                ("sequential, warm cache", 1, cache_path),
+            ]
+            for label, workers, cache in runs:
+                elapsed, registry = timed(root, workers or 0, cache)
+                report = registry.report
+                print(
+                    f"{count:>10} {label:>22} {elapsed:>9.3f} {report.scanned / elapsed:>10,.0f} "
+                    f"{report.loaded:>7} {len(report.errors):>7} {len(report.conflicts):>9}"
+                )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,100 @@
+"""Latency of MoltpyToolRegistry.search over a large synthetic registry.
+
+Builds tools whose descriptions draw from a Zipf-distributed vocabulary,
+then times indexing, top-k queries, and incremental add/remove. With
+``--narrow`` the vocabulary shrinks to the 40 domain words, a worst case
+where every query term appears in roughly a third of the tools.
+
+Run from the repository root:
+
+    python benchmarks/bench_tool_search.py [--narrow] [tools ...]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.tools import MoltpyTool, MoltpyToolRegistry  # noqa: E402
+
+VERBS = ["search", "fetch", "read", "write", "list", "delete", "summarize", "translate", "convert", "send"]
+NOUNS = [
+    "web", "file", "email", "calendar", "issue", "image", "note", "repo", "ticket", "invoice",
+    "weather", "stock", "map", "contact", "message", "pdf", "sheet", "database", "log", "metric",
+]
+COMMON = ["quickly", "remote", "local", "latest", "archive", "user", "project", "report", "text", "query"]
+QUERIES = ["search the web", "send an email to a contact", "summarize pdf report", "latest stock metric", "translate text"]
+
+
+FILLER = "the a of and to for with from in on by or this that it".split()
+
+
+def vocabulary(narrow: bool) -> tuple[list[str], list[float]]:
+    """Description words with Zipf weights. Function words lead, the domain
+    words follow, then a long tail. ``narrow`` uses only the 40 domain words,
+    so every query term matches a large share of the tools."""
+    domain = VERBS + NOUNS + COMMON
+    if narrow:
+        words = domain
+    else:
+        tail = [f"{VERBS[i % len(VERBS)][:3]}{NOUNS[i % len(NOUNS)][:3]}{i}" for i in range(2_000)]
+        words = FILLER + tail[:40] + domain + tail[40:]
+    return words, [1.0 / (rank + 1) for rank in range(len(words))]
+
+
+def make_tool(index: int, rng: random.Random, words: list[str], weights: list[float]) -> MoltpyTool:
+    verb, noun = rng.choice(VERBS), rng.choice(NOUNS)
+    description = " ".join(rng.choices(words, weights, k=12))
+    properties = {name: {"type": "string"} for name in rng.sample(NOUNS, 3)}
+    return MoltpyTool.from_dict(
+        {
+            "tool_name": f"{verb}_{noun}_{index}",
+            "description": f"{verb.capitalize()} {noun} {description}",
+            "tool": {"name": f"{noun}.{verb}{index}", "input_schema": {"type": "object", "properties": properties}},
+            "examples": [{"input": {next(iter(properties)): " ".join(rng.choices(words, weights, k=2))}}],
+        }
+    )
+
+
+def main(argv: list[str]) -> None:
+    narrow = "--narrow" in argv
+    sizes = [int(arg) for arg in argv if arg != "--narrow"] or [1_000, 10_000]
+    words, weights = vocabulary(narrow)
+    print(f"{'tools':>7} {'index (ms)':>11} {'search p50 (us)':>16} {'search max (us)':>16} {'add+remove (us)':>16}")
+    for count in sizes:
+        rng = random.Random(count)
+        tools = [make_tool(index, rng, words, weights) for index in range(count)]
+        registry = MoltpyToolRegistry()
+        started = time.perf_counter()
+        for tool in tools:
+            registry.add(tool)
+        indexed = time.perf_counter() - started
+
+        registry.search(QUERIES[0], k=5)
+        timings = []
+        for _ in range(200):
+            for query in QUERIES:
+                started = time.perf_counter()
+                registry.search(query, k=5)
+                timings.append(time.perf_counter() - started)
+        timings.sort()
+
+        extra = make_tool(count, rng, words, weights)
+        started = time.perf_counter()
+        for _ in range(1000):
+            registry.add(extra)
+            registry.remove(extra.tool_name)
+        churn = (time.perf_counter() - started) / 1000
+
+        print(
+            f"{count:>7} {indexed * 1000:>11.1f} {timings[len(timings) // 2] * 1e6:>16.1f} "
+            f"{timings[-1] * 1e6:>16.1f} {churn * 1e6:>16.1f}"
+        )
+    print("top 5 for", repr(QUERIES[0]), "->", [tool.tool_name for tool in registry.search(QUERIES[0], k=5)])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,111 @@
+"""Per-call cost of MoltpyTool.tool_call argument validation.
+
+Compares the old required-keys-only check, a recursive validator that walks
+the schema dict on every call, and the compiled validator cached on the tool,
+both one call at a time and through validate_inputs.
+
+Timings are the best of five runs. Run from the repository root:
+
+    python benchmarks/bench_tool_validation.py [calls]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.tools import MoltpyTool  # noqa: E402
+
+TOOL = MoltpyTool.from_dict(
+    {
+        "tool_name": "browse_web",
+        "description": "Search the web and return sources.",
+        "tool": {
+            "name": "web.search",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "minLength": 1},
+                    "recency_days": {"type": "integer", "default": 30, "minimum": 0},
+                    "sites": {"type": "array", "items": {"type": "string"}, "default": []},
+                    "filters": {
+                        "type": "object",
+                        "properties": {"lang": {"type": "string", "default": "en"}, "safe": {"type": "boolean"}},
+                    },
+                },
+                "required": ["query"],
+            },
+        },
+    }
+)
+ARGUMENTS = {"query": "moltpy agent", "sites": ["a.example", "b.example"], "filters": {"safe": True}}
+
+
+def required_only(arguments: dict[str, Any]) -> dict[str, Any]:
+    """What tool_call checked before schemas were compiled."""
+    required = TOOL.tool.get("input_schema", {}).get("required", [])
+    missing = [key for key in required if key not in arguments]
+    if missing:
+        raise ValueError(f"Missing required inputs: {', '.join(missing)}")
+    return arguments
+
+
+_TYPES: dict[str, Any] = {"string": str, "integer": int, "boolean": bool, "array": list, "object": dict}
+
+
+def interpreted(arguments: Any, schema: dict[str, Any] | None = None) -> Any:
+    """Re-reads the schema dict on every call; the approach compiling avoids."""
+    schema = TOOL.tool["input_schema"] if schema is None else schema
+    expected = schema.get("type")
+    if expected and not isinstance(arguments, _TYPES[expected]):
+        raise ValueError(f"expected {expected}")
+    if expected == "string" and len(arguments) < schema.get("minLength", 0):
+        raise ValueError("too short")
+    if expected == "object":
+        for key in schema.get("required", []):
+            if key not in arguments:
+                raise ValueError(f"missing {key}")
+        result = dict(arguments)
+        for key, sub in schema.get("properties", {}).items():
+            if key in result:
+                result[key] = interpreted(result[key], sub)
+            elif "default" in sub:
+                result[key] = sub["default"]
+        return result
+    if expected == "array" and "items" in schema:
+        return [interpreted(item, schema["items"]) for item in arguments]
+    return arguments
+
+
+def per_call(fn: Callable[[dict[str, Any]], Any], calls: int, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn(ARGUMENTS)
+        best = min(best, time.perf_counter() - started)
+    return best / calls
+
+
+def main(argv: list[str]) -> None:
+    calls = int(argv[0]) if argv else 100_000
+    TOOL.validate_input(ARGUMENTS)
+    rows = [
+        ("required keys only", per_call(required_only, calls)),
+        ("interpreted schema", per_call(interpreted, calls)),
+        ("compiled validator", per_call(TOOL.validate_input, calls)),
+        ("tool_call", per_call(lambda arguments: TOOL.tool_call(**arguments), calls)),
+    ]
+    batch = [ARGUMENTS] * calls
+    rows.append(("validate_inputs (batch)", per_call(lambda _: TOOL.validate_inputs(batch), 1) / calls))
+
+    print(f"{'mode':>24} {'ns/call':>10} {'calls/s':>12}")
+    for label, seconds in rows:
+        print(f"{label:>24} {seconds * 1e9:>10,.0f} {1 / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, ClassVar
 
-try:
-    from rich.console import Console
-    from rich.text import Text
-except Exception:
-    Console = None  # type: ignore[assignment]
-    Text = None  # type: ignore[assignment]
+# Rich is imported on first use so processes that never render to a console
+# (headless runs, ``moltpy logs``) do not pay for it.
+Console = None
+Text = None
+_rich_loaded = False
+
+
+def _load_rich() -> bool:
+    global Console, Text, _rich_loaded
+    if not _rich_loaded:
+        _rich_loaded = True
+        try:
+            from rich.console import Console as RichConsole
+            from rich.text import Text as RichText
+        except Exception:
+            return False
+        Console, Text = RichConsole, RichText
+    return Text is not None
 
 
 class LogLevel:
@@ -30,6 +45,225 @@ class LogLevel:
         return cls._names.get(level, f"LEVEL_{level}")
 
 
+class LogOverflow:
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_DEBUG = "drop_debug"
+
+    _policies: ClassVar[set[str]] = {BLOCK, DROP_OLDEST, DROP_DEBUG}
+
+    @classmethod
+    def normalize(cls, policy: str | None) -> str:
+        value = str(policy or cls.BLOCK).strip().lower().replace("-", "_")
+        return value if value in cls._policies else cls.BLOCK
+
+
+class MoltpyLogRecord:
+    """A single log call whose text is only built when a sink asks for it."""
+
+    __slots__ = ("created", "name", "level", "_template", "_args", "_kwargs", "_message", "_rich")
+
+    _level_styles: ClassVar[dict[int, str]] = {
+        LogLevel.DEBUG: "dim",
+        LogLevel.INFO: "cyan",
+        LogLevel.WARNING: "yellow",
+        LogLevel.ERROR: "bold red",
+    }
+    # (epoch second, "%Y-%m-%d %H:%M:%S" text); replaced atomically.
+    _timestamp_cache: ClassVar[tuple[int, str]] = (-1, "")
+
+    def __init__(
+        self,
+        created: float,
+        name: str,
+        level: int,
+        template: str,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        self.created = created
+        self.name = name
+        self.level = level
+        self._template = template
+        self._args = args
+        self._kwargs = kwargs
+        self._message: str | None = None
+        self._rich: "Text | None" = None
+
+    @property
+    def level_name(self) -> str:
+        return LogLevel.name(self.level)
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            if self._args or self._kwargs:
+                self._message = self._template.format(*self._args, **(self._kwargs or {}))
+            else:
+                self._message = self._template
+            self._args = ()
+            self._kwargs = None
+        return self._message
+
+    @property
+    def timestamp(self) -> str:
+        second = int(self.created)
+        cached_second, cached_text = MoltpyLogRecord._timestamp_cache
+        if cached_second == second:
+            return cached_text
+        text = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        MoltpyLogRecord._timestamp_cache = (second, text)
+        return text
+
+    @property
+    def line(self) -> str:
+        return f"{self.timestamp} [{self.level_name}] {self.name}: {self.message}"
+
+    def rich_text(self) -> "Text | None":
+        if not _load_rich():
+            return None
+        if self._rich is None:
+            text = Text()  # type: ignore[misc]
+            text.append(self.timestamp, style="dim")
+            text.append(" [")
+            text.append(self.level_name, style=self._level_styles.get(self.level, "white"))
+            text.append("] ")
+            text.append(self.name, style="bold dark_green")
+            text.append(": ")
+            text.append(self.message)
+            self._rich = text
+        return self._rich
+
+
+@dataclass
+class LogSink:
+    """A registered sink and what it wants from each record.
+
+    ``rich`` sinks receive a Rich ``Text`` (and default to the console level);
+    ``record`` sinks are called with the ``MoltpyLogRecord`` itself.
+    """
+
+    sink: Callable[..., None]
+    min_level: int | None = None
+    rich: bool = False
+    record: bool = False
+
+
+class MoltpyLogDispatcher:
+    """Bounded queue drained in batches by a dedicated writer thread.
+
+    Callers only pay for an enqueue; formatting and sink I/O happen on the
+    ``moltpy-log-writer`` thread.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[MoltpyLogRecord], None],
+        max_size: int = 10000,
+        overflow: str = LogOverflow.BLOCK,
+        batch_size: int = 256,
+    ) -> None:
+        self._dispatch = dispatch
+        self.max_size = max(1, int(max_size))
+        self.overflow = LogOverflow.normalize(overflow)
+        self.batch_size = max(1, int(batch_size))
+        self._queue: deque[MoltpyLogRecord] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._dropped = 0
+        self._closing = False
+        self._thread = threading.Thread(
+            target=self._writer_loop,
+            name="moltpy-log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def enqueue(self, record: MoltpyLogRecord) -> bool:
+        if threading.current_thread() is self._thread:
+            # A sink logging from the writer thread must not wait on itself.
+            self._dispatch(record)
+            return True
+        with self._lock:
+            if self._closing:
+                return False
+            if len(self._queue) >= self.max_size and not self._make_room(record):
+                self._dropped += 1
+                return False
+            self._queue.append(record)
+            self._not_empty.notify()
+        return True
+
+    def _make_room(self, record: MoltpyLogRecord) -> bool:
+        if self.overflow == LogOverflow.BLOCK:
+            while len(self._queue) >= self.max_size and not self._closing:
+                self._not_full.wait()
+            return not self._closing
+        if self.overflow == LogOverflow.DROP_DEBUG:
+            for index, queued in enumerate(self._queue):
+                if queued.level <= LogLevel.DEBUG:
+                    del self._queue[index]
+                    self._dropped += 1
+                    return True
+            if record.level <= LogLevel.DEBUG:
+                return False
+        self._queue.popleft()
+        self._dropped += 1
+        return True
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closing:
+                    self._not_empty.wait()
+                if not self._queue and self._closing:
+                    self._idle.notify_all()
+                    return
+                count = min(self.batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+                self._not_full.notify_all()
+            for record in batch:
+                try:
+                    self._dispatch(record)
+                except Exception:
+                    pass
+            with self._lock:
+                self._in_flight = 0
+                if not self._queue:
+                    self._idle.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        if threading.current_thread() is self._thread:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while (self._queue or self._in_flight) and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        self.flush(timeout)
+        with self._lock:
+            self._closing = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def dropped(self) -> int:
+        return self._dropped
+
+
 @dataclass
 class MoltpyLogger:
     name: str
@@ -39,9 +273,13 @@ class MoltpyLogger:
     _console: ClassVar["Console | None"] = None
     _use_rich: ClassVar[bool] = True
     _emit_to_console: ClassVar[bool] = True
-    _sinks: ClassVar[list[Callable[[int, str, "Text | None"], None]]] = []
+    _console_min_level: ClassVar[int] = LogLevel.DEBUG
+    _sinks: ClassVar[list[LogSink]] = []
+    _floor: ClassVar[int] = LogLevel.DEBUG
+    _wants_rich: ClassVar[bool] = True
     _default_min_level: ClassVar[int] = LogLevel.INFO
-    
+    _dispatcher: ClassVar["MoltpyLogDispatcher | None"] = None
+
     @classmethod
     def get(cls, name: str, min_level: int | None = None) -> "MoltpyLogger":
         if name not in cls._instances:
@@ -66,74 +304,172 @@ class MoltpyLogger:
         emit_to_console: bool | None = None,
         sink: Callable[[int, str, "Text | None"], None] | None = None,
         min_level: int | None = None,
+        console_level: int | None = None,
     ) -> None:
         if use_rich is not None:
             cls._use_rich = use_rich
         if emit_to_console is not None:
             cls._emit_to_console = emit_to_console
         if sink is not None:
-            cls._sinks = [sink]
+            cls._sinks = [LogSink(sink=sink)]
         if min_level is not None:
             cls._default_min_level = min_level
             for logger in cls._instances.values():
                 logger.min_level = min_level
+        if console_level is not None:
+            cls._console_min_level = console_level
+        cls._refresh_routing()
+
+    @classmethod
+    def add_sink(
+        cls,
+        sink: Callable[..., None],
+        min_level: int | None = None,
+        rich: bool = False,
+        record: bool = False,
+    ) -> None:
+        cls._sinks = cls._sinks + [LogSink(sink=sink, min_level=min_level, rich=rich, record=record)]
+        cls._refresh_routing()
+
+    @classmethod
+    def remove_sink(cls, sink: Callable[..., None]) -> None:
+        cls._sinks = [s for s in cls._sinks if s.sink != sink]
+        cls._refresh_routing()
+
+    @classmethod
+    def set_sink_level(cls, sink: Callable[..., None], min_level: int | None) -> None:
+        for entry in cls._sinks:
+            if entry.sink == sink:
+                entry.min_level = min_level
+        cls._refresh_routing()
 
     @classmethod
-    def add_sink(cls, sink: Callable[[int, str, "Text | None"], None]) -> None:
-        cls._sinks.append(sink)
+    def _sink_level(cls, entry: LogSink) -> int:
+        if entry.min_level is not None:
+            return entry.min_level
+        return cls._console_min_level if entry.rich else LogLevel.DEBUG
 
     @classmethod
-    def remove_sink(cls, sink: Callable[[int, str, "Text | None"], None]) -> None:
-        cls._sinks = [s for s in cls._sinks if s is not sink]
+    def _refresh_routing(cls) -> None:
+        levels = [cls._sink_level(entry) for entry in cls._sinks]
+        if cls._emit_to_console:
+            levels.append(cls._console_min_level)
+        cls._floor = min(levels) if levels else LogLevel.ERROR + 1
+        cls._wants_rich = cls._use_rich and (
+            cls._emit_to_console or any(entry.rich for entry in cls._sinks)
+        )
+
+    @classmethod
+    def enable_queue(
+        cls,
+        max_size: int = 10000,
+        overflow: str = LogOverflow.BLOCK,
+        batch_size: int = 256,
+    ) -> MoltpyLogDispatcher:
+        current = cls._dispatcher
+        overflow = LogOverflow.normalize(overflow)
+        if (
+            current is not None
+            and current.max_size == max_size
+            and current.overflow == overflow
+            and current.batch_size == batch_size
+        ):
+            return current
+        dispatcher = MoltpyLogDispatcher(
+            cls._dispatch_record,
+            max_size=max_size,
+            overflow=overflow,
+            batch_size=batch_size,
+        )
+        cls._dispatcher = dispatcher
+        if current is not None:
+            current.close()
+        return dispatcher
+
+    @classmethod
+    def disable_queue(cls, timeout: float | None = 5.0) -> None:
+        dispatcher = cls._dispatcher
+        cls._dispatcher = None
+        if dispatcher is not None:
+            dispatcher.close(timeout)
+
+    @classmethod
+    def queue_enabled(cls) -> bool:
+        return cls._dispatcher is not None
+
+    @classmethod
+    def queue_depth(cls) -> int | None:
+        return cls._dispatcher.depth() if cls._dispatcher is not None else None
+
+    @classmethod
+    def queue_dropped(cls) -> int:
+        return cls._dispatcher.dropped() if cls._dispatcher is not None else 0
+
+    @classmethod
+    def flush(cls, timeout: float | None = 5.0) -> bool:
+        if cls._dispatcher is None:
+            return True
+        return cls._dispatcher.flush(timeout)
+
+    @classmethod
+    def shutdown(cls, timeout: float | None = 5.0) -> None:
+        cls.disable_queue(timeout)
+
+    @classmethod
+    def _dispatch_record(cls, record: MoltpyLogRecord) -> None:
+        level = record.level
+        # Rich text is built at most once, and only for a rich sink or the
+        # console that accepts this level.
+        rich_text = None
+        rich_ready = not cls._wants_rich
+        for entry in cls._sinks:
+            if level < cls._sink_level(entry):
+                continue
+            if entry.record:
+                entry.sink(record)
+                continue
+            if entry.rich and not rich_ready:
+                rich_ready = True
+                if cls._get_console() is not None:
+                    rich_text = record.rich_text()
+            entry.sink(level, record.line, rich_text if entry.rich else None)
+        if cls._emit_to_console and level >= cls._console_min_level:
+            if not rich_ready and cls._get_console() is not None:
+                rich_text = record.rich_text()
+            if rich_text is not None:
+                cls._console.print(rich_text)  # type: ignore[union-attr]
+            else:
+                print(record.line)
 
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
-        self._log(LogLevel.DEBUG, message, *args, **kwargs)
+        if LogLevel.DEBUG >= self.min_level:
+            self._log(LogLevel.DEBUG, message, *args, **kwargs)
 
     def info(self, message: str, *args: Any, **kwargs: Any) -> None:
-        self._log(LogLevel.INFO, message, *args, **kwargs)
+        if LogLevel.INFO >= self.min_level:
+            self._log(LogLevel.INFO, message, *args, **kwargs)
 
     def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
-        self._log(LogLevel.WARNING, message, *args, **kwargs)
+        if LogLevel.WARNING >= self.min_level:
+            self._log(LogLevel.WARNING, message, *args, **kwargs)
 
     def error(self, message: str, *args: Any, **kwargs: Any) -> None:
-        self._log(LogLevel.ERROR, message, *args, **kwargs)
+        if LogLevel.ERROR >= self.min_level:
+            self._log(LogLevel.ERROR, message, *args, **kwargs)
 
     @classmethod
     def _get_console(cls) -> "Console | None":
-        if cls._console is None and cls._use_rich and Console is not None:
-            cls._console = Console()
+        if cls._console is None and cls._use_rich and _load_rich():
+            cls._console = Console()  # type: ignore[misc]
         return cls._console
 
     def _log(self, level: int, message: str, *args: Any, **kwargs: Any) -> None:
-        if level < self.min_level:
+        cls = self.__class__
+        if level < self.min_level or level < cls._floor:
             return
-        if args or kwargs:
-            message = message.format(*args, **kwargs)
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        level_name = LogLevel.name(level)
-        console = self._get_console()
-        if console is not None and Text is not None:
-            level_style = {
-                LogLevel.DEBUG: "dim",
-                LogLevel.INFO: "cyan",
-                LogLevel.WARNING: "yellow",
-                LogLevel.ERROR: "bold red",
-            }.get(level, "white")
-            text = Text()
-            text.append(timestamp, style="dim")
-            text.append(" [")
-            text.append(level_name, style=level_style)
-            text.append("] ")
-            text.append(self.name, style="bold dark_green")
-            text.append(": ")
-            text.append(message)
-            for sink in self.__class__._sinks:
-                sink(level, f"{timestamp} [{level_name}] {self.name}: {message}", text)
-            if self.__class__._emit_to_console:
-                console.print(text)
+        record = MoltpyLogRecord(time.time(), self.name, level, message, args, kwargs)
+        dispatcher = cls._dispatcher
+        if dispatcher is not None:
+            dispatcher.enqueue(record)
             return
-        line = f"{timestamp} [{level_name}] {self.name}: {message}"
-        for sink in self.__class__._sinks:
-            sink(level, line, None)
-        if self.__class__._emit_to_console:
-            print(line)
+        cls._dispatch_record(record)
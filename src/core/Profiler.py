@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import builtins
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class ImportTiming:
+    name: str
+    inclusive: float
+    self_time: float
+
+
+@dataclass
+class MoltpyStartupProfiler:
+    """Measures import time per module and wall time per ``initialize`` phase.
+
+    Imports are timed by wrapping ``builtins.__import__`` while the profiler is
+    installed; only calls that actually load new modules are recorded. Self
+    time excludes nested imports, so the sum of self times is the total import
+    cost.
+    """
+
+    imports: list[ImportTiming] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+    _original_import: Any = None
+    _stack: list[list[float]] = field(default_factory=list)
+
+    def install(self) -> "MoltpyStartupProfiler":
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+        return self
+
+    def uninstall(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name: str, globals: Any = None, locals: Any = None, fromlist: Any = (), level: int = 0) -> Any:
+        original = self._original_import
+        if level == 0 and name in sys.modules and not fromlist:
+            return original(name, globals, locals, fromlist, level)
+        known = len(sys.modules)
+        frame = [0.0]
+        self._stack.append(frame)
+        started = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][0] += elapsed
+            if len(sys.modules) != known:
+                if level and globals:
+                    package = globals.get("__package__") or ""
+                    name = f"{package}.{name}" if name else package
+                self.imports.append(ImportTiming(name, elapsed, max(0.0, elapsed - frame[0])))
+
+    def report(self, phases: list[tuple[str, float]], top: int = 15) -> str:
+        total_imports = sum(timing.self_time for timing in self.imports)
+        total_phases = sum(seconds for _, seconds in phases)
+        lines = [
+            f"Startup: {(time.perf_counter() - self.started_at) * 1000:.1f} ms total "
+            f"(imports {total_imports * 1000:.1f} ms, initialize {total_phases * 1000:.1f} ms)",
+            "",
+            "initialize phases:",
+        ]
+        for name, seconds in phases:
+            lines.append(f"  {name:<18} {seconds * 1000:8.2f} ms")
+        lines.append("")
+        lines.append(f"slowest imports (top {top}, self / inclusive):")
+        for timing in sorted(self.imports, key=lambda t: t.self_time, reverse=True)[:top]:
+            lines.append(
+                f"  {timing.name:<40} {timing.self_time * 1000:8.2f} ms {timing.inclusive * 1000:8.2f} ms"
+            )
+        return "\n".join(lines)
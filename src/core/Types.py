@@ -3,8 +3,6 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel
-
 @dataclass
 class ConfigObject:
     data: dict[str, Any] = field(default_factory=dict)
@@ -35,9 +33,26 @@ class NoteType(str, Enum):
     VIDEO = "video"
     CODE = "code"
 
-class Note(BaseModel):
-    type: NoteType
-    title: str
-    content: str
-    created_at: datetime | None = None
-    updated_at: datetime | None = None
+def _build_note_model() -> type:
+    from pydantic import BaseModel
+
+    class Note(BaseModel):
+        id: int | None = None
+        type: NoteType
+        title: str
+        content: str
+        created_at: datetime | None = None
+        updated_at: datetime | None = None
+
+    Note.__module__ = __name__
+    Note.__qualname__ = "Note"
+    return Note
+
+
+def __getattr__(name: str) -> Any:
+    # pydantic is only imported once a model is actually used.
+    if name == "Note":
+        model = _build_note_model()
+        globals()["Note"] = model
+        return model
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-from .Logger import MoltpyLogger, LogLevel
+from .Logger import MoltpyLogger, MoltpyLogRecord, LogLevel, LogOverflow
 from .Types import ConfigObject, EnvObject, DataObject
 
-__all__ = ["MoltpyLogger", "LogLevel", "ConfigObject", "EnvObject", "DataObject"]
\ No newline at end of file
+__all__ = ["MoltpyLogger", "MoltpyLogRecord", "LogLevel", "LogOverflow", "ConfigObject", "EnvObject", "DataObject"]
\ No newline at end of file
@@ -1,14 +1,38 @@
 import json
 import os
+import threading
 import time
+import weakref
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
-
-from .. import ConfigObject, EnvObject, DataObject, MoltpyLogger, LogLevel
-from ..heartbeat import MoltpyHeartbeat
-from ..tools import MoltpyToolRegistry
+from typing import TYPE_CHECKING, Any, Callable
+
+from .. import ConfigObject, EnvObject, DataObject, MoltpyLogger, LogLevel, LogOverflow
+from ..heartbeat import HeartbeatFile, HeartbeatJob, MoltpyHeartbeat, discover_heartbeat_files
+from ..logs import MoltpyFileSink
+from ..tools import (
+    USER_TOOLS_PACKAGE,
+    MoltpyManifestCache,
+    MoltpyToolExecutor,
+    MoltpyToolRegistry,
+    MoltpyToolResultCache,
+    MoltpyToolWatcher,
+    ToolLoadReport,
+    ToolResult,
+    mount_handler_package,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from ..memory.Conversation import ConversationTurn, MoltpyConversation
+    from ..memory.Database import MoltpyDatabase
+    from ..memory.Notes import MoltpyNotes
+    from ..memory.Similarity import MoltpySimilarityIndex
+    from ..memory.Summarizer import MoltpyNoteSummarizer
+    from ..tools.Batch import MoltpyToolBatchRunner
+    from ..tools.ProcessPool import MoltpyToolProcessPool
 
 class MoltpyRuntime:
     _instance = None
@@ -27,11 +51,30 @@ class MoltpyRuntime:
     def __init__(self) -> None:
         self.ui = UIState()
         self._heartbeat = MoltpyHeartbeat(self)
-        self._file_sink = None
+        self._file_sink: MoltpyFileSink | None = None
         self._log_enabled = False
         self._log_path: Path | None = None
         self._log_level_name = "INFO"
         self.tools = MoltpyToolRegistry()
+        self.tool_executor: MoltpyToolExecutor | None = None
+        self.tool_result_cache: MoltpyToolResultCache | None = None
+        self.tool_process_pool: "MoltpyToolProcessPool | None" = None
+        self.tool_watcher: MoltpyToolWatcher | None = None
+        self._tool_paths: list[Path] = []
+        self._untrusted_tool_paths: list[Path] = []
+        self._tool_manifest_cache: MoltpyManifestCache | None = None
+        self._tool_reload_lock = threading.Lock()
+        self._ltm: "MoltpyDatabase | None" = None
+        self._notes: "MoltpyNotes | None" = None
+        self._note_summarizer: "MoltpyNoteSummarizer | None" = None
+        self._conversation: "MoltpyConversation | None" = None
+        self._similarity: "MoltpySimilarityIndex | None" = None
+        self._memory_lock = threading.RLock()
+        self._tool_batch_runners: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MoltpyToolBatchRunner]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.startup_phases: list[tuple[str, float]] = []
+        self._phase_started = 0.0
 
     class Loader:
 
@@ -119,7 +162,7 @@ class MoltpyRuntime:
         if self._initialized:
             return self
         self._initialized = True
-        base_path = Path.home() / ".moltpy"
+        self._phase_started = time.perf_counter()
         you_path = Path("moltpy.json")
 
         try:
@@ -133,29 +176,19 @@ class MoltpyRuntime:
                 error=exc,
             )
             raise
+        self._mark_phase("profile")
 
-        override = self.you.get("override")
-        if isinstance(override, dict):
-            override_path = override.get("moltpy_path")
-            if isinstance(override_path, str) and override_path.strip():
-                candidate = Path(override_path).expanduser()
-                if not candidate.is_absolute():
-                    candidate = (Path.cwd() / candidate).resolve()
-                base_path = candidate
-        elif isinstance(override, str) and override.strip():
-            candidate = Path(override).expanduser()
-            if not candidate.is_absolute():
-                candidate = (Path.cwd() / candidate).resolve()
-            base_path = candidate
-
-        self.base_path = base_path
+        self.base_path = self.resolve_base_path(self.you)
         self.base_path.mkdir(parents=True, exist_ok=True)
         tools_path = self.base_path / "tools"
         tools_path.mkdir(parents=True, exist_ok=True)
+        # Handlers of user tools that opt out of isolation are imported here.
+        mount_handler_package(USER_TOOLS_PACKAGE, tools_path)
 
         if self.firstRunCheck(self.base_path):
             self.firstRun(self.base_path)
             self.logger().info("MoltpyRuntime first run setup completed")
+        self._mark_phase("base_path")
 
         if config is None:
             config = self.loader().configObject(self.base_path / "config.json")
@@ -163,34 +196,440 @@ class MoltpyRuntime:
         if not isinstance(self.config.data.get("override"), dict):
             self.config.data["override"] = {}
         self.config.data["override"]["moltpy_path"] = str(self.base_path)
+        self._mark_phase("config")
         self.configure_logging()
         self.logger().info("MoltpyRuntime configuration loaded")
+        self._mark_phase("logging")
 
-        runtime_cfg = self.config.get("runtime", {}) or {}
-        self._heartbeat.set_interval(
-            float(runtime_cfg.get("heartbeat_interval", self._heartbeat.interval()))
-        )
+        self.configure_heartbeat()
+
+        self.register_heartbeat_files()
+        self.configure_memory_jobs()
+        self._mark_phase("heartbeat_config")
 
         self.data = self.loader().dataObjectFromFile(self.base_path / "data.json")
         self.logger().info("MoltpyRuntime data loaded from {path}", path=self.base_path / "data.json")
+        self._mark_phase("data")
 
         repo_tools_path = Path.cwd() / "src" / "tools"
-        self.tools.load_tools([repo_tools_path, tools_path])
+        self._tool_paths = [repo_tools_path, tools_path]
+        self._untrusted_tool_paths = [tools_path]
+        self._tool_manifest_cache = self.tool_manifest_cache()
+        self.tools = self.load_tool_registry()
         self.logger().info(
             "MoltpyRuntime tools loaded ({count} total) from {repo} and {user}",
             count=len(self.tools.all()),
             repo=repo_tools_path,
             user=tools_path,
         )
+        self.configure_tool_executor()
+        self.configure_tool_watcher()
+        self._mark_phase("tools")
 
         self._heartbeat.ensure_thread()
         if self._heartbeat.running():
             self._heartbeat.activate()
             self._heartbeat.ensure_uptime_started()
+        self._mark_phase("heartbeat_thread")
 
         self.logger().info("MoltpyRuntime initialized")
         return self
 
+    def _mark_phase(self, name: str) -> None:
+        now = time.perf_counter()
+        self.startup_phases.append((name, now - self._phase_started))
+        self._phase_started = now
+
+    @staticmethod
+    def resolve_base_path(you: DataObject) -> Path:
+        base_path = Path.home() / ".moltpy"
+        override = you.get("override")
+        if isinstance(override, dict):
+            override_path = override.get("moltpy_path")
+            if isinstance(override_path, str) and override_path.strip():
+                candidate = Path(override_path).expanduser()
+                if not candidate.is_absolute():
+                    candidate = (Path.cwd() / candidate).resolve()
+                base_path = candidate
+        elif isinstance(override, str) and override.strip():
+            candidate = Path(override).expanduser()
+            if not candidate.is_absolute():
+                candidate = (Path.cwd() / candidate).resolve()
+            base_path = candidate
+        return base_path
+
+    @staticmethod
+    def resolve_log_path(base_path: Path, logging_cfg: dict[str, Any]) -> Path:
+        log_path = Path(str(logging_cfg.get("log_file", "moltpy.log")))
+        if not log_path.is_absolute():
+            log_path = base_path / "logs" / log_path
+        return log_path
+
+    def locate_log_path(self) -> Path | None:
+        """Configured log file path, resolved without initializing the runtime."""
+        you = self.loader().dataObjectFromFile(Path("moltpy.json"))
+        base_path = self.resolve_base_path(you)
+        config = self.loader().configObject(base_path / "config.json")
+        logging_cfg = config.get("logging", {}) or {}
+        if not bool(logging_cfg.get("log_enabled", False)):
+            return None
+        return self.resolve_log_path(base_path, logging_cfg)
+
+    def tool_manifest_cache(self) -> MoltpyManifestCache | None:
+        """Manifest cache under ``<base>/cache``, or None when
+        ``runtime.tool_manifest_cache`` is false."""
+        runtime_cfg = self.config.get("runtime", {}) or {}
+        if not bool(runtime_cfg.get("tool_manifest_cache", True)):
+            return None
+        return MoltpyManifestCache(self.base_path / "cache" / "tools.manifest.json").load()
+
+    def load_tool_registry(self) -> MoltpyToolRegistry:
+        """A new registry loaded from the tool directories; problems found
+        while loading are logged."""
+        cache = self._tool_manifest_cache
+        registry = MoltpyToolRegistry().load_tools(self._tool_paths, cache=cache, untrusted=self._untrusted_tool_paths)
+        self.log_tool_report(registry.report)
+        if cache is not None:
+            self.logger().debug(
+                "MoltpyRuntime tool manifests: {hits} cached, {parsed} parsed",
+                hits=cache.hits,
+                parsed=cache.parsed,
+            )
+        return registry
+
+    def log_tool_report(self, report: ToolLoadReport) -> None:
+        for failure in report.errors:
+            self.logger().warning("MoltpyRuntime tool skipped {path}: {error}", path=failure.path, error=failure.error)
+        for conflict in report.conflicts:
+            self.logger().warning(
+                "MoltpyRuntime tool {name} from {shadowed} overridden by {kept}",
+                name=conflict.tool_name,
+                shadowed=conflict.shadowed,
+                kept=conflict.kept,
+            )
+        self.logger().debug("MoltpyRuntime tool load: {summary}", summary=report.summary_text())
+
+    def reload_tools(self) -> tuple[list[str], list[str], list[str]]:
+        """Reloads the tool directories and swaps the new registry in.
+
+        The registry is built off to the side and replaces ``self.tools`` in
+        a single assignment, so readers see either the old set of tools or
+        the new one. Handlers, concurrency slots and cached results of
+        changed or removed tools are dropped; the search index and compiled
+        validators come with the new registry. Returns the tool names
+        added, changed and removed.
+        """
+        with self._tool_reload_lock:
+            if self.tool_watcher is not None:
+                self.tool_watcher.reset()  # edits made while loading show up in the next poll
+            registry = self.load_tool_registry()
+            previous = self.tools
+            added, changed, removed = previous.diff(registry)
+            stale = [previous.tools[name] for name in changed + removed]
+            if self.tool_executor is not None:
+                if self.tool_process_pool is None:
+                    self.tool_process_pool = self.build_tool_process_pool(self.config.get("runtime", {}) or {}, registry)
+                    self.tool_executor.process_pool = self.tool_process_pool
+                self.tool_executor.swap_registry(registry, stale)
+            self.tools = registry
+        if added or changed or removed:
+            self.logger().info(
+                "MoltpyRuntime tools reloaded: added={added} changed={changed} removed={removed}",
+                added=", ".join(added) or "-",
+                changed=", ".join(changed) or "-",
+                removed=", ".join(removed) or "-",
+            )
+        return added, changed, removed
+
+    def configure_tool_watcher(self) -> None:
+        """Polls the tool directories every ``runtime.tool_reload_interval``
+        seconds on the heartbeat and reloads on change; 0 disables it."""
+        runtime_cfg = self.config.get("runtime", {}) or {}
+        interval = float(runtime_cfg.get("tool_reload_interval", 2.0))
+        self._heartbeat.unregister_job("tools:reload")
+        if interval <= 0:
+            self.tool_watcher = None
+            return
+        if self.tool_watcher is None:
+            self.tool_watcher = MoltpyToolWatcher(self._tool_paths)
+        self._heartbeat.register_job("tools:reload", self.poll_tools, interval, busy="skip")
+
+    def poll_tools(self) -> None:
+        watcher = self.tool_watcher
+        if watcher is None:
+            return
+        changed = watcher.poll()
+        if changed:
+            self.logger().debug("MoltpyRuntime tool files changed: {paths}", paths=", ".join(changed))
+            self.reload_tools()
+
+    def configure_tool_executor(self) -> None:
+        """(Re)creates the tool executor from ``runtime.tool_workers``,
+        ``runtime.tool_concurrency`` and ``runtime.tool_timeout_ms``."""
+        runtime_cfg = self.config.get("runtime", {}) or {}
+        if self.tool_executor is not None:
+            self.tool_executor.shutdown()
+        if self.tool_result_cache is None:
+            self.tool_result_cache = self.build_tool_result_cache(runtime_cfg.get("tool_result_cache", {}) or {})
+        if self.tool_process_pool is not None:
+            self.tool_process_pool.shutdown()
+        self.tool_process_pool = self.build_tool_process_pool(runtime_cfg, self.tools)
+        self.tool_executor = MoltpyToolExecutor(
+            self.tools,
+            max_workers=int(runtime_cfg.get("tool_workers", 8)),
+            per_tool_limit=int(runtime_cfg.get("tool_concurrency", 4)),
+            default_timeout_ms=int(runtime_cfg.get("tool_timeout_ms", 30_000)),
+            result_cache=self.tool_result_cache,
+            process_pool=self.tool_process_pool,
+        )
+        self._tool_batch_runners = weakref.WeakKeyDictionary()
+
+    def build_tool_process_pool(
+        self, runtime_cfg: dict[str, Any], registry: MoltpyToolRegistry
+    ) -> "MoltpyToolProcessPool | None":
+        """Warm workers for isolated tools (``runtime.tool_process_workers``);
+        not started when no tool in ``registry`` needs isolation."""
+        workers = int(runtime_cfg.get("tool_process_workers", 2))
+        isolated = [tool for tool in registry.all() if tool.isolated and tool.handler]
+        if workers <= 0 or not isolated:
+            if isolated:
+                self.logger().warning(
+                    "MoltpyRuntime {count} isolated tool(s) will run in-process (tool_process_workers=0)",
+                    count=len(isolated),
+                )
+            return None
+        from ..tools.ProcessPool import MoltpyToolProcessPool
+
+        preload = sorted({tool.handler.partition(":")[0] for tool in isolated})
+        pool = MoltpyToolProcessPool(
+            workers=workers,
+            preload=preload,
+            max_calls=int(runtime_cfg.get("tool_process_max_calls", 500)),
+            max_rss_bytes=int(float(runtime_cfg.get("tool_process_max_rss_mb", 512)) * 1024 * 1024),
+            packages={USER_TOOLS_PACKAGE: str(self.base_path / "tools")},
+        )
+        self.logger().info(
+            "MoltpyRuntime started {workers} tool worker process(es) for {count} isolated tool(s)",
+            workers=workers,
+            count=len(isolated),
+        )
+        return pool
+
+    def build_tool_result_cache(self, cache_cfg: dict[str, Any]) -> MoltpyToolResultCache | None:
+        """Result cache from ``runtime.tool_result_cache``; persisted to
+        ``<base>/cache/tool_results.json`` when ``persist`` is true."""
+        if not bool(cache_cfg.get("enabled", True)):
+            return None
+        path = self.base_path / "cache" / "tool_results.json" if bool(cache_cfg.get("persist", False)) else None
+        return MoltpyToolResultCache(
+            max_entries=int(cache_cfg.get("max_entries", 1024)),
+            max_bytes=int(cache_cfg.get("max_bytes", 16 * 1024 * 1024)),
+            path=path,
+        ).load()
+
+    def tool_cache_text(self) -> str:
+        if self.tool_result_cache is None:
+            return "disabled"
+        return self.tool_result_cache.stats_text()
+
+    def tool_executor_text(self) -> str:
+        if self.tool_executor is None:
+            return "not started"
+        text = self.tool_executor.stats_text()
+        if self.tool_process_pool is not None:
+            text += f" | processes: {self.tool_process_pool.stats_text()}"
+        return text
+
+    def tool_batch_runner(self) -> "MoltpyToolBatchRunner":
+        """Batch runner for the running event loop, limited by
+        ``runtime.tool_capability_limits`` (e.g. ``{"network": 4}``)."""
+        import asyncio
+
+        from ..tools.Batch import MoltpyToolBatchRunner
+
+        if self.tool_executor is None:
+            self.configure_tool_executor()
+        loop = asyncio.get_running_loop()
+        runner = self._tool_batch_runners.get(loop)
+        if runner is None:
+            runtime_cfg = self.config.get("runtime", {}) or {}
+            runner = MoltpyToolBatchRunner(
+                self.tool_executor,
+                capability_limits=runtime_cfg.get("tool_capability_limits") or {},
+                default_capability_limit=int(runtime_cfg.get("tool_capability_default", 4)),
+            )
+            self._tool_batch_runners[loop] = runner
+        return runner
+
+    async def run_tools(self, calls: list[dict[str, Any]]) -> list[ToolResult]:
+        """Runs independent ``tool_call`` dicts concurrently, results in order."""
+        return await self.tool_batch_runner().run_batch(calls)
+
+    def run_tool(self, name: str, arguments: dict[str, Any] | None = None) -> ToolResult:
+        if self.tool_executor is None:
+            self.configure_tool_executor()
+        result = self.tool_executor.execute(name, arguments)
+        if not result.ok:
+            self.logger().warning(
+                "MoltpyRuntime tool {name} {status}: {error}",
+                name=result.tool_name,
+                status=result.status,
+                error=result.error,
+            )
+        return result
+
+    def long_term_memory(self) -> "MoltpyDatabase":
+        """The long-term memory database (``memory.ltm_database``), opened
+        on first use and attached to ``MoltpyMemory``."""
+        with self._memory_lock:
+            if self._ltm is None:
+                from ..memory.Database import MoltpyDatabase
+                from ..memory.Memory import MoltpyMemory
+
+                memory_cfg = self.config.get("memory", {}) or {}
+                path = Path(str(memory_cfg.get("ltm_database", "memory/ltm.sqlite3")))
+                if not path.is_absolute():
+                    path = self.base_path / path
+                self._ltm = MoltpyDatabase(
+                    path,
+                    batch_size=int(memory_cfg.get("ltm_batch_size", 512)),
+                    search_window=int(memory_cfg.get("ltm_search_window", 5000)),
+                )
+                MoltpyMemory.get_instance().long_term_memory = self._ltm
+                self.logger().info("MoltpyRuntime long-term memory opened at {path}", path=path)
+            return self._ltm
+
+    def notes(self) -> "MoltpyNotes":
+        """Short-term notes, journaled to ``<base>/memory/stm.jsonl`` so they
+        survive a restart; the journal is replayed on first use."""
+        with self._memory_lock:
+            if self._notes is None:
+                from ..memory.Notes import MoltpyNotes
+
+                notes = MoltpyNotes.get_instance()
+                restored = notes.attach_journal(self.base_path / "memory" / "stm.jsonl")
+                if restored:
+                    self.logger().info("MoltpyRuntime restored {count} short-term note(s)", count=restored)
+                notes.attach_similarity(self.similarity_index(), self.near_duplicate_threshold())
+                self._notes = notes
+            return self._notes
+
+    def similarity_index(self) -> "MoltpySimilarityIndex":
+        """Similarity index over short-term notes (``stm:<id>``) and
+        long-term memory (``ltm:<id>``), persisted to
+        ``<base>/memory/similarity.json``."""
+        with self._memory_lock:
+            if self._similarity is None:
+                from ..memory.Similarity import MoltpySimilarityIndex
+
+                self._similarity = MoltpySimilarityIndex(self.base_path / "memory" / "similarity.json").load()
+                if len(self._similarity):
+                    self.logger().info(
+                        "MoltpyRuntime similarity index loaded: {stats}", stats=self._similarity.stats_text()
+                    )
+            return self._similarity
+
+    def near_duplicate_threshold(self) -> float:
+        memory_cfg = self.config.get("memory", {}) or {}
+        return float(memory_cfg.get("near_duplicate_threshold", 0.0))
+
+    def sync_similarity(self) -> int:
+        """Indexes long-term notes added since the last sync; returns how many."""
+        index = self.similarity_index()
+        database = self.long_term_memory()
+        last_id = int(index.meta.get("ltm_last_id", 0))
+        added = 0
+        while True:
+            rows = database.notes_after_nowait(last_id, limit=1000).result()
+            if not rows:
+                break
+            added += index.add_many((f"ltm:{row['id']}", f"{row['title']}\n{row['content']}") for row in rows)
+            last_id = rows[-1]["id"]
+            index.meta["ltm_last_id"] = last_id
+        if added:
+            self.logger().info("MoltpyRuntime indexed {count} long-term note(s) for similarity", count=added)
+        return added
+
+    def similar(self, text: str, k: int = 5) -> list[tuple[str, float]]:
+        """The ``k`` indexed notes most similar to ``text`` as
+        ``(key, cosine)`` pairs, best first."""
+        self.notes()
+        return self.similarity_index().similar(text, k)
+
+    def conversation(self) -> "MoltpyConversation":
+        """The conversation buffer of ``MoltpyMemory``, limited by
+        ``memory.conversation_max_tokens`` and ``memory.conversation_max_turns``.
+        Compacted turns are kept in long-term memory."""
+        with self._memory_lock:
+            if self._conversation is None:
+                from ..memory.Memory import MoltpyMemory
+
+                self._conversation = MoltpyMemory.get_instance().get_conversation()
+                self.configure_conversation()
+            return self._conversation
+
+    def configure_conversation(self) -> None:
+        if self._conversation is None:
+            return
+        memory_cfg = self.config.get("memory", {}) or {}
+        self._conversation.configure(
+            max_tokens=int(memory_cfg.get("conversation_max_tokens", 32_000)),
+            max_turns=int(memory_cfg.get("conversation_max_turns", 1_000)),
+            archive=self.archive_conversation,
+        )
+
+    def archive_conversation(self, turns: list["ConversationTurn"]) -> None:
+        """Queues compacted conversation turns as one long-term note; the
+        write happens on the database thread."""
+        content = "\n\n".join(f"{turn.role}: {turn.content}" for turn in turns)
+        self.long_term_memory().add_note_nowait(
+            "conversation",
+            f"Conversation #{turns[0].id}-{turns[-1].id}",
+            content,
+            created_at=turns[0].created_at,
+            source="conversation",
+        )
+
+    def note_summarizer(self) -> "MoltpyNoteSummarizer":
+        with self._memory_lock:
+            if self._note_summarizer is None:
+                from ..memory.Summarizer import MoltpyNoteSummarizer
+
+                memory_cfg = self.config.get("memory", {}) or {}
+                self._note_summarizer = MoltpyNoteSummarizer(
+                    self.notes(),
+                    self.long_term_memory(),
+                    self.base_path / "memory" / "summarize.checkpoint.json",
+                    chunk_size=int(memory_cfg.get("summarize_chunk", 50)),
+                )
+            return self._note_summarizer
+
+    def summarize_notes(self, final: bool = False) -> int:
+        """Moves pending short-term notes into long-term memory; see
+        ``MoltpyNoteSummarizer.run``. Returns the number of notes moved."""
+        moved = self.note_summarizer().run(final=final)
+        if moved:
+            self.logger().info(
+                "MoltpyRuntime summarized {count} short-term note(s) into long-term memory",
+                count=moved,
+            )
+        return moved
+
+    def configure_memory_jobs(self) -> None:
+        """Summarizes short-term notes every ``memory.summarize_interval``
+        seconds and indexes new long-term notes for similarity every
+        ``memory.similarity_sync_interval`` seconds on the heartbeat (0
+        disables either)."""
+        memory_cfg = self.config.get("memory", {}) or {}
+        interval = float(memory_cfg.get("summarize_interval", 300.0))
+        self._heartbeat.unregister_job("memory:summarize")
+        if interval > 0:
+            self._heartbeat.register_job("memory:summarize", self.summarize_notes, interval, busy="skip")
+        interval = float(memory_cfg.get("similarity_sync_interval", 60.0))
+        self._heartbeat.unregister_job("memory:similarity")
+        if interval > 0:
+            self._heartbeat.register_job("memory:similarity", self.sync_similarity, interval, busy="skip")
+
     def uptime_seconds(self) -> int:
         return self._heartbeat.uptime_seconds()
 
@@ -200,11 +639,41 @@ class MoltpyRuntime:
     def reload_config(self) -> None:
         self.config = self.loader().configObject(self.base_path / "config.json")
         self.configure_logging()
+        self.configure_heartbeat()
+        self.register_heartbeat_files()
+        self.configure_tool_watcher()
+        self.configure_memory_jobs()
+        self.configure_conversation()
+        if self._notes is not None:
+            self._notes.near_duplicate_threshold = self.near_duplicate_threshold()
+        self.logger().info("MoltpyRuntime configuration reloaded")
+
+    def configure_heartbeat(self) -> None:
+        """Applies ``runtime.heartbeat_interval``: a number of seconds, or a dict
+        ``{"base": 5.0, "max": 60.0, "adaptive": true, "backoff": 2.0}``."""
         runtime_cfg = self.config.get("runtime", {}) or {}
-        self._heartbeat.set_interval(
-            float(runtime_cfg.get("heartbeat_interval", self._heartbeat.interval()))
+        interval_cfg = runtime_cfg.get("heartbeat_interval", self._heartbeat.base_interval())
+        if isinstance(interval_cfg, dict):
+            base = float(interval_cfg.get("base", self._heartbeat.base_interval()))
+            self._heartbeat.set_interval(base)
+            self._heartbeat.set_adaptive(
+                bool(interval_cfg.get("adaptive", "max" in interval_cfg)),
+                max_interval=float(interval_cfg.get("max", base)),
+                backoff=float(interval_cfg.get("backoff", 2.0)),
+            )
+        else:
+            self._heartbeat.set_interval(float(interval_cfg))
+            self._heartbeat.set_adaptive(False)
+        self._heartbeat.set_overrun(str(runtime_cfg.get("heartbeat_overrun", "coalesce")))
+        self._heartbeat.configure_workers(
+            int(runtime_cfg.get("heartbeat_workers", 4)),
+            max_queue=int(runtime_cfg.get("heartbeat_queue_size", 64)),
+            process_workers=int(runtime_cfg.get("heartbeat_process_workers", 0)),
         )
-        self.logger().info("MoltpyRuntime configuration reloaded")
+        self._heartbeat.wake()
+
+    def submit_heartbeat_work(self, work: Callable[[], Any]) -> None:
+        self._heartbeat.submit(work)
 
     def start_heartbeat(self) -> None:
         self._heartbeat.start()
@@ -224,17 +693,97 @@ class MoltpyRuntime:
     def heartbeat(self):
         self._heartbeat.run_cycle()
 
+    def register_heartbeat_job(
+        self,
+        name: str,
+        callback: Callable[[], Any],
+        interval: float,
+        jitter: float = 0.0,
+        priority: int = 0,
+        busy: str = "skip",
+        cpu_bound: bool = False,
+    ) -> HeartbeatJob:
+        return self._heartbeat.register_job(
+            name,
+            callback,
+            interval,
+            jitter=jitter,
+            priority=priority,
+            busy=busy,
+            cpu_bound=cpu_bound,
+        )
+
+    def unregister_heartbeat_job(self, name: str) -> bool:
+        return self._heartbeat.unregister_job(name)
+
+    def heartbeat_jobs(self) -> list[HeartbeatJob]:
+        return self._heartbeat.jobs()
+
+    def register_heartbeat_files(self) -> None:
+        runtime_cfg = self.config.get("runtime", {}) or {}
+        default_interval = float(runtime_cfg.get("heartbeat_file_interval", 3600.0))
+        for job in self._heartbeat.jobs():
+            if job.name.startswith("heartbeat:"):
+                self._heartbeat.unregister_job(job.name)
+        for spec in discover_heartbeat_files(self.base_path / "heartbeats", default_interval):
+            self._heartbeat.register_job(
+                spec.job_name,
+                lambda spec=spec: self._heartbeat_file_due(spec),
+                spec.interval,
+                jitter=spec.jitter,
+                priority=spec.priority,
+            )
+            self.logger().info(
+                "Registered heartbeat file {path} every {interval:.0f}s",
+                path=spec.path,
+                interval=spec.interval,
+            )
+
+    def _heartbeat_file_due(self, spec: HeartbeatFile) -> None:
+        self.logger().info(
+            "Heartbeat instructions due for {domain} ({path})",
+            domain=spec.domain,
+            path=spec.path,
+        )
+
     def status_line(self) -> str:
         state = "paused" if self._heartbeat.state() == "paused" else "running"
         return (
             f"heartbeat={state if self._heartbeat.running() else 'stopped'}; "
             f"thread={'alive' if self.heartbeat_thread_alive() else 'dead'}; "
             f"interval={self._heartbeat.interval():.2f}s"
+            + (f" (adaptive, base={self._heartbeat.base_interval():.2f}s)" if self._heartbeat.adaptive() else "")
         )
     
     def shutdown(self):
         self.logger().info("MoltpyRuntime shutting down")
         self._heartbeat.shutdown()
+        if self.tool_executor is not None:
+            self.tool_executor.shutdown()
+            self.tool_executor = None
+        if self.tool_process_pool is not None:
+            self.tool_process_pool.shutdown()
+            self.tool_process_pool = None
+        if self._notes is not None:
+            self._notes.close_journal()
+        if self._similarity is not None and self._similarity.dirty:
+            try:
+                self._similarity.save()
+            except OSError as exc:
+                self.logger().warning("MoltpyRuntime similarity index not saved: {error}", error=exc)
+        if self._ltm is not None:
+            self._ltm.close()
+            self._ltm = None
+        if self.tool_result_cache is not None:
+            try:
+                self.tool_result_cache.save()
+            except OSError as exc:
+                self.logger().warning("MoltpyRuntime tool result cache not saved: {error}", error=exc)
+        MoltpyLogger.shutdown()
+        if self._file_sink is not None:
+            MoltpyLogger.remove_sink(self._file_sink.emit)
+            self._file_sink.close()
+            self._file_sink = None
         MoltpyRuntime._instance = None
 
     def heartbeat_running(self) -> bool:
@@ -252,6 +801,12 @@ class MoltpyRuntime:
     def last_heartbeat_at(self) -> datetime | None:
         return self._heartbeat.last_heartbeat_at()
 
+    def heartbeat_timing_text(self) -> str:
+        return self._heartbeat.timing_text()
+
+    def heartbeat_pool_text(self) -> str:
+        return self._heartbeat.pool_text()
+
     def config_path(self) -> Path:
         return self.base_path / "config.json"
 
@@ -267,6 +822,12 @@ class MoltpyRuntime:
     def log_level_name(self) -> str:
         return self._log_level_name
 
+    def log_queue_depth(self) -> int | None:
+        return MoltpyLogger.queue_depth()
+
+    def log_queue_dropped(self) -> int:
+        return MoltpyLogger.queue_dropped()
+
     def configure_logging(self) -> None:
         logging_cfg = self.config.get("logging", {}) or {}
         enabled = bool(logging_cfg.get("log_enabled", False))
@@ -277,59 +838,54 @@ class MoltpyRuntime:
             "WARNING": LogLevel.WARNING,
             "ERROR": LogLevel.ERROR,
         }
-        MoltpyLogger.configure(min_level=level_map.get(level_name, LogLevel.INFO))
+        file_level = level_map.get(level_name, LogLevel.INFO)
+        console_level_name = str(logging_cfg.get("log_console_level", level_name)).upper()
+        console_level = level_map.get(console_level_name, file_level)
+        MoltpyLogger.configure(
+            min_level=min(file_level, console_level) if enabled else console_level,
+            console_level=console_level,
+        )
+        if bool(logging_cfg.get("log_async", False)):
+            MoltpyLogger.enable_queue(
+                max_size=int(logging_cfg.get("log_queue_size", 10000) or 10000),
+                overflow=str(logging_cfg.get("log_queue_overflow", LogOverflow.BLOCK)),
+                batch_size=int(logging_cfg.get("log_queue_batch", 256) or 256),
+            )
+        else:
+            MoltpyLogger.disable_queue()
         self._log_enabled = enabled
         self._log_level_name = level_name
         if self._file_sink is not None:
-            MoltpyLogger.remove_sink(self._file_sink)
+            MoltpyLogger.flush()
+            MoltpyLogger.remove_sink(self._file_sink.emit)
+            self._file_sink.close()
             self._file_sink = None
         self._log_path = None
         if not enabled:
             return
-        log_dir = self.base_path / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = str(logging_cfg.get("log_file", "moltpy.log"))
-        log_path = Path(log_file)
-        if not log_path.is_absolute():
-            log_path = log_dir / log_path
+        log_path = self.resolve_log_path(self.base_path, logging_cfg)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
         self._log_path = log_path
         log_format = str(logging_cfg.get("log_format", "[{asctime}] [{levelname}] {message}"))
         date_format = str(logging_cfg.get("log_date_format", "%Y-%m-%d %H:%M:%S"))
-        log_split = str(logging_cfg.get("log_split", "size")).lower()
         max_bytes = int(logging_cfg.get("log_max_bytes", 0) or 0)
         backup_count = int(logging_cfg.get("log_backup_count", 0) or 0)
-        rotation_enabled = log_split == "size" and max_bytes > 0 and backup_count > 0
-
-        def rotate_logs() -> None:
-            if not log_path.exists():
-                return
-            for index in range(backup_count - 1, 0, -1):
-                src = log_path.with_suffix(log_path.suffix + f".{index}")
-                dst = log_path.with_suffix(log_path.suffix + f".{index + 1}")
-                if src.exists():
-                    if dst.exists():
-                        dst.unlink()
-                    src.rename(dst)
-            first = log_path.with_suffix(log_path.suffix + ".1")
-            if first.exists():
-                first.unlink()
-            log_path.rename(first)
-        def file_sink(level: int, line: str, _rich: Any) -> None:
-            asctime = datetime.now().strftime(date_format)
-            levelname = LogLevel.name(level)
-            rendered = log_format.format(asctime=asctime, levelname=levelname, message=line)
-            if rotation_enabled and log_path.exists():
-                try:
-                    current_size = log_path.stat().st_size
-                except OSError:
-                    current_size = 0
-                if current_size + len(rendered.encode("utf-8")) + 1 > max_bytes:
-                    rotate_logs()
-            with log_path.open("a", encoding="utf-8") as f:
-                f.write(rendered + "\n")
-
+        file_sink = MoltpyFileSink(
+            log_path,
+            log_format=log_format,
+            date_format=date_format,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            flush_interval=float(logging_cfg.get("log_flush_interval", 1.0)),
+            flush_bytes=int(logging_cfg.get("log_flush_bytes", 64 * 1024)),
+            split=str(logging_cfg.get("log_split", "size")),
+            compression=str(logging_cfg.get("log_compress", "none")),
+            retention_bytes=int(logging_cfg.get("log_retention_bytes", 0) or 0),
+            mode=str(logging_cfg.get("log_mode", "text")),
+            index_bucket=int(logging_cfg.get("log_index_bucket", 60) or 0),
+        )
         self._file_sink = file_sink
-        MoltpyLogger.add_sink(file_sink)
+        MoltpyLogger.add_sink(file_sink.emit, min_level=file_level, record=True)
 
 
 @dataclass
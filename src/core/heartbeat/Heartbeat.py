@@ -1,10 +1,32 @@
 from __future__ import annotations
 
 import threading
+import time
+from collections import deque
 from datetime import datetime
+from typing import Any, Callable
+
+from .Scheduler import BusyPolicy, HeartbeatJob, MoltpyScheduler
+from .WorkerPool import MoltpyWorkerPool
 
 
 class MoltpyHeartbeat:
+    """Drives scheduled jobs on the ``moltpy-heartbeat`` thread.
+
+    The thread blocks on a single wake event: it only wakes for the next job
+    deadline or when something changes (start, resume, submitted work,
+    interval changes, stop). While paused it sleeps without a timeout.
+
+    In adaptive mode the main cycle interval grows by ``backoff`` after every
+    cycle that found no work, up to ``max_interval``, and snaps back to the
+    base interval as soon as work is submitted.
+
+    Once ``configure_workers`` installs a worker pool, due jobs are handed to
+    it and the heartbeat thread itself only keeps time.
+    """
+
+    MAIN_JOB = "heartbeat"
+
     def __init__(self, runtime, interval: float = 0.1) -> None:
         self._runtime = runtime
         self._running = True
@@ -13,9 +35,19 @@ class MoltpyHeartbeat:
         self._stop = threading.Event()
         self._active = threading.Event()
         self._interval = interval
-        self._uptime_started_at: datetime | None = None
+        self._base_interval = interval
+        self._adaptive = False
+        self._max_interval = interval
+        self._backoff = 2.0
+        self._work: deque[Callable[[], Any]] = deque()
+        self._uptime_started_at: float | None = None
         self._uptime_accumulated = 0.0
         self._last_heartbeat_at: datetime | None = None
+        self._wake = threading.Event()
+        self._pool: MoltpyWorkerPool | None = None
+        self._scheduler = MoltpyScheduler(on_error=self._job_failed)
+        self._scheduler.add_listener(self._wake.set)
+        self._scheduler.register(self.MAIN_JOB, self._main_cycle, interval, priority=100, start_delay=0.0)
 
     def ensure_thread(self) -> None:
         if self._thread is not None and self._thread.is_alive():
@@ -31,31 +63,140 @@ class MoltpyHeartbeat:
 
     def activate(self) -> None:
         self._active.set()
+        self._wake.set()
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def submit(self, work: Callable[[], Any]) -> None:
+        """Queue ``work`` for the next cycle and cut any adaptive backoff short."""
+        self._work.append(work)
+        if self._adaptive and self._interval != self._base_interval:
+            self._interval = self._base_interval
+            self._scheduler.set_interval(self.MAIN_JOB, self._interval)
+        self._wake.set()
+
+    def pending_work(self) -> int:
+        return len(self._work)
 
-    def run_cycle(self) -> None:
+    def run_cycle(self) -> bool:
         if not self._running:
-            return
+            return False
         self._last_heartbeat_at = datetime.now()
         self._runtime.logger().info("MoltpyRuntime heartbeat cycle executed")
+        did_work = False
+        while self._work:
+            work = self._work.popleft()
+            did_work = True
+            try:
+                work()
+            except Exception as exc:
+                self._runtime.logger().error("Heartbeat work item failed: {error}", error=exc)
+        return did_work
+
+    def _main_cycle(self) -> None:
+        did_work = self.run_cycle()
+        if not self._adaptive:
+            return
+        if did_work or self._work:
+            interval = self._base_interval
+        else:
+            interval = min(self._max_interval, self._interval * self._backoff)
+        if interval != self._interval:
+            self._interval = interval
+            job = self._scheduler.get(self.MAIN_JOB)
+            if job is not None:
+                # Picked up when the scheduler reschedules this running job.
+                job.interval = interval
 
     def _heartbeat_loop(self) -> None:
         while not self._stop.is_set():
+            self._wake.clear()
             if not self._active.is_set():
-                self._active.wait(timeout=0.2)
+                self._wake.wait()
+                continue
+            deadline = self._scheduler.next_deadline()
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                self._scheduler.run_due()
                 continue
-            self.run_cycle()
-            if self._stop.wait(self._interval):
-                break
+            self._wake.wait(timeout)
+
+    def _job_failed(self, job: HeartbeatJob, exc: Exception) -> None:
+        self._runtime.logger().error(
+            "Heartbeat job {name} failed: {error}",
+            name=job.name,
+            error=exc,
+        )
+
+    def scheduler(self) -> MoltpyScheduler:
+        return self._scheduler
+
+    def configure_workers(self, max_workers: int, max_queue: int = 64, process_workers: int = 0) -> None:
+        pool = self._pool
+        if (
+            pool is not None
+            and pool.max_workers == max_workers
+            and pool.max_queue == max_queue
+            and pool.process_workers == process_workers
+        ):
+            return
+        if max_workers <= 0:
+            self._pool = None
+            self._scheduler.set_dispatch(None)
+        else:
+            self._pool = MoltpyWorkerPool(max_workers, max_queue=max_queue, process_workers=process_workers)
+            self._scheduler.set_dispatch(self._dispatch_job)
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _dispatch_job(self, job: HeartbeatJob, task: Callable[[], Any], on_done: Callable[[BaseException | None], None]) -> bool:
+        pool = self._pool
+        if pool is None:
+            return False
+        return pool.submit(task, on_done=on_done, cpu_bound=job.cpu_bound)
+
+    def worker_pool(self) -> MoltpyWorkerPool | None:
+        return self._pool
+
+    def register_job(
+        self,
+        name: str,
+        callback: Callable[[], Any],
+        interval: float,
+        jitter: float = 0.0,
+        priority: int = 0,
+        start_delay: float | None = None,
+        busy: str = BusyPolicy.SKIP,
+        cpu_bound: bool = False,
+    ) -> HeartbeatJob:
+        return self._scheduler.register(
+            name,
+            callback,
+            interval,
+            jitter=jitter,
+            priority=priority,
+            start_delay=start_delay,
+            busy=busy,
+            cpu_bound=cpu_bound,
+        )
+
+    def unregister_job(self, name: str) -> bool:
+        return self._scheduler.unregister(name)
+
+    def jobs(self) -> list[HeartbeatJob]:
+        return self._scheduler.jobs()
 
     def ensure_uptime_started(self) -> None:
         if self._uptime_started_at is None:
-            self._uptime_started_at = datetime.now()
+            self._uptime_started_at = time.monotonic()
 
     def start(self) -> None:
         if not self._running:
             self._running = True
             self._paused = False
-            self._active.set()
+            self._scheduler.rebase()
+            self.activate()
             self.ensure_thread()
             self.ensure_uptime_started()
             self._runtime.ui.set_status("running", "ok")
@@ -63,10 +204,11 @@ class MoltpyHeartbeat:
             return
         if self._paused:
             self._paused = False
+            self._scheduler.rebase()
             self.ensure_uptime_started()
             self._runtime.ui.set_status("running", "ok")
             self._runtime.logger().info("MoltpyRuntime heartbeat resumed")
-        self._active.set()
+        self.activate()
         self.ensure_thread()
 
     def resume(self) -> None:
@@ -77,11 +219,10 @@ class MoltpyHeartbeat:
             return
         self._paused = True
         if self._uptime_started_at is not None:
-            self._uptime_accumulated += (
-                datetime.now() - self._uptime_started_at
-            ).total_seconds()
+            self._uptime_accumulated += time.monotonic() - self._uptime_started_at
             self._uptime_started_at = None
         self._active.clear()
+        self._wake.set()
         self._runtime.ui.set_status("paused", "idle")
         self._runtime.logger().info("MoltpyRuntime heartbeat paused")
 
@@ -94,6 +235,7 @@ class MoltpyHeartbeat:
             self._active.clear()
             self._stop.set()
             self._active.set()
+            self._wake.set()
             if self._thread is not None and self._thread.is_alive():
                 self._thread.join(timeout=1.0)
             self._thread = None
@@ -110,14 +252,19 @@ class MoltpyHeartbeat:
     def shutdown(self) -> None:
         self._stop.set()
         self._active.set()
+        self._wake.set()
         if self._thread is not None and self._thread.is_alive():
             self._thread.join(timeout=1.0)
         self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._scheduler.set_dispatch(None)
 
     def uptime_seconds(self) -> int:
         total = self._uptime_accumulated
         if self._uptime_started_at is not None:
-            total += (datetime.now() - self._uptime_started_at).total_seconds()
+            total += time.monotonic() - self._uptime_started_at
         return int(total)
 
     def uptime_text(self) -> str:
@@ -143,8 +290,45 @@ class MoltpyHeartbeat:
     def interval(self) -> float:
         return self._interval
 
+    def base_interval(self) -> float:
+        return self._base_interval
+
+    def adaptive(self) -> bool:
+        return self._adaptive
+
     def set_interval(self, interval: float) -> None:
         self._interval = interval
+        self._base_interval = interval
+        self._scheduler.set_interval(self.MAIN_JOB, interval)
+
+    def set_adaptive(self, enabled: bool, max_interval: float | None = None, backoff: float = 2.0) -> None:
+        self._adaptive = enabled
+        self._max_interval = max(self._base_interval, max_interval or self._base_interval)
+        self._backoff = max(1.0, backoff)
+        if not enabled and self._interval != self._base_interval:
+            self._interval = self._base_interval
+            self._scheduler.set_interval(self.MAIN_JOB, self._interval)
 
     def last_heartbeat_at(self) -> datetime | None:
         return self._last_heartbeat_at
+
+    def set_overrun(self, overrun: str) -> None:
+        self._scheduler.set_overrun(self.MAIN_JOB, overrun)
+
+    def main_job(self) -> HeartbeatJob | None:
+        return self._scheduler.get(self.MAIN_JOB)
+
+    def timing_text(self) -> str:
+        job = self.main_job()
+        if job is None:
+            return "n/a"
+        return (
+            f"latency {job.latency.summary_text()} | lag {job.lag.summary_text()} | "
+            f"missed={job.missed} skipped={job.skipped} overrun={job.overrun}"
+        )
+
+    def pool_text(self) -> str:
+        if self._pool is None:
+            return "inline"
+        busy_skipped = sum(job.busy_skipped for job in self._scheduler.jobs())
+        return f"{self._pool.stats_text()} busy_skipped={busy_skipped}"
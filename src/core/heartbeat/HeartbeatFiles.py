@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class HeartbeatFile:
+    """A per-domain ``heartbeat.md`` and the cadence declared in its front matter."""
+
+    domain: str
+    path: Path
+    interval: float
+    jitter: float = 0.0
+    priority: int = 0
+
+    @property
+    def job_name(self) -> str:
+        return f"heartbeat:{self.domain}"
+
+
+def _front_matter(text: str) -> dict[str, str]:
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}
+    values: dict[str, str] = {}
+    for line in lines[1:]:
+        if line.strip() == "---":
+            return values
+        key, sep, value = line.partition(":")
+        if sep:
+            values[key.strip().lower()] = value.strip().strip("\"'")
+    return {}
+
+
+def discover_heartbeat_files(root: Path, default_interval: float = 3600.0) -> list[HeartbeatFile]:
+    """Finds ``<root>/<domain>/heartbeat.md`` files.
+
+    An optional front matter block sets ``interval``, ``jitter`` (seconds) and
+    ``priority``::
+
+        ---
+        interval: 1800
+        jitter: 60
+        ---
+    """
+    if not root.is_dir():
+        return []
+    found: list[HeartbeatFile] = []
+    for path in sorted(root.glob("*/heartbeat.md")):
+        try:
+            meta = _front_matter(path.read_text(encoding="utf-8"))
+        except OSError:
+            continue
+        try:
+            interval = float(meta.get("interval", default_interval))
+            jitter = float(meta.get("jitter", 0.0))
+            priority = int(meta.get("priority", 0))
+        except ValueError:
+            interval, jitter, priority = default_interval, 0.0, 0
+        if interval <= 0:
+            continue
+        found.append(
+            HeartbeatFile(
+                domain=path.parent.name,
+                path=path,
+                interval=interval,
+                jitter=jitter,
+                priority=priority,
+            )
+        )
+    return found
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import math
+
+
+class LatencyHistogram:
+    """Fixed-memory histogram of durations in seconds.
+
+    Buckets grow geometrically (``per_octave`` buckets per doubling) from
+    ``min_value`` up to ``max_value``; percentiles are reported as the upper
+    bound of the bucket they fall into, so the relative error is bounded by
+    the bucket width (about 19% with the default 4 buckets per octave).
+    """
+
+    def __init__(self, min_value: float = 1e-6, max_value: float = 600.0, per_octave: int = 4) -> None:
+        self.min_value = min_value
+        self.per_octave = per_octave
+        self._scale = per_octave / math.log(2.0)
+        size = int(math.ceil(math.log(max_value / min_value) * self._scale)) + 2
+        self._counts = [0] * size
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        if value < 0:
+            value = 0.0
+        if value <= self.min_value:
+            index = 0
+        else:
+            index = min(len(self._counts) - 1, int(math.log(value / self.min_value) * self._scale) + 1)
+        self._counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def _upper_bound(self, index: int) -> float:
+        return self.min_value * math.exp(index / self._scale)
+
+    def percentile(self, fraction: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(math.ceil(fraction * self.count)))
+        seen = 0
+        for index, bucket in enumerate(self._counts):
+            seen += bucket
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def reset(self) -> None:
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": float(self.count),
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+        }
+
+    def summary_text(self) -> str:
+        if self.count == 0:
+            return "n/a"
+        return (
+            f"p50={self.percentile(0.50) * 1000:.2f}ms "
+            f"p95={self.percentile(0.95) * 1000:.2f}ms "
+            f"p99={self.percentile(0.99) * 1000:.2f}ms "
+            f"max={self.max * 1000:.2f}ms"
+        )
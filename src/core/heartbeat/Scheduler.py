@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .Metrics import LatencyHistogram
+
+
+class OverrunPolicy:
+    COALESCE = "coalesce"
+    SKIP = "skip"
+
+    @classmethod
+    def normalize(cls, value: str | None) -> str:
+        policy = str(value or cls.COALESCE).strip().lower()
+        return cls.SKIP if policy == cls.SKIP else cls.COALESCE
+
+
+class BusyPolicy:
+    """What to do when a job is due while its previous run is still going."""
+
+    SKIP = "skip"
+    QUEUE = "queue"
+    CONCURRENT = "concurrent"
+
+    @classmethod
+    def normalize(cls, value: str | None) -> str:
+        policy = str(value or cls.SKIP).strip().lower()
+        return policy if policy in {cls.SKIP, cls.QUEUE, cls.CONCURRENT} else cls.SKIP
+
+
+# dispatch(job, task, on_done) -> accepted
+JobDispatch = Callable[["HeartbeatJob", Callable[[], Any], Callable[[BaseException | None], None]], bool]
+
+
+@dataclass
+class HeartbeatJob:
+    """A periodic job on a fixed deadline grid.
+
+    ``anchor`` is the grid deadline; ``next_due`` adds this round's jitter to
+    it. Deadlines advance by ``interval`` from the previous deadline, not from
+    when the callback finished, so the period does not drift. When a run is
+    late by a whole interval or more, the missed beats are either folded into
+    one run (``coalesce``) or dropped until the next grid slot (``skip``).
+
+    With a dispatcher installed, ``busy`` decides what happens when the job
+    comes due while a previous run is still executing on a worker.
+    """
+
+    name: str
+    callback: Callable[[], Any]
+    interval: float
+    jitter: float = 0.0
+    priority: int = 0
+    overrun: str = OverrunPolicy.COALESCE
+    busy: str = BusyPolicy.SKIP
+    cpu_bound: bool = False
+    anchor: float = 0.0
+    next_due: float = 0.0
+    runs: int = 0
+    missed: int = 0
+    skipped: int = 0
+    busy_skipped: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    queued_run: bool = False
+    last_run_at: float | None = None
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram, repr=False)
+    lag: LatencyHistogram = field(default_factory=LatencyHistogram, repr=False)
+    _generation: int = field(default=0, repr=False)
+
+    def jitter_offset(self) -> float:
+        if self.jitter <= 0:
+            return 0.0
+        return random.uniform(-self.jitter, self.jitter)
+
+
+class MoltpyScheduler:
+    """Timer heap of periodic heartbeat jobs.
+
+    Only the earliest deadline matters to the heartbeat thread, so idle jobs
+    cost nothing beyond their heap entry. Jobs due at the same time run in
+    descending ``priority``. Replaced or removed jobs leave stale heap entries
+    that are discarded lazily.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        on_error: Callable[[HeartbeatJob, Exception], None] | None = None,
+    ) -> None:
+        self._clock = clock
+        self._on_error = on_error
+        self._dispatch: JobDispatch | None = None
+        self._heap: list[tuple[float, int, int, int, HeartbeatJob]] = []
+        self._jobs: dict[str, HeartbeatJob] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[], None]] = []
+
+    def set_dispatch(self, dispatch: JobDispatch | None) -> None:
+        """Run due jobs through ``dispatch`` instead of inline on the calling thread."""
+        self._dispatch = dispatch
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Called whenever the earliest deadline may have moved earlier."""
+        self._listeners.append(listener)
+
+    def register(
+        self,
+        name: str,
+        callback: Callable[[], Any],
+        interval: float,
+        jitter: float = 0.0,
+        priority: int = 0,
+        start_delay: float | None = None,
+        overrun: str = OverrunPolicy.COALESCE,
+        busy: str = BusyPolicy.SKIP,
+        cpu_bound: bool = False,
+    ) -> HeartbeatJob:
+        if interval <= 0:
+            raise ValueError("Heartbeat job interval must be positive.")
+        job = HeartbeatJob(
+            name=name,
+            callback=callback,
+            interval=float(interval),
+            jitter=max(0.0, float(jitter)),
+            priority=int(priority),
+            overrun=OverrunPolicy.normalize(overrun),
+            busy=BusyPolicy.normalize(busy),
+            cpu_bound=cpu_bound,
+        )
+        delay = job.interval if start_delay is None else max(0.0, float(start_delay))
+        with self._lock:
+            previous = self._jobs.get(name)
+            if previous is not None:
+                job._generation = previous._generation + 1
+                previous._generation = job._generation
+            self._jobs[name] = job
+            job.anchor = self._clock() + delay
+            self._push(job, job.anchor + (job.jitter_offset() if start_delay is None else 0.0))
+        self._notify()
+        return job
+
+    def unregister(self, name: str) -> bool:
+        with self._lock:
+            job = self._jobs.pop(name, None)
+            if job is None:
+                return False
+            job._generation += 1
+        return True
+
+    def set_interval(self, name: str, interval: float) -> None:
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None or interval <= 0:
+                return
+            job.interval = float(interval)
+            due = (job.last_run_at if job.last_run_at is not None else self._clock()) + job.interval
+            if due < job.anchor:
+                job._generation += 1
+                job.anchor = due
+                self._push(job, due)
+        self._notify()
+
+    def set_overrun(self, name: str, overrun: str) -> None:
+        job = self._jobs.get(name)
+        if job is not None:
+            job.overrun = OverrunPolicy.normalize(overrun)
+
+    def rebase(self, now: float | None = None) -> None:
+        """Restart overdue jobs from ``now``, e.g. after a pause, without counting missed beats."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            for job in self._jobs.values():
+                if job.next_due < now:
+                    job._generation += 1
+                    job.anchor = now
+                    self._push(job, now)
+        self._notify()
+
+    def get(self, name: str) -> HeartbeatJob | None:
+        return self._jobs.get(name)
+
+    def jobs(self) -> list[HeartbeatJob]:
+        return list(self._jobs.values())
+
+    def next_deadline(self) -> float | None:
+        with self._lock:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float | None = None) -> list[HeartbeatJob]:
+        now = self._clock() if now is None else now
+        due: list[HeartbeatJob] = []
+        with self._lock:
+            while True:
+                self._discard_stale()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                due.append(heapq.heappop(self._heap)[4])
+        return due
+
+    def reschedule(self, job: HeartbeatJob, now: float | None = None) -> None:
+        """Advance ``job`` to the first grid deadline after ``now``."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            if self._jobs.get(job.name) is not job:
+                return
+            anchor = job.anchor + job.interval
+            if anchor <= now:
+                anchor += math.ceil((now - anchor) / job.interval) * job.interval
+                if anchor <= now:
+                    anchor += job.interval
+            job.anchor = anchor
+            self._push(job, anchor + job.jitter_offset())
+
+    def run_due(self, now: float | None = None) -> int:
+        now = self._clock() if now is None else now
+        jobs = self.pop_due(now)
+        ran = 0
+        for job in jobs:
+            lag = max(0.0, now - job.next_due)
+            missed = int(lag // job.interval)
+            job.missed += missed
+            if missed and job.overrun == OverrunPolicy.SKIP:
+                job.skipped += 1
+                self.reschedule(job, now)
+                continue
+            if self._dispatch is not None:
+                job.lag.record(lag)
+                self.reschedule(job, now)
+                if self._start(job):
+                    ran += 1
+                continue
+            started = self._clock()
+            job.last_run_at = started
+            job.runs += 1
+            ran += 1
+            job.lag.record(max(0.0, started - job.next_due))
+            try:
+                job.callback()
+            except Exception as exc:
+                if self._on_error is None:
+                    raise
+                self._on_error(job, exc)
+            finally:
+                finished = self._clock()
+                job.latency.record(finished - started)
+                self.reschedule(job, finished)
+        return ran
+
+    def _start(self, job: HeartbeatJob) -> bool:
+        dispatch = self._dispatch
+        if dispatch is None:
+            return False
+        with self._lock:
+            if job.in_flight and job.busy != BusyPolicy.CONCURRENT:
+                if job.busy == BusyPolicy.QUEUE and not job.queued_run:
+                    job.queued_run = True
+                else:
+                    job.busy_skipped += 1
+                return False
+            job.in_flight += 1
+        started = self._clock()
+
+        def task() -> Any:
+            began = self._clock()
+            try:
+                return job.callback()
+            finally:
+                job.latency.record(self._clock() - began)
+
+        def on_done(error: BaseException | None) -> None:
+            if job.cpu_bound:
+                # Process-pool runs are timed from submission.
+                job.latency.record(self._clock() - started)
+            if isinstance(error, Exception) and self._on_error is not None:
+                self._on_error(job, error)
+            with self._lock:
+                job.in_flight -= 1
+                rerun = job.queued_run and job.in_flight == 0
+                if rerun:
+                    job.queued_run = False
+            if rerun:
+                self._start(job)
+
+        if dispatch(job, job.callback if job.cpu_bound else task, on_done):
+            job.last_run_at = started
+            job.runs += 1
+            return True
+        with self._lock:
+            job.in_flight -= 1
+            job.rejected += 1
+        return False
+
+    def _push(self, job: HeartbeatJob, due: float) -> None:
+        job.next_due = due
+        heapq.heappush(self._heap, (due, -job.priority, next(self._sequence), job._generation, job))
+
+    def _discard_stale(self) -> None:
+        heap = self._heap
+        while heap:
+            _, _, _, generation, job = heap[0]
+            if generation == job._generation and self._jobs.get(job.name) is job:
+                return
+            heapq.heappop(heap)
+
+    def _notify(self) -> None:
+        for listener in self._listeners:
+            listener()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+class MoltpyWorkerPool:
+    """Bounded executor for heartbeat work.
+
+    Thread workers run ordinary jobs; CPU-bound jobs go to an optional process
+    pool (their callbacks must be picklable). A submission that finds no idle
+    worker waits in a queue of at most ``max_queue`` tasks and is rejected when
+    it is full, so ``max_queue=0`` runs jobs only while a worker is free.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 64, process_workers: int = 0) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+        self.process_workers = max(0, int(process_workers))
+        self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="moltpy-worker")
+        self._processes: "ProcessPoolExecutor | None" = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._process_pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._closed = False
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        on_done: Callable[[BaseException | None], None] | None = None,
+        cpu_bound: bool = False,
+    ) -> bool:
+        with self._lock:
+            use_processes = cpu_bound and self.process_workers > 0
+            if use_processes:
+                idle = self._process_pending < self.process_workers
+            else:
+                idle = self._queued + self._active < self.max_workers
+            if self._closed or (not idle and self.queue_depth() >= self.max_queue):
+                self.rejected += 1
+                return False
+            self.submitted += 1
+            if use_processes:
+                self._process_pending += 1
+            else:
+                self._queued += 1
+        if use_processes:
+            future = self._process_pool().submit(fn)
+        else:
+            future = self._threads.submit(self._run_thread_task, fn)
+        future.add_done_callback(lambda f: self._finished(f, use_processes, on_done))
+        return True
+
+    def _process_pool(self) -> "ProcessPoolExecutor":
+        if self._processes is None:
+            # Imported here: multiprocessing is only needed once a CPU-bound job runs.
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._processes = ProcessPoolExecutor(max_workers=self.process_workers)
+        return self._processes
+
+    def _run_thread_task(self, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _finished(
+        self,
+        future: Future,
+        from_processes: bool,
+        on_done: Callable[[BaseException | None], None] | None,
+    ) -> None:
+        error = None if future.cancelled() else future.exception()
+        with self._lock:
+            if from_processes:
+                self._process_pending -= 1
+            elif future.cancelled():
+                self._queued -= 1
+            if error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+        if on_done is not None:
+            on_done(error)
+
+    def queue_depth(self) -> int:
+        """Tasks waiting for a worker."""
+        threads = max(0, self._queued + self._active - self.max_workers)
+        return threads + max(0, self._process_pending - self.process_workers)
+
+    def active(self) -> int:
+        return self._active
+
+    def stats_text(self) -> str:
+        return (
+            f"workers={self.max_workers} active={self._active} queued={self.queue_depth()}/{self.max_queue} "
+            f"completed={self.completed} failed={self.failed} rejected={self.rejected}"
+        )
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            self._closed = True
+        self._threads.shutdown(wait=wait, cancel_futures=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=wait, cancel_futures=True)
@@ -1,3 +1,17 @@
 from .Heartbeat import MoltpyHeartbeat
+from .HeartbeatFiles import HeartbeatFile, discover_heartbeat_files
+from .Metrics import LatencyHistogram
+from .Scheduler import BusyPolicy, HeartbeatJob, MoltpyScheduler, OverrunPolicy
+from .WorkerPool import MoltpyWorkerPool
 
-__all__ = ["MoltpyHeartbeat"]
+__all__ = [
+    "MoltpyHeartbeat",
+    "MoltpyScheduler",
+    "HeartbeatJob",
+    "OverrunPolicy",
+    "BusyPolicy",
+    "MoltpyWorkerPool",
+    "LatencyHistogram",
+    "HeartbeatFile",
+    "discover_heartbeat_files",
+]
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from ..Logger import LogLevel, MoltpyLogRecord
+from .LogIndex import MoltpyLogIndexWriter
+from .Rotation import LogCompression, LogSplit, MoltpyLogRotator
+
+
+class LogMode:
+    TEXT = "text"
+    JSONL = "jsonl"
+
+    @classmethod
+    def normalize(cls, value: str | None) -> str:
+        mode = str(value or cls.TEXT).strip().lower()
+        return cls.JSONL if mode in {"json", "jsonl", "ndjson"} else cls.TEXT
+
+
+class MoltpyFileSink:
+    """Log sink that keeps its file open and buffers writes.
+
+    The current file size and the next time boundary are tracked in memory so
+    rotation checks do not touch the filesystem. Buffered bytes are written
+    once ``flush_bytes`` accumulate or ``flush_interval`` seconds have passed.
+    Rotated segments are handed to a ``MoltpyLogRotator`` thread.
+
+    In ``jsonl`` mode every line is a JSON object and, unless ``index_bucket``
+    is 0, a sidecar ``.idx`` file maps time buckets and levels to byte ranges
+    so ``MoltpyLogReader`` can skip straight to matching regions.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        log_format: str = "[{asctime}] [{levelname}] {message}",
+        date_format: str = "%Y-%m-%d %H:%M:%S",
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        flush_interval: float = 1.0,
+        flush_bytes: int = 64 * 1024,
+        split: str = LogSplit.SIZE,
+        compression: str = LogCompression.NONE,
+        retention_bytes: int = 0,
+        mode: str = LogMode.TEXT,
+        index_bucket: int = 60,
+    ) -> None:
+        self.path = Path(path)
+        self.mode = LogMode.normalize(mode)
+        self.index_bucket = max(0, int(index_bucket)) if self.mode == LogMode.JSONL else 0
+        self._index: MoltpyLogIndexWriter | None = None
+        self.log_format = log_format
+        self.date_format = date_format
+        self.max_bytes = max(0, int(max_bytes))
+        self.backup_count = max(0, int(backup_count))
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.flush_bytes = max(0, int(flush_bytes))
+        self.split = LogSplit.normalize(split)
+        self.retention_bytes = max(0, int(retention_bytes))
+        self._boundary: float | None = None
+        self._rotator: MoltpyLogRotator | None = None
+        if self.rotation_enabled:
+            self._rotator = MoltpyLogRotator(
+                self.path,
+                backup_count=self.backup_count,
+                compression=compression,
+                retention_bytes=retention_bytes,
+            )
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._buffer = bytearray()
+        self._handle: BinaryIO | None = None
+        self._size = 0
+        self._closed = False
+        self._asctime_second = -1
+        self._asctime = ""
+        self._open()
+        self._flusher: threading.Thread | None = None
+        if self.flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name="moltpy-log-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    @property
+    def rotation_enabled(self) -> bool:
+        if self.split == LogSplit.SIZE and self.max_bytes <= 0:
+            return False
+        return self.backup_count > 0 or self.retention_bytes > 0
+
+    def __call__(self, level: int, line: str, _rich: Any = None) -> None:
+        if self.mode == LogMode.JSONL:
+            self._write_json(time.time(), level, "", line)
+            return
+        self._write_line(time.time(), level, line)
+
+    def emit(self, record: MoltpyLogRecord) -> None:
+        if self.mode == LogMode.JSONL:
+            self._write_json(record.created, record.level, record.name, record.message)
+            return
+        self._write_line(record.created, record.level, record.line)
+
+    def _needs_rotation(self, created: float, size: int) -> bool:
+        if self._size <= 0:
+            return False
+        if self._boundary is not None:
+            return created >= self._boundary
+        return self._size + size > self.max_bytes
+
+    def _asctime_for(self, created: float) -> str:
+        second = int(created)
+        if second != self._asctime_second:
+            self._asctime = datetime.fromtimestamp(second).strftime(self.date_format)
+            self._asctime_second = second
+        return self._asctime
+
+    def _write_line(self, created: float, level: int, line: str) -> None:
+        rendered = self.log_format.format(
+            asctime=self._asctime_for(created),
+            levelname=LogLevel.name(level),
+            message=line,
+        )
+        self.write((rendered + "\n").encode("utf-8"), created, level)
+
+    def _write_json(self, created: float, level: int, name: str, message: str) -> None:
+        rendered = json.dumps(
+            {
+                "ts": round(created, 6),
+                "time": self._asctime_for(created),
+                "level": LogLevel.name(level),
+                "logger": name,
+                "message": message,
+            },
+            ensure_ascii=False,
+        )
+        self.write((rendered + "\n").encode("utf-8"), created, level)
+
+    def write(self, data: bytes, created: float | None = None, level: int | None = None) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if created is None:
+                created = time.time()
+            if self._rotator is not None and self._needs_rotation(created, len(data)):
+                self._rotate()
+            if self._index is not None:
+                self._index.add(
+                    created,
+                    LogLevel.name(level if level is not None else LogLevel.INFO),
+                    self._size,
+                    len(data),
+                )
+            was_empty = not self._buffer
+            self._buffer += data
+            self._size += len(data)
+            if len(self._buffer) >= self.flush_bytes:
+                self._write_buffer()
+            elif was_empty:
+                self._wakeup.notify()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write_buffer()
+
+    def size(self) -> int:
+        return self._size
+
+    def reopen(self) -> None:
+        with self._lock:
+            self._write_buffer()
+            self._close_handle()
+            self._open()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._write_buffer()
+            self._close_handle()
+            self._closed = True
+            self._wakeup.notify_all()
+        if self._flusher is not None and threading.current_thread() is not self._flusher:
+            self._flusher.join(timeout=1.0)
+        if self._rotator is not None:
+            self._rotator.close()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("ab")
+        try:
+            stat = os.fstat(self._handle.fileno())
+            self._size = stat.st_size
+            started = stat.st_mtime if stat.st_size else time.time()
+        except OSError:
+            self._size = 0
+            started = time.time()
+        self._boundary = LogSplit.next_boundary(self.split, started)
+        if self.index_bucket:
+            self._index = MoltpyLogIndexWriter(self.path, self.index_bucket)
+            self._index.open()
+
+    def _close_handle(self) -> None:
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+            self._handle = None
+
+    def _write_buffer(self) -> None:
+        if not self._buffer or self._handle is None:
+            return
+        self._handle.write(self._buffer)
+        self._handle.flush()
+        self._buffer.clear()
+        if self._index is not None:
+            self._index.flush()
+
+    def _rotate(self) -> None:
+        self._write_buffer()
+        self._close_handle()
+        try:
+            staged = self._rotator.stage()  # type: ignore[union-attr]
+        except OSError:
+            staged = None
+        self._open()
+        if staged is not None:
+            self._rotator.submit(staged)  # type: ignore[union-attr]
+
+    def _flush_loop(self) -> None:
+        with self._lock:
+            while not self._closed:
+                if not self._buffer:
+                    self._wakeup.wait()
+                    continue
+                self._wakeup.wait(self.flush_interval)
+                try:
+                    self._write_buffer()
+                except OSError:
+                    pass
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+INDEX_SUFFIX = ".idx"
+
+
+def index_path_for(segment: Path) -> Path:
+    """Sidecar index path; compressed segments share the uncompressed name."""
+    name = segment.name
+    for suffix in (".gz", ".zst"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    return segment.with_name(name + INDEX_SUFFIX)
+
+
+@dataclass
+class LogIndexEntry:
+    """One time bucket of a segment: byte range, time range and level counts."""
+
+    bucket: int
+    start: int
+    end: int
+    first: float
+    last: float
+    levels: dict[str, int] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "t": self.bucket,
+                "start": self.start,
+                "end": self.end,
+                "first": self.first,
+                "last": self.last,
+                "levels": self.levels,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogIndexEntry":
+        return cls(
+            bucket=int(data["t"]),
+            start=int(data["start"]),
+            end=int(data["end"]),
+            first=float(data["first"]),
+            last=float(data["last"]),
+            levels=dict(data.get("levels", {})),
+        )
+
+
+def read_index(segment: Path) -> list[LogIndexEntry] | None:
+    path = index_path_for(segment)
+    if not path.exists():
+        return None
+    entries: list[LogIndexEntry] = []
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            for raw in f:
+                try:
+                    entries.append(LogIndexEntry.from_dict(json.loads(raw)))
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except OSError:
+        return None
+    return entries
+
+
+class MoltpyLogIndexWriter:
+    """Accumulates the open time bucket and appends closed buckets to the sidecar.
+
+    The caller owns locking and tells the writer the byte offset of every line
+    it appends. The bucket that is still open when the process dies is simply
+    missing from the index; readers scan from the last indexed offset instead.
+    """
+
+    def __init__(self, segment: Path, bucket_seconds: int = 60) -> None:
+        self.segment = segment
+        self.bucket_seconds = max(1, int(bucket_seconds))
+        self._handle: BinaryIO | None = None
+        self._pending = bytearray()
+        self._current: LogIndexEntry | None = None
+
+    def open(self) -> None:
+        self._handle = index_path_for(self.segment).open("ab")
+
+    def add(self, created: float, level_name: str, offset: int, length: int) -> None:
+        bucket = int(created // self.bucket_seconds) * self.bucket_seconds
+        current = self._current
+        if current is None or current.bucket != bucket or current.end != offset:
+            self.close_bucket()
+            current = self._current = LogIndexEntry(
+                bucket=bucket,
+                start=offset,
+                end=offset,
+                first=created,
+                last=created,
+            )
+        current.end = offset + length
+        current.last = created
+        current.levels[level_name] = current.levels.get(level_name, 0) + 1
+
+    def close_bucket(self) -> None:
+        if self._current is not None:
+            self._pending += (self._current.to_json() + "\n").encode("utf-8")
+            self._current = None
+
+    def flush(self) -> None:
+        if self._pending and self._handle is not None:
+            self._handle.write(self._pending)
+            self._handle.flush()
+            self._pending.clear()
+
+    def close(self) -> None:
+        self.close_bucket()
+        self.flush()
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+            self._handle = None
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import gzip
+import json
+import mmap
+import re
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from ..Logger import LogLevel
+from .LogIndex import LogIndexEntry, read_index
+from .Rotation import _zstandard
+
+_LEVELS = {LogLevel.name(level): level for level in (LogLevel.DEBUG, LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR)}
+
+
+@dataclass
+class LogQuery:
+    min_level: int | None = None
+    logger: str | None = None
+    since: float | None = None
+    until: float | None = None
+    contains: str | None = None
+
+    def matches(self, entry: dict[str, Any]) -> bool:
+        if self.min_level is not None and _LEVELS.get(entry.get("level", ""), 0) < self.min_level:
+            return False
+        if self.logger is not None and entry.get("logger") != self.logger:
+            return False
+        ts = entry.get("ts")
+        if isinstance(ts, (int, float)):
+            if self.since is not None and ts < self.since:
+                return False
+            if self.until is not None and ts >= self.until:
+                return False
+        if self.contains is not None and self.contains not in str(entry.get("message", "")):
+            return False
+        return True
+
+    def wants_bucket(self, entry: LogIndexEntry) -> bool:
+        if self.since is not None and entry.last < self.since:
+            return False
+        if self.until is not None and entry.first >= self.until:
+            return False
+        if self.min_level is not None:
+            return any(_LEVELS.get(name, 0) >= self.min_level for name in entry.levels)
+        return True
+
+
+class MoltpyLogReader:
+    """Queries JSONL log segments, using sidecar indexes to skip unrelated byte ranges.
+
+    Plain segments are read through ``mmap``; compressed ones are decompressed
+    as a stream and only the indexed ranges are parsed.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def segments(self) -> list[Path]:
+        pattern = re.compile(re.escape(self.path.name) + r"\.(\d+)(\.gz|\.zst)?$")
+        backups: list[tuple[int, Path]] = []
+        for candidate in self.path.parent.glob(self.path.name + ".*"):
+            match = pattern.match(candidate.name)
+            if match:
+                backups.append((int(match.group(1)), candidate))
+        ordered = [path for _, path in sorted(backups, key=lambda item: item[0], reverse=True)]
+        if self.path.exists():
+            ordered.append(self.path)
+        return ordered
+
+    def query(self, query: LogQuery) -> Iterator[dict[str, Any]]:
+        for segment in self.segments():
+            yield from self.query_segment(segment, query)
+
+    def query_segment(self, segment: Path, query: LogQuery) -> Iterator[dict[str, Any]]:
+        for raw in self._read_ranges(segment, self._ranges(segment, query)):
+            entry = _parse(raw)
+            if entry is not None and query.matches(entry):
+                yield entry
+
+    def follow(self, query: LogQuery, poll_interval: float = 0.5) -> Iterator[dict[str, Any]]:
+        """Yield matching entries appended to the live file, surviving rotation."""
+        position = self.path.stat().st_size if self.path.exists() else 0
+        identity = _identity(self.path)
+        pending = b""
+        while True:
+            current = _identity(self.path)
+            if current != identity or (self.path.exists() and self.path.stat().st_size < position):
+                identity = current
+                position = 0
+                pending = b""
+            if not self.path.exists():
+                time.sleep(poll_interval)
+                continue
+            with self.path.open("rb") as f:
+                f.seek(position)
+                chunk = f.read()
+            if not chunk:
+                time.sleep(poll_interval)
+                continue
+            position += len(chunk)
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for raw in lines:
+                entry = _parse(raw)
+                if entry is not None and query.matches(entry):
+                    yield entry
+
+    def _ranges(self, segment: Path, query: LogQuery) -> list[tuple[int, int | None]]:
+        entries = read_index(segment)
+        if not entries:
+            return [(0, None)]
+        ranges: list[tuple[int, int | None]] = []
+        indexed_end = 0
+        for entry in entries:
+            indexed_end = max(indexed_end, entry.end)
+            if not query.wants_bucket(entry):
+                continue
+            if ranges and ranges[-1][1] == entry.start:
+                ranges[-1] = (ranges[-1][0], entry.end)
+            else:
+                ranges.append((entry.start, entry.end))
+        # Lines written after the last closed bucket are not indexed yet.
+        ranges.append((indexed_end, None))
+        return ranges
+
+    def _read_ranges(self, segment: Path, ranges: list[tuple[int, int | None]]) -> Iterator[bytes]:
+        name = segment.name
+        if name.endswith(".gz") or name.endswith(".zst"):
+            yield from self._read_stream(segment, ranges)
+            return
+        try:
+            with segment.open("rb") as f:
+                if f.seek(0, 2) == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    size = len(view)
+                    for start, end in ranges:
+                        stop = size if end is None else min(end, size)
+                        position = start
+                        while position < stop:
+                            newline = view.find(b"\n", position, stop)
+                            if newline < 0:
+                                yield view[position:stop]
+                                break
+                            yield view[position:newline]
+                            position = newline + 1
+        except (OSError, ValueError):
+            return
+
+    def _read_stream(self, segment: Path, ranges: list[tuple[int, int | None]]) -> Iterator[bytes]:
+        if segment.name.endswith(".zst"):
+            zstandard = _zstandard()
+            if zstandard is None:
+                return
+            stream = zstandard.ZstdDecompressor().stream_reader(segment.open("rb"))
+        else:
+            stream = gzip.open(segment, "rb")
+        with stream:
+            position = 0
+            for start, end in ranges:
+                if start > position:
+                    _skip(stream, start - position)
+                    position = start
+                elif start < position:
+                    continue
+                data = stream.read() if end is None else stream.read(end - start)
+                position += len(data)
+                yield from data.split(b"\n")
+
+
+def _skip(stream: Any, count: int) -> None:
+    while count > 0:
+        chunk = stream.read(min(count, 1024 * 1024))
+        if not chunk:
+            return
+        count -= len(chunk)
+
+
+def _identity(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def _parse(raw: bytes) -> dict[str, Any] | None:
+    raw = raw.strip()
+    if not raw.startswith(b"{"):
+        return None
+    try:
+        entry = json.loads(raw)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def parse_time(value: str | None) -> float | None:
+    """Accepts epoch seconds, ``HH:MM[:SS]`` (today) or ``YYYY-MM-DD[ HH:MM[:SS]]``."""
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    for fmt in ("%H:%M", "%H:%M:%S"):
+        try:
+            clock = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        return datetime.now().replace(
+            hour=clock.hour, minute=clock.minute, second=clock.second, microsecond=0
+        ).timestamp()
+    return datetime.fromisoformat(value).timestamp()
+
+
+def format_entry(entry: dict[str, Any]) -> str:
+    return f"{entry.get('time', '')} [{entry.get('level', '')}] {entry.get('logger', '')}: {entry.get('message', '')}"
+
+
+def run_logs_cli(argv: list[str], default_path: Path | None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="moltpy logs", description="Query or tail JSONL Moltpy logs.")
+    parser.add_argument("--file", type=Path, default=default_path, help="Log file (default: configured log file).")
+    parser.add_argument("--level", help="Minimum level (DEBUG, INFO, WARNING, ERROR).")
+    parser.add_argument("--logger", help="Only entries from this logger, e.g. MoltpyRuntime.")
+    parser.add_argument("--since", help="Start time: epoch, HH:MM[:SS] or YYYY-MM-DD HH:MM.")
+    parser.add_argument("--until", help="End time (exclusive), same formats as --since.")
+    parser.add_argument("--grep", help="Only entries whose message contains this text.")
+    parser.add_argument("--limit", type=int, default=0, help="Stop after this many entries.")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON lines.")
+    parser.add_argument("-f", "--follow", action="store_true", help="Keep printing new entries.")
+    args = parser.parse_args(argv)
+
+    if args.file is None:
+        print("No log file configured (logging.log_enabled is off).", file=sys.stderr)
+        return 1
+    min_level = None
+    if args.level:
+        min_level = _LEVELS.get(args.level.upper())
+        if min_level is None:
+            parser.error(f"unknown level: {args.level}")
+    try:
+        since = parse_time(args.since)
+        until = parse_time(args.until)
+    except ValueError as exc:
+        parser.error(f"invalid time: {exc}")
+    query = LogQuery(min_level=min_level, logger=args.logger, since=since, until=until, contains=args.grep)
+    reader = MoltpyLogReader(args.file)
+
+    printed = 0
+
+    def emit(entry: dict[str, Any]) -> bool:
+        """Prints ``entry``; False once ``--limit`` entries are out."""
+        nonlocal printed
+        print(json.dumps(entry, ensure_ascii=False) if args.json else format_entry(entry), flush=args.follow)
+        printed += 1
+        return not (args.limit and printed >= args.limit)
+
+    try:
+        more = True
+        # Following without --since only shows new entries, like ``tail -f``.
+        if not args.follow or query.since is not None:
+            for entry in reader.query(query):
+                more = emit(entry)
+                if not more:
+                    break
+        if args.follow and more:
+            for entry in reader.follow(query):
+                if not emit(entry):
+                    break
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import gzip
+import re
+import shutil
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .LogIndex import INDEX_SUFFIX, index_path_for
+
+_zstandard_module: Any = None
+_zstandard_checked = False
+
+
+def _zstandard() -> Any:
+    """The ``zstandard`` module, or None if it is not installed; the import
+    is attempted once."""
+    global _zstandard_module, _zstandard_checked
+    if not _zstandard_checked:
+        try:
+            import zstandard  # type: ignore
+        except Exception:
+            zstandard = None
+        _zstandard_module = zstandard
+        _zstandard_checked = True
+    return _zstandard_module
+
+
+class LogSplit:
+    SIZE = "size"
+    HOURLY = "hourly"
+    DAILY = "daily"
+
+    @classmethod
+    def normalize(cls, value: str | None) -> str:
+        split = str(value or cls.SIZE).strip().lower()
+        return split if split in {cls.SIZE, cls.HOURLY, cls.DAILY} else cls.SIZE
+
+    @classmethod
+    def next_boundary(cls, split: str, moment: float) -> float | None:
+        """Epoch seconds at which a segment started at ``moment`` ends."""
+        if split == cls.SIZE:
+            return None
+        start = datetime.fromtimestamp(moment)
+        if split == cls.HOURLY:
+            start = start.replace(minute=0, second=0, microsecond=0)
+            return (start + timedelta(hours=1)).timestamp()
+        start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        return (start + timedelta(days=1)).timestamp()
+
+
+class LogCompression:
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    suffixes = {GZIP: ".gz", ZSTD: ".zst"}
+
+    @classmethod
+    def normalize(cls, value: str | None) -> str:
+        compression = str(value or cls.NONE).strip().lower()
+        if compression in {"gz", cls.GZIP}:
+            return cls.GZIP
+        if compression in {"zst", cls.ZSTD}:
+            return cls.ZSTD if _zstandard() is not None else cls.GZIP
+        return cls.NONE
+
+
+class MoltpyLogRotator:
+    """Shifts, compresses and prunes rotated log segments off the logging path.
+
+    The file sink only renames the live file to a staging name and reopens a
+    fresh one; everything else happens on the ``moltpy-log-rotate`` thread, one
+    job at a time so backup numbering never races.
+    """
+
+    STAGING_MARKER = ".rotating-"
+
+    def __init__(
+        self,
+        path: str | Path,
+        backup_count: int = 0,
+        compression: str = LogCompression.NONE,
+        retention_bytes: int = 0,
+    ) -> None:
+        self.path = Path(path)
+        self.backup_count = max(0, int(backup_count))
+        self.compression = LogCompression.normalize(compression)
+        self.retention_bytes = max(0, int(retention_bytes))
+        self._jobs: deque[Path] = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._busy = False
+        self._closing = False
+        self._backup_pattern = re.compile(
+            re.escape(self.path.name) + r"\.(\d+)(\.gz|\.zst)?$"
+        )
+        self._thread = threading.Thread(
+            target=self._worker_loop,
+            name="moltpy-log-rotate",
+            daemon=True,
+        )
+        self._thread.start()
+        for staged in sorted(self.path.parent.glob(self.path.name + self.STAGING_MARKER + "*")):
+            if not staged.name.endswith(INDEX_SUFFIX):
+                self.submit(staged)
+
+    def stage(self) -> Path:
+        """Rename the live file (and its index) out of the way; the caller reopens ``path``."""
+        staged = self.path.with_name(f"{self.path.name}{self.STAGING_MARKER}{time.time_ns()}")
+        self.path.rename(staged)
+        index = index_path_for(self.path)
+        if index.exists():
+            index.rename(index_path_for(staged))
+        return staged
+
+    def submit(self, staged: Path) -> None:
+        with self._lock:
+            self._jobs.append(staged)
+            self._wakeup.notify_all()
+
+    def pending(self) -> int:
+        return len(self._jobs) + (1 if self._busy else 0)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._jobs or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._wakeup.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        self.drain(timeout)
+        with self._lock:
+            self._closing = True
+            self._wakeup.notify_all()
+        self._thread.join(timeout)
+
+    def backups(self) -> list[tuple[int, Path]]:
+        found: list[tuple[int, Path]] = []
+        for candidate in self.path.parent.glob(self.path.name + ".*"):
+            match = self._backup_pattern.match(candidate.name)
+            if match:
+                found.append((int(match.group(1)), candidate))
+        found.sort(key=lambda item: item[0])
+        return found
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._jobs and not self._closing:
+                    self._wakeup.wait()
+                if not self._jobs:
+                    return
+                staged = self._jobs.popleft()
+                self._busy = True
+            try:
+                self._rotate(staged)
+            except OSError:
+                pass
+            finally:
+                with self._lock:
+                    self._busy = False
+                    self._wakeup.notify_all()
+
+    def _rotate(self, staged: Path) -> None:
+        for index, backup in reversed(self.backups()):
+            if self.backup_count and index >= self.backup_count:
+                self._remove(backup)
+                continue
+            suffix = backup.name[len(self.path.name) + len(f".{index}"):]
+            target = self.path.with_name(f"{self.path.name}.{index + 1}{suffix}")
+            sidecar = index_path_for(backup)
+            backup.rename(target)
+            if sidecar.exists():
+                sidecar.rename(index_path_for(target))
+        if not staged.exists():
+            return
+        first = self.path.with_name(f"{self.path.name}.1")
+        staged_sidecar = index_path_for(staged)
+        if staged_sidecar.exists():
+            staged_sidecar.rename(index_path_for(first))
+        if self.compression == LogCompression.NONE:
+            staged.rename(first)
+        else:
+            self._compress(staged, first.with_name(first.name + LogCompression.suffixes[self.compression]))
+        self._apply_retention()
+
+    def _remove(self, backup: Path) -> None:
+        backup.unlink(missing_ok=True)
+        index_path_for(backup).unlink(missing_ok=True)
+
+    def _compress(self, source: Path, target: Path) -> None:
+        partial = target.with_name(target.name + ".tmp")
+        with source.open("rb") as src:
+            zstandard = _zstandard() if self.compression == LogCompression.ZSTD else None
+            if zstandard is not None:
+                with partial.open("wb") as dst:
+                    zstandard.ZstdCompressor().copy_stream(src, dst)
+            else:
+                with gzip.open(partial, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+        partial.replace(target)
+        source.unlink()
+
+    def _apply_retention(self) -> None:
+        if not self.retention_bytes:
+            return
+        total = 0
+        for _, backup in self.backups():
+            try:
+                size = backup.stat().st_size
+            except OSError:
+                continue
+            total += size
+            if total > self.retention_bytes:
+                self._remove(backup)
@@ -0,0 +1,25 @@
+from .FileSink import LogMode, MoltpyFileSink
+from .LogIndex import LogIndexEntry, MoltpyLogIndexWriter
+from .Rotation import LogCompression, LogSplit, MoltpyLogRotator
+
+__all__ = [
+    "MoltpyFileSink",
+    "MoltpyLogRotator",
+    "MoltpyLogIndexWriter",
+    "MoltpyLogReader",
+    "LogIndexEntry",
+    "LogQuery",
+    "LogMode",
+    "LogSplit",
+    "LogCompression",
+    "run_logs_cli",
+]
+
+
+def __getattr__(name: str):
+    # The query side (mmap, argparse) is only loaded by ``moltpy logs``.
+    if name in {"LogQuery", "MoltpyLogReader", "run_logs_cli"}:
+        from . import Query
+
+        return getattr(Query, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterator
+
+# Role, separators and framing each chat message costs on top of its text.
+MESSAGE_OVERHEAD = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Token count without a tokenizer: about four characters per token,
+    which is close for English text and code."""
+    return (len(text) + 3) // 4 + MESSAGE_OVERHEAD
+
+
+@dataclass
+class ConversationTurn:
+    id: int
+    role: str
+    content: str
+    tokens: int  # counted once, when the turn is added
+    created_at: datetime
+    summary: bool = False  # stub standing in for compacted turns
+
+
+# (previous stub text, or "", compacted turns, token limit) -> text of the new stub
+CompactFn = Callable[[str, list[ConversationTurn], int], str]
+# receives the compacted turns, e.g. to keep them in long-term memory
+ArchiveFn = Callable[[list[ConversationTurn]], None]
+
+SUMMARY_HEADER = "Earlier in this conversation:"
+# Smallest stub budget: the header plus one outline line cut to this length.
+SUMMARY_MIN_LINE = 40
+SUMMARY_MIN_TOKENS = estimate_tokens(SUMMARY_HEADER + "\n" + "x" * SUMMARY_MIN_LINE)
+
+
+def outline_summary(previous: str, turns: list[ConversationTurn], max_tokens: int, line_chars: int = 160) -> str:
+    """One line per compacted turn: its role and the start of its text.
+    The oldest lines are dropped first to keep the stub within ``max_tokens``
+    as counted by ``estimate_tokens``; the oldest line kept is cut short to
+    use the remaining space, so a budget of ``SUMMARY_MIN_TOKENS`` still
+    keeps the newest turn."""
+    max_chars = (max_tokens - MESSAGE_OVERHEAD) * 4 - len(SUMMARY_HEADER)
+    lines = previous.splitlines()[1:] if previous else []
+    for turn in turns:
+        text = " ".join(turn.content.split())
+        if len(text) > line_chars:
+            text = text[: line_chars - 3].rstrip() + "..."
+        lines.append(f"- {turn.role}: {text}")
+    size = 0
+    kept: list[str] = []
+    for line in reversed(lines):
+        room = max_chars - size - 1
+        if len(line) > room:
+            if room > 3:
+                kept.append(line[: room - 3].rstrip() + "...")
+            break
+        size += len(line) + 1
+        kept.append(line)
+    kept.reverse()
+    return "\n".join([SUMMARY_HEADER, *kept])
+
+
+class MoltpyConversation:
+    """Conversation turns in a bounded ring buffer with a token budget.
+
+    Each turn's token count is computed once, when it is added, and the
+    total is kept up to date, so neither adding a turn nor building a
+    context window rescans the history. When the turns exceed
+    ``max_tokens`` or ``max_turns``, the oldest are compacted until the
+    buffer is back under ``low_water`` of both limits: they are handed to
+    ``archive`` and replaced by a single summary stub (``summary=True``)
+    at the front of the buffer, which ``compact`` keeps within
+    ``summary_share`` of the token budget. Compacting below the limits
+    means it runs once per many turns rather than on every turn.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 32_000,
+        max_turns: int = 1_000,
+        low_water: float = 0.75,
+        summary_share: float = 0.1,
+        count_tokens: Callable[[str], int] | None = None,
+        compact: CompactFn | None = None,
+        archive: ArchiveFn | None = None,
+    ) -> None:
+        self.max_tokens = max(1, int(max_tokens))
+        self.max_turns = max(2, int(max_turns))
+        self.low_water = min(max(float(low_water), 0.1), 1.0)
+        self.summary_share = min(max(float(summary_share), 0.0), 0.5)
+        self.count_tokens = count_tokens or estimate_tokens
+        self.compact = compact or outline_summary
+        self.archive = archive
+        self._turns: deque[ConversationTurn] = deque()
+        self._stub: ConversationTurn | None = None
+        self._tokens = 0
+        self._next_id = 1
+        self.compacted = 0  # turns replaced by the stub so far
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        max_tokens: int | None = None,
+        max_turns: int | None = None,
+        archive: ArchiveFn | None = None,
+    ) -> None:
+        """Changes the limits; turns over the new limits are compacted."""
+        with self._lock:
+            if max_tokens is not None:
+                self.max_tokens = max(1, int(max_tokens))
+            if max_turns is not None:
+                self.max_turns = max(2, int(max_turns))
+            if archive is not None:
+                self.archive = archive
+            evicted = self._compact_if_over()
+        self._archive(evicted)
+
+    def append(self, role: str, content: str) -> ConversationTurn:
+        turn_tokens = self.count_tokens(content)
+        with self._lock:
+            turn = ConversationTurn(
+                id=self._next_id,
+                role=role,
+                content=content,
+                tokens=turn_tokens,
+                created_at=datetime.now(timezone.utc),
+            )
+            self._next_id += 1
+            self._turns.append(turn)
+            self._tokens += turn_tokens
+            evicted = self._compact_if_over()
+        self._archive(evicted)
+        return turn
+
+    def _over(self, tokens: float, turns: float) -> bool:
+        return self._tokens > tokens or len(self._turns) > turns
+
+    def _compact_if_over(self) -> list[ConversationTurn]:
+        """Called with the lock held; returns the compacted turns."""
+        if not self._over(self.max_tokens, self.max_turns):
+            return []
+        tokens = self.max_tokens * self.low_water
+        turns = self.max_turns * self.low_water
+        evicted: list[ConversationTurn] = []
+        # The newest turn always stays, even if it alone exceeds the budget.
+        while self._over(tokens, turns) and len(self._turns) > (2 if self._stub is not None else 1):
+            stub = self._turns.popleft() if self._stub is not None else None
+            batch: list[ConversationTurn] = []
+            while self._over(tokens, turns) and len(self._turns) > 1:
+                turn = self._turns.popleft()
+                self._tokens -= turn.tokens
+                batch.append(turn)
+            if not batch:
+                self._turns.appendleft(stub)
+                break
+            if stub is not None:
+                self._tokens -= stub.tokens
+            limit = max(SUMMARY_MIN_TOKENS, int(self.max_tokens * self.summary_share))
+            text = self.compact(stub.content if stub is not None else "", batch, limit)
+            self._stub = ConversationTurn(
+                id=0,
+                role="system",
+                content=text,
+                tokens=self.count_tokens(text),
+                created_at=batch[0].created_at,
+                summary=True,
+            )
+            self._turns.appendleft(self._stub)
+            self._tokens += self._stub.tokens
+            evicted.extend(batch)
+        self.compacted += len(evicted)
+        return evicted
+
+    def _archive(self, evicted: list[ConversationTurn]) -> None:
+        if evicted and self.archive is not None:
+            self.archive(evicted)
+
+    def window(self, budget: int | None = None, include_summary: bool = True) -> list[ConversationTurn]:
+        """The newest turns that fit in ``budget`` tokens (default
+        ``max_tokens``), oldest first. The summary stub, when there is one
+        and it fits, is reserved first and leads the window. Walks back from
+        the newest turn, so the cost is proportional to the window."""
+        budget = self.max_tokens if budget is None else int(budget)
+        with self._lock:
+            stub = self._stub if include_summary and self._stub is not None and self._stub.tokens <= budget else None
+            remaining = budget - (stub.tokens if stub is not None else 0)
+            picked: list[ConversationTurn] = []
+            for turn in reversed(self._turns):
+                if turn.summary or turn.tokens > remaining:
+                    break
+                remaining -= turn.tokens
+                picked.append(turn)
+        if stub is not None:
+            picked.append(stub)
+        picked.reverse()
+        return picked
+
+    def messages(self, budget: int | None = None) -> list[dict[str, str]]:
+        """``window`` as ``{"role", "content"}`` chat messages."""
+        return [{"role": turn.role, "content": turn.content} for turn in self.window(budget)]
+
+    @property
+    def total_tokens(self) -> int:
+        return self._tokens
+
+    @property
+    def summary(self) -> ConversationTurn | None:
+        return self._stub
+
+    def clear(self) -> None:
+        with self._lock:
+            self._turns.clear()
+            self._stub = None
+            self._tokens = 0
+            self.compacted = 0
+
+    def __iter__(self) -> Iterator[ConversationTurn]:
+        with self._lock:
+            return iter(list(self._turns))
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def stats_text(self) -> str:
+        return (
+            f"turns={len(self._turns)} tokens={self._tokens}/{self.max_tokens} "
+            f"compacted={self.compacted}"
+        )
@@ -1,3 +1,333 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    type TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    digest BLOB NOT NULL UNIQUE,
+    created_at TEXT NOT NULL,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS notes_title ON notes (title);
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5 (
+    title, content, content='notes', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS notes_ai AFTER INSERT ON notes BEGIN
+    INSERT INTO notes_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS notes_ad AFTER DELETE ON notes BEGIN
+    INSERT INTO notes_fts (notes_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+END;
+"""
+
+_INSERT = (
+    "INSERT OR IGNORE INTO notes (type, title, content, digest, created_at, source) VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SELECT = "SELECT id, type, title, content, created_at, source FROM notes"
+# Ranks only the newest ``window`` matches (?2): BM25 costs about a
+# microsecond per matching row, which adds up for very common words, while
+# finding the newest matches only walks the rowid-ordered index.
+_SEARCH = (
+    "SELECT n.id, n.type, n.title, n.content, n.created_at, n.source, hit.score FROM ("
+    "SELECT rowid, bm25(notes_fts, 3.0, 1.0) AS score FROM notes_fts WHERE notes_fts MATCH ?1 AND rowid >= ("
+    "SELECT min(rowid) FROM (SELECT rowid FROM notes_fts WHERE notes_fts MATCH ?1 ORDER BY rowid DESC LIMIT ?2)"
+    ") ORDER BY score LIMIT ?3"
+    ") AS hit JOIN notes AS n ON n.id = hit.rowid ORDER BY hit.score"
+)
+_COLUMNS = ("id", "type", "title", "content", "created_at", "source")
+
+# One queued write: runs against the writer connection inside a transaction.
+_WriteOp = Callable[[sqlite3.Connection], Any]
+
+
+def _digest(content: str) -> bytes:
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def fts_query(text: str) -> str:
+    """Free text as an FTS5 query that matches documents containing every
+    word, with each word quoted so FTS operators in the text stay literal."""
+    words = [word.replace('"', '""') for word in text.split()]
+    return " ".join(f'"{word}"' for word in words)
+
+
 class MoltpyDatabase:
-    def __init__(self):
-        return
\ No newline at end of file
+    """SQLite store for long-term memory notes.
+
+    The database runs in WAL mode, so readers never wait for the writer.
+    All writes go through a queue to one writer thread, which commits
+    whatever has accumulated (up to ``batch_size`` operations) as a single
+    transaction. A burst of small writes therefore costs one fsync instead
+    of one each. Reads run on a small pool of read-only connections.
+    Statements are parameterized and come from each connection's statement
+    cache, so they are prepared once.
+
+    Notes are unique by content. An FTS5 index over titles and contents,
+    kept in sync by triggers, serves ``search``.
+
+    The ``async`` methods never block the event loop. Code on other threads,
+    such as heartbeat jobs, can use the ``*_nowait`` variants, which return a
+    ``concurrent.futures.Future``.
+    """
+
+    def __init__(
+        self, path: str | Path, batch_size: int = 512, readers: int = 2, search_window: int = 5000
+    ) -> None:
+        self.path = Path(path)
+        self.batch_size = max(1, int(batch_size))
+        self.search_window = max(0, int(search_window))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writes: queue.Queue[tuple[_WriteOp, Future] | None] = queue.Queue()
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._write_lock = threading.Lock()  # orders queued writes before the close sentinel
+        self._closed = False
+        self.transactions = 0
+        self.writes = 0
+
+        conn = self._connect()
+        with conn:
+            conn.executescript(_SCHEMA)
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        self._writer_conn = conn
+        self._read_pool = ThreadPoolExecutor(max_workers=max(1, int(readers)), thread_name_prefix="moltpy-db-read")
+        self._writer = threading.Thread(target=self._write_loop, name="moltpy-db-write", daemon=True)
+        self._writer.start()
+
+    def _connect(self, readonly: bool = False) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=128, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout = 5000")
+        if readonly:
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")  # durable at checkpoints; WAL keeps the file consistent
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        return conn
+
+    def _write_loop(self) -> None:
+        conn = self._writer_conn
+        while True:
+            item = self._writes.get()
+            if item is None:
+                break
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._writes.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit(conn, batch)
+            if stop:
+                break
+        conn.execute("PRAGMA optimize")
+        conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: list[tuple[_WriteOp, Future]]) -> None:
+        live = [(op, future) for op, future in batch if future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        results: list[Any] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op, _future in live:
+                results.append(op(conn))
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            # Retry one by one so a failing write only fails its own future.
+            for op, future in live:
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    result = op(conn)
+                    conn.execute("COMMIT")
+                except Exception as exc:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+                self.transactions += 1
+            self.writes += len(live)
+            return
+        self.transactions += 1
+        self.writes += len(live)
+        for (_op, future), result in zip(live, results):
+            future.set_result(result)
+
+    def _write(self, op: _WriteOp) -> Future:
+        future: Future = Future()
+        with self._write_lock:
+            if self._closed:
+                raise RuntimeError("Database is closed")
+            self._writes.put((op, future))
+        return future
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect(readonly=True)
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def _read(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        if self._closed:
+            raise RuntimeError("Database is closed")
+        return self._read_pool.submit(lambda: fn(self._reader()))
+
+    def add_notes_nowait(
+        self, notes: Iterable[tuple[str, str, str]], created_at: datetime | None = None, source: str | None = None
+    ) -> Future:
+        """Queues ``(type, title, content)`` notes; the future resolves to
+        the number stored (duplicates by content are skipped)."""
+        stamp = (created_at or datetime.now(timezone.utc)).isoformat()
+        rows = [(str(kind), title, content, _digest(content), stamp, source) for kind, title, content in notes]
+
+        def op(conn: sqlite3.Connection) -> int:
+            return conn.executemany(_INSERT, rows).rowcount
+
+        return self._write(op)
+
+    async def add_notes(
+        self, notes: Iterable[tuple[str, str, str]], created_at: datetime | None = None, source: str | None = None
+    ) -> int:
+        return await asyncio.wrap_future(self.add_notes_nowait(notes, created_at, source))
+
+    def add_note_nowait(
+        self, note_type: str, title: str, content: str, created_at: datetime | None = None, source: str | None = None
+    ) -> Future:
+        """Queues one note; the future resolves to its ID, or None if a note
+        with the same content is already stored."""
+        row = (
+            str(note_type),
+            title,
+            content,
+            _digest(content),
+            (created_at or datetime.now(timezone.utc)).isoformat(),
+            source,
+        )
+
+        def op(conn: sqlite3.Connection) -> int | None:
+            cursor = conn.execute(_INSERT, row)
+            return cursor.lastrowid if cursor.rowcount else None
+
+        return self._write(op)
+
+    async def add_note(
+        self, note_type: str, title: str, content: str, created_at: datetime | None = None, source: str | None = None
+    ) -> int | None:
+        return await asyncio.wrap_future(self.add_note_nowait(note_type, title, content, created_at, source))
+
+    async def delete_note(self, note_id: int) -> bool:
+        def op(conn: sqlite3.Connection) -> bool:
+            return conn.execute("DELETE FROM notes WHERE id = ?", (note_id,)).rowcount > 0
+
+        return await asyncio.wrap_future(self._write(op))
+
+    async def flush(self) -> None:
+        """Waits until every write queued so far is committed."""
+        await asyncio.wrap_future(self._write(lambda conn: None))
+
+    async def optimize(self) -> None:
+        """Merges the FTS index segments; worthwhile after a large import."""
+
+        def op(conn: sqlite3.Connection) -> None:
+            conn.execute("INSERT INTO notes_fts (notes_fts) VALUES ('optimize')")
+
+        await asyncio.wrap_future(self._write(op))
+
+    def get_note_nowait(self, note_id: int) -> Future:
+        def fn(conn: sqlite3.Connection) -> dict[str, Any] | None:
+            row = conn.execute(f"{_SELECT} WHERE id = ?", (note_id,)).fetchone()
+            return dict(zip(_COLUMNS, row)) if row else None
+
+        return self._read(fn)
+
+    async def get_note(self, note_id: int) -> dict[str, Any] | None:
+        return await asyncio.wrap_future(self.get_note_nowait(note_id))
+
+    def notes_after_nowait(self, note_id: int, limit: int = 1000) -> Future:
+        """Notes with an ID above ``note_id``, oldest first, for indexes
+        that follow the database."""
+
+        def fn(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+            rows = conn.execute(f"{_SELECT} WHERE id > ? ORDER BY id LIMIT ?", (note_id, int(limit))).fetchall()
+            return [dict(zip(_COLUMNS, row)) for row in rows]
+
+        return self._read(fn)
+
+    async def notes_after(self, note_id: int, limit: int = 1000) -> list[dict[str, Any]]:
+        return await asyncio.wrap_future(self.notes_after_nowait(note_id, limit))
+
+    async def get_by_title(self, title: str) -> list[dict[str, Any]]:
+        def fn(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+            rows = conn.execute(f"{_SELECT} WHERE title = ? ORDER BY id", (title,)).fetchall()
+            return [dict(zip(_COLUMNS, row)) for row in rows]
+
+        return await asyncio.wrap_future(self._read(fn))
+
+    async def search(
+        self, query: str, limit: int = 10, raw: bool = False, window: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Notes matching every word of ``query``, best first (BM25 with
+        title matches weighted 3x). ``raw=True`` passes ``query`` through
+        as FTS5 syntax (phrases, ``OR``, ``NEAR``, prefixes).
+
+        Only the newest ``window`` matching notes are ranked (default
+        ``search_window``), which bounds the cost of queries that match a
+        large share of all notes; ``window=0`` ranks every match.
+        """
+        match = query if raw else fts_query(query)
+        if not match:
+            return []
+        window = self.search_window if window is None else int(window)
+
+        def fn(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+            rows = conn.execute(_SEARCH, (match, window if window > 0 else -1, int(limit))).fetchall()
+            return [dict(zip(_COLUMNS + ("score",), row)) for row in rows]
+
+        return await asyncio.wrap_future(self._read(fn))
+
+    async def count(self) -> int:
+        return await asyncio.wrap_future(self._read(lambda conn: conn.execute("SELECT count(*) FROM notes").fetchone()[0]))
+
+    def stats_text(self) -> str:
+        return f"path={self.path} writes={self.writes} transactions={self.transactions} queued={self._writes.qsize()}"
+
+    def close(self) -> None:
+        """Commits queued writes and closes every connection."""
+        with self._write_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._writes.put(None)
+        self._writer.join()
+        self._read_pool.shutdown(wait=True)
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
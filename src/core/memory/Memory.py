@@ -1,14 +1,16 @@
-from src.core.memory.Notes import MoltpyNotes
+from .Conversation import MoltpyConversation
+from .Database import MoltpyDatabase
+from .Notes import MoltpyNotes
 
 class MoltpyMemory:
     _instance = None
 
     def __init__(self) -> None:
         self.short_term_memory: dict = {
-            "conversation": [],
+            "conversation": MoltpyConversation(),
             "notes":  MoltpyNotes.get_instance(),
         }
-        self.long_term_memory: dict = {}
+        self.long_term_memory: MoltpyDatabase | None = None
 
     @classmethod
     def get_instance(cls) -> "MoltpyMemory":
@@ -16,5 +18,8 @@ class MoltpyMemory:
             cls._instance = cls()
         return cls._instance
     
+    def get_conversation(self) -> MoltpyConversation:
+        return self.short_term_memory["conversation"]
+
     def get_notes(self) -> MoltpyNotes:
         return self.short_term_memory["notes"].note_get_all()
\ No newline at end of file
@@ -1,12 +1,64 @@
+import hashlib
+import json
+import os
+import threading
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime, timezone
-from src.core.Types import Note, NoteType
+from pathlib import Path
+
+from ..Types import Note, NoteType
+from .Similarity import MoltpySimilarityIndex
+
+
+def content_digest(content: str) -> bytes:
+    """Fixed-size digest used to detect duplicate note contents."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+# Similarity from which two notes usually say the same thing in other words.
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+
+def note_text(title: str, content: str) -> str:
+    """The text a note is compared by in a similarity index."""
+    return f"{title}\n{content}"
+
 
 class MoltpyNotes:
+    """Short-term notes indexed by ID, title and content digest.
+
+    Every note gets a stable ``id`` that is never reused, so IDs stay valid
+    after other notes are deleted. Titles and contents are unique: the title
+    index and a digest of the content make adding, looking up and deleting a
+    note O(1), and each content is hashed once, when it is added.
+
+    With a journal attached (``attach_journal``), every add and delete is
+    appended to a JSONL file, so short-term notes and their IDs survive an
+    exit or crash.
+
+    With a similarity index attached (``attach_similarity``), notes are
+    indexed under ``stm:<id>``. ``note_find_near_duplicate`` reports the
+    indexed text most similar to a candidate note, so callers can decide
+    what to do with it. When ``near_duplicate_threshold`` is above 0,
+    ``note_add`` also rejects notes at least that similar to an indexed
+    text.
+    """
+
     _instance = None
 
     def __init__(self) -> None:
-        self.stm: list = []
+        self.stm: dict[int, Note] = {}
+        self._ids: list[int] = []  # keys of ``stm``, ascending
         self.ltm: list = []
+        self._by_title: dict[str, int] = {}
+        self._by_digest: dict[bytes, int] = {}
+        self._digests: dict[int, bytes] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._journal = None
+        self.journal_path: Path | None = None
+        self._similarity: MoltpySimilarityIndex | None = None
+        self.near_duplicate_threshold = 0.0
 
     @classmethod
     def get_instance(cls) -> "MoltpyNotes":
@@ -14,34 +66,209 @@ class MoltpyNotes:
             cls._instance = cls()
         return cls._instance
 
-    def note_add(self, note_type: NoteType, title: str, content: str) -> bool:
-        for note in self.stm:
-            if note.title == title or note.content == content:
+    def note_add(self, note_type: NoteType, title: str, content: str) -> int | None:
+        """Adds a note and returns its ID, or None if a note with the same
+        title or content already exists. When ``near_duplicate_threshold`` is
+        above 0, near-duplicates are rejected the same way; callers that need
+        to know which note matched use ``note_find_near_duplicate`` first."""
+        digest = content_digest(content)
+        with self._lock:
+            if title in self._by_title or digest in self._by_digest:
+                return None
+            similarity = self._similarity
+            if similarity is not None:
+                text = note_text(title, content)
+                threshold = self.near_duplicate_threshold
+                if threshold > 0 and similarity.near_duplicate(text, threshold) is not None:
+                    return None
+            note_id = self._next_id
+            self._next_id += 1
+            note = Note(id=note_id, type=note_type, title=title, content=content, created_at=datetime.now(timezone.utc))
+            self._insert(note, digest)
+            self._log({"op": "add", **note.model_dump(mode="json")})
+            if similarity is not None:
+                similarity.add(f"stm:{note_id}", text)
+        return note_id
+
+    def _insert(self, note: Note, digest: bytes) -> None:
+        self.stm[note.id] = note
+        if self._ids and self._ids[-1] > note.id:
+            insort(self._ids, note.id)
+        else:
+            self._ids.append(note.id)
+        self._by_title[note.title] = note.id
+        self._by_digest[digest] = note.id
+        self._digests[note.id] = digest
+
+    def _remove(self, note_id: int) -> Note | None:
+        note = self.stm.pop(note_id, None)
+        if note is not None:
+            index = bisect_left(self._ids, note_id)
+            if index < len(self._ids) and self._ids[index] == note_id:
+                del self._ids[index]
+            del self._by_title[note.title]
+            del self._by_digest[self._digests.pop(note_id)]
+            if self._similarity is not None:
+                self._similarity.remove(f"stm:{note_id}")
+        return note
+
+    def note_del_by_id(self, note_id: int) -> bool:
+        with self._lock:
+            if self._remove(note_id) is None:
                 return False
-        note = Note(type=note_type, title=title, content=content, created_at=datetime.now(timezone.utc))
-        self.stm.append(note)
-        return True
-    
-    def note_del_by_id(self, index):
-        if 0 <= index < len(self.stm):
-            del self.stm[index]
+            self._log({"op": "del", "id": note_id})
+            return True
 
-    def note_del_by_title(self, title):
-        self.stm = [note for note in self.stm if note.title != title]
+    def note_del_by_title(self, title: str) -> bool:
+        with self._lock:
+            note_id = self._by_title.get(title)
+            if note_id is None or self._remove(note_id) is None:
+                return False
+            self._log({"op": "del", "id": note_id})
+            return True
+
+    def note_del_through(self, note_id: int) -> int:
+        """Deletes every note with an ID up to ``note_id``; returns how many.
+        With a journal, it is rewritten to hold only the remaining notes."""
+        with self._lock:
+            end = bisect_right(self._ids, note_id)
+            doomed = self._ids[:end]
+            del self._ids[:end]
+            for key in doomed:
+                self._remove(key)
+            if self._journal is not None:
+                self._rewrite_journal()
+        return len(doomed)
 
     def _note_del_all(self):
-        self.stm = []
-
-    def note_get_all(self):
-        return self.stm
-    
-    def note_get_by_id(self, index):
-        if 0 <= index < len(self.stm):
-            return self.stm[index]
-        return None
-    
-    def note_get_by_title(self, title):
-        for note in self.stm:
-            if note.title == title:
-                return note
-        return None
+        with self._lock:
+            if self._similarity is not None:
+                for note_id in self.stm:
+                    self._similarity.remove(f"stm:{note_id}")
+            self.stm = {}
+            self._ids = []
+            self._by_title = {}
+            self._by_digest = {}
+            self._digests = {}
+            if self._journal is not None:
+                self._rewrite_journal()
+
+    def ensure_next_id(self, next_id: int) -> None:
+        """Never hands out IDs below ``next_id``, e.g. IDs already recorded
+        in a checkpoint whose journal was lost."""
+        with self._lock:
+            self._next_id = max(self._next_id, int(next_id))
+
+    def attach_journal(self, path: str | Path) -> int:
+        """Replays the journal at ``path`` into this store and appends
+        later changes to it; returns the number of notes restored. Lines
+        that cannot be parsed, such as a line cut off by a crash, are
+        skipped."""
+        path = Path(path)
+        restored = 0
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            try:
+                with path.open("r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                            op = entry.pop("op")
+                            if op == "add":
+                                note = Note(**entry)
+                                digest = content_digest(note.content)
+                                if not (note.id in self.stm or note.title in self._by_title or digest in self._by_digest):
+                                    self._insert(note, digest)
+                                self._next_id = max(self._next_id, note.id + 1)
+                            elif op == "del":
+                                self._remove(int(entry["id"]))
+                            elif op == "next_id":
+                                self._next_id = max(self._next_id, int(entry["id"]))
+                        except (ValueError, TypeError, KeyError):
+                            continue
+            except FileNotFoundError:
+                pass
+            restored = len(self.stm)
+            self.journal_path = path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._rewrite_journal()
+        return restored
+
+    def note_find_near_duplicate(
+        self, title: str, content: str, threshold: float = NEAR_DUPLICATE_THRESHOLD
+    ) -> tuple[str, float] | None:
+        """The indexed text most similar to a note with ``title`` and
+        ``content`` as ``(key, cosine)``, e.g. ``("stm:12", 0.91)``, if its
+        similarity reaches ``threshold``. None without a similarity index."""
+        similarity = self._similarity
+        if similarity is None:
+            return None
+        return similarity.near_duplicate(note_text(title, content), threshold)
+
+    def attach_similarity(self, index: MoltpySimilarityIndex, threshold: float = 0.0) -> None:
+        """Keeps ``index`` in step with the notes; a ``threshold`` above 0
+        turns on near-duplicate rejection in ``note_add``. Index entries of
+        notes that no longer exist, e.g. from a persisted index, are dropped."""
+        with self._lock:
+            self._similarity = index
+            self.near_duplicate_threshold = float(threshold)
+            current = {f"stm:{note_id}" for note_id in self.stm}
+            for key in index.keys():
+                if key.startswith("stm:") and key not in current:
+                    index.remove(key)
+            index.add_many(
+                (f"stm:{note.id}", note_text(note.title, note.content))
+                for note in self.stm.values()
+                if f"stm:{note.id}" not in index
+            )
+
+    def _log(self, entry: dict) -> None:
+        if self._journal is not None:
+            self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._journal.flush()
+
+    def _rewrite_journal(self) -> None:
+        """Replaces the journal with the current notes; called with the lock held."""
+        if self._journal is not None:
+            self._journal.close()
+        path = self.journal_path
+        partial = path.with_name(path.name + ".tmp")
+        with partial.open("w", encoding="utf-8") as f:
+            f.write(json.dumps({"op": "next_id", "id": self._next_id}) + "\n")
+            for note in self.stm.values():
+                f.write(json.dumps({"op": "add", **note.model_dump(mode="json")}, ensure_ascii=False) + "\n")
+        os.replace(partial, path)
+        self._journal = path.open("a", encoding="utf-8")
+
+    def close_journal(self) -> None:
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def note_get_all(self) -> list[Note]:
+        """Notes in the order they were added."""
+        return list(self.stm.values())
+
+    def note_get_by_id(self, note_id: int) -> Note | None:
+        return self.stm.get(note_id)
+
+    def note_get_after(self, note_id: int, limit: int | None = None) -> list[Note]:
+        """Notes with an ID above ``note_id``, oldest first; at most
+        ``limit`` of them. Only the returned notes are visited."""
+        with self._lock:
+            start = bisect_right(self._ids, note_id)
+            end = len(self._ids) if limit is None else start + max(0, limit)
+            return [self.stm[key] for key in self._ids[start:end]]
+
+    def note_get_by_title(self, title: str) -> Note | None:
+        note_id = self._by_title.get(title)
+        return None if note_id is None else self.stm.get(note_id)
+
+    def note_has_content(self, content: str) -> bool:
+        return content_digest(content) in self._by_digest
+
+    def __len__(self) -> int:
+        return len(self.stm)
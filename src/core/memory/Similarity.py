@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Iterable
+
+_WORD = re.compile(r"\w+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has in into is it its of on or that the this to was were will with".split()
+)
+
+
+def text_terms(text: str) -> Counter[str]:
+    """Lowercase word counts without stopwords and single characters."""
+    words = (word.lower() for word in _WORD.findall(text))
+    return Counter(word for word in words if len(word) > 1 and word not in STOPWORDS)
+
+
+class MoltpySimilarityIndex:
+    """In-process TF-IDF similarity over texts such as notes.
+
+    Each text becomes a sparse vector of its ``max_terms`` highest TF-IDF
+    weights (sublinear term frequency), normalized to unit length, so the
+    score of two texts is their cosine similarity. Vectors are stored in an
+    inverted index: adding or removing a text only touches the postings of
+    its own terms. Document frequencies count every text ever added and are
+    never decremented, so existing vectors keep their weights; a vector is
+    weighted with the frequencies known when it is added.
+
+    ``similar`` accumulates scores from the query's shortest postings
+    first; those hold its rarest terms, which weigh most. Once
+    ``max_postings`` entries have been read, the ``max_candidates`` best
+    texts so far are kept and longer postings only add to their scores,
+    which bounds a query's cost no matter how many texts are indexed.
+    Texts that share only common terms with the query may be missed; they
+    would score low anyway.
+
+    Keys are strings, so the index can cover several stores at once, e.g.
+    ``stm:12`` and ``ltm:345``.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self, path: str | Path | None = None, max_terms: int = 48, max_postings: int = 2048, max_candidates: int = 256
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.max_terms = max(1, int(max_terms))
+        self.max_postings = max(1, int(max_postings))
+        self.max_candidates = max(1, int(max_candidates))
+        self.meta: dict[str, Any] = {}  # persisted with the index, e.g. sync positions
+        self.dirty = False  # changed since the last load or save
+        self._df: Counter[str] = Counter()
+        self._seen = 0
+        self._vectors: dict[str, dict[str, float]] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._vectors
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return list(self._vectors)
+
+    def _vector(self, counts: Counter[str]) -> dict[str, float]:
+        df = self._df
+        seen = self._seen + 1
+        weights = [
+            (term, (1.0 + math.log(tf)) * (math.log(seen / (1 + df[term])) + 1.0)) for term, tf in counts.items()
+        ]
+        if len(weights) > self.max_terms:
+            weights = heapq.nlargest(self.max_terms, weights, key=itemgetter(1))
+        norm = math.sqrt(sum(weight * weight for _term, weight in weights))
+        if norm <= 0.0:
+            return {}
+        return {term: weight / norm for term, weight in weights}
+
+    def _insert(self, key: str, vector: dict[str, float]) -> None:
+        self._vectors[key] = vector
+        for term, weight in vector.items():
+            self._postings.setdefault(term, {})[key] = weight
+
+    def _remove(self, key: str) -> bool:
+        vector = self._vectors.pop(key, None)
+        if vector is None:
+            return False
+        for term in vector:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self._postings[term]
+        return True
+
+    def add(self, key: str, text: str) -> None:
+        """Indexes ``text`` under ``key``, replacing any previous text."""
+        self.add_many([(key, text)])
+
+    def add_many(self, items: Iterable[tuple[str, str]]) -> int:
+        """Indexes ``(key, text)`` pairs; returns how many. Frequencies are
+        updated for the whole batch before weighting, so a bulk load weighs
+        every text as if it had been added last."""
+        counted = [(key, text_terms(text)) for key, text in items]
+        with self._lock:
+            for _key, counts in counted:
+                self._df.update(counts.keys())
+            self._seen += len(counted)
+            for key, counts in counted:
+                self._remove(key)
+                self._insert(key, self._vector(counts))
+            self.dirty = self.dirty or bool(counted)
+        return len(counted)
+
+    def remove(self, key: str) -> bool:
+        with self._lock:
+            removed = self._remove(key)
+            self.dirty = self.dirty or removed
+            return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._df.clear()
+            self._seen = 0
+            self._vectors.clear()
+            self._postings.clear()
+            self.meta.clear()
+            self.dirty = True
+
+    def similar(self, text: str, k: int = 5, exclude: str | None = None) -> list[tuple[str, float]]:
+        """Top ``k`` ``(key, cosine)`` pairs for ``text``, best first."""
+        if k <= 0:
+            return []
+        counts = text_terms(text)
+        with self._lock:
+            query = self._vector(counts)
+            lists = [(weight, self._postings[term]) for term, weight in query.items() if term in self._postings]
+            lists.sort(key=lambda item: len(item[1]))
+            scores: dict[str, float] = {}
+            budget = self.max_postings
+            for weight, posting in lists:
+                if len(posting) <= budget or not scores:
+                    # Newest entries first when even the shortest list is too long.
+                    entries = posting.items() if len(posting) <= budget else islice(reversed(posting.items()), budget)
+                    budget -= min(len(posting), budget)
+                    get_score = scores.get
+                    for key, value in entries:
+                        scores[key] = get_score(key, 0.0) + weight * value
+                else:
+                    if len(scores) > self.max_candidates:
+                        scores = dict(heapq.nlargest(self.max_candidates, scores.items(), key=itemgetter(1)))
+                    get = posting.get
+                    for key in scores:
+                        value = get(key)
+                        if value is not None:
+                            scores[key] += weight * value
+        if exclude is not None:
+            scores.pop(exclude, None)
+        return heapq.nlargest(k, scores.items(), key=itemgetter(1))
+
+    def near_duplicate(self, text: str, threshold: float, exclude: str | None = None) -> tuple[str, float] | None:
+        """The most similar indexed text if its cosine reaches ``threshold``."""
+        best = self.similar(text, 1, exclude=exclude)
+        if best and best[0][1] >= threshold:
+            return best[0]
+        return None
+
+    def stats_text(self) -> str:
+        return f"texts={len(self._vectors)} terms={len(self._postings)} vocabulary={len(self._df)}"
+
+    def load(self) -> "MoltpySimilarityIndex":
+        """Reads the persisted index; a missing or unreadable file leaves it empty."""
+        if self.path is None:
+            return self
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if not isinstance(payload, dict) or payload.get("version") != self.VERSION:
+            return self
+        with self._lock:
+            self._df = Counter(payload.get("df") or {})
+            self._seen = int(payload.get("seen") or 0)
+            self.meta = dict(payload.get("meta") or {})
+            self._vectors.clear()
+            self._postings.clear()
+            for key, vector in (payload.get("vectors") or {}).items():
+                if isinstance(vector, dict):
+                    self._insert(key, vector)
+            self.dirty = False
+        return self
+
+    def save(self) -> None:
+        """Writes the index and replaces the previous file atomically."""
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {
+                "version": self.VERSION,
+                "seen": self._seen,
+                "meta": dict(self.meta),
+                "df": dict(self._df),
+                "vectors": dict(self._vectors),
+            }
+            self.dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(self.path.name + ".tmp")
+        with partial.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(partial, self.path)
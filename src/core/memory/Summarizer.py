@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+from ..Types import Note, NoteType
+from .Database import MoltpyDatabase
+from .Notes import MoltpyNotes
+
+# notes -> (title, content) of their summary
+SummarizeFn = Callable[[list[Note]], tuple[str, str]]
+
+
+def extractive_summary(notes: list[Note], line_chars: int = 200) -> tuple[str, str]:
+    """One line per note: its title and the first line of its content.
+    Deterministic, so summarizing the same chunk twice yields the same text."""
+    day = notes[0].created_at.date().isoformat() if notes[0].created_at else "undated"
+    title = f"Notes {day} #{notes[0].id}-{notes[-1].id}"
+    lines = []
+    for note in notes:
+        first = note.content.strip().splitlines()[0] if note.content.strip() else ""
+        if len(first) > line_chars:
+            first = first[: line_chars - 3].rstrip() + "..."
+        kind = "" if note.type == NoteType.TEXT else f"[{NoteType(note.type).value}] "
+        lines.append(f"- {kind}{note.title}: {first}" if first else f"- {kind}{note.title}")
+    return title, "\n".join(lines)
+
+
+@dataclass
+class SummaryCheckpoint:
+    """Progress of the summarizer: every note up to ``last_id`` is in
+    long-term memory."""
+
+    day: str = ""
+    last_id: int = 0
+    chunks: int = 0
+    notes: int = 0
+
+
+class MoltpyNoteSummarizer:
+    """Moves short-term notes into long-term memory in chunks.
+
+    ``run`` summarizes every complete chunk of ``chunk_size`` notes that is
+    not yet summarized, so the work is spread over the day; ``final=True``
+    also takes the last, partial chunk. Each chunk becomes one long-term
+    note, and the checkpoint advances after that note is committed. A crash
+    between the two only repeats the last chunk, whose summary is then
+    skipped as a duplicate by the database. With the notes journal, no note
+    is lost across restarts.
+
+    When the day changes, the rest of the previous day is summarized and
+    the summarized notes are removed from short-term memory.
+    """
+
+    def __init__(
+        self,
+        notes: MoltpyNotes,
+        database: MoltpyDatabase,
+        checkpoint_path: str | Path,
+        chunk_size: int = 50,
+        summarize: SummarizeFn | None = None,
+    ) -> None:
+        self.notes = notes
+        self.database = database
+        self.checkpoint_path = Path(checkpoint_path)
+        self.chunk_size = max(1, int(chunk_size))
+        self.summarize = summarize or extractive_summary
+        self._lock = threading.Lock()
+        self.checkpoint = self._load()
+        notes.ensure_next_id(self.checkpoint.last_id + 1)
+
+    def _load(self) -> SummaryCheckpoint:
+        try:
+            with self.checkpoint_path.open("r", encoding="utf-8") as f:
+                payload = json.load(f)
+            return SummaryCheckpoint(**{key: payload[key] for key in asdict(SummaryCheckpoint()) if key in payload})
+        except (OSError, ValueError, TypeError):
+            return SummaryCheckpoint(day=date.today().isoformat())
+
+    def _save(self) -> None:
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with partial.open("w", encoding="utf-8") as f:
+            json.dump(asdict(self.checkpoint), f)
+        os.replace(partial, self.checkpoint_path)
+
+    def pending(self) -> int:
+        return len(self.notes.note_get_after(self.checkpoint.last_id))
+
+    def run(self, final: bool = False, today: date | None = None) -> int:
+        """Summarizes pending chunks and returns the number of notes moved
+        to long-term memory. Blocks on database commits, so call it from a
+        worker thread, such as a heartbeat job."""
+        today = today or date.today()
+        with self._lock:
+            moved = 0
+            if self.checkpoint.day != today.isoformat():
+                # Day end: everything from earlier days, including a partial chunk.
+                moved += self._drain(final=True, before=today)
+                self.notes.note_del_through(self.checkpoint.last_id)
+                self.checkpoint.day = today.isoformat()
+                self._save()
+            moved += self._drain(final=final)
+        return moved
+
+    def _drain(self, final: bool, before: date | None = None) -> int:
+        moved = 0
+        while True:
+            chunk = self.notes.note_get_after(self.checkpoint.last_id, limit=self.chunk_size)
+            if before is not None:
+                for index, note in enumerate(chunk):
+                    if note.created_at is not None and note.created_at.astimezone().date() >= before:
+                        chunk = chunk[:index]
+                        break
+            if not chunk or (len(chunk) < self.chunk_size and not final):
+                return moved
+            title, content = self.summarize(chunk)
+            self.database.add_note_nowait("summary", title, content, source=f"stm:{chunk[0].id}-{chunk[-1].id}").result()
+            self.checkpoint.last_id = chunk[-1].id
+            self.checkpoint.chunks += 1
+            self.checkpoint.notes += len(chunk)
+            self._save()
+            moved += len(chunk)
+
+    def stats_text(self) -> str:
+        checkpoint = self.checkpoint
+        return (
+            f"day={checkpoint.day} last_id={checkpoint.last_id} pending={self.pending()} "
+            f"summaries={checkpoint.chunks} notes={checkpoint.notes}"
+        )
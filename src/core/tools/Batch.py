@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Iterable
+
+from .Executor import MoltpyToolExecutor, ToolResult, ToolStatus
+from .MoltpyTool import MoltpyTool
+
+
+class MoltpyToolBatchRunner:
+    """Runs independent tool calls concurrently from asyncio code.
+
+    Calls are ``{"name": ..., "arguments": {...}}`` dicts as produced by
+    ``MoltpyTool.tool_call``. Handlers run on the executor's thread pool, so a
+    batch takes about as long as its slowest call rather than the sum.
+
+    Each capability named in a manifest's ``runtime.requires`` is a shared
+    limit: at most ``capability_limits[name]`` (``default_capability_limit``
+    when unlisted) calls needing it run at once, across every batch driven by
+    this runner. The executor's per-tool limit still applies. ``timeout_ms``
+    covers waiting for those limits as well as running the handler.
+
+    The asyncio semaphores bind to the first event loop that uses them, so
+    create one runner per loop.
+    """
+
+    def __init__(
+        self,
+        executor: MoltpyToolExecutor,
+        capability_limits: dict[str, int] | None = None,
+        default_capability_limit: int = 4,
+    ) -> None:
+        self.executor = executor
+        self.capability_limits = {name: max(1, int(limit)) for name, limit in (capability_limits or {}).items()}
+        self.default_capability_limit = max(1, int(default_capability_limit))
+        self._capabilities: dict[str, asyncio.Semaphore] = {}
+
+    def _capability(self, name: str) -> asyncio.Semaphore:
+        semaphore = self._capabilities.get(name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.capability_limits.get(name, self.default_capability_limit))
+            self._capabilities[name] = semaphore
+        return semaphore
+
+    async def run(self, call: dict[str, Any]) -> ToolResult:
+        """Runs one call dict. Cancelling the awaiting task cancels the call,
+        counts it as ``cancelled`` and re-raises ``CancelledError``, so
+        ``asyncio.timeout`` and task groups around it keep working."""
+        return await self.run_tool(call.get("name", ""), call.get("arguments") or {})
+
+    async def run_tool(self, name: str | MoltpyTool, arguments: dict[str, Any] | None = None) -> ToolResult:
+        executor = self.executor
+        started_at = time.time()
+        started = time.perf_counter()
+        prepared = executor.prepare(name, arguments)
+        if isinstance(prepared, ToolResult):
+            return executor.finish(prepared, started_at, started)
+        tool, validated, handler = prepared
+        hit = executor.cached_result(tool, validated)
+        if hit is not None:
+            return executor.finish(hit, started_at, started)
+        timeout = executor.timeout_for(tool)
+        held: list[asyncio.Semaphore] = []
+        future: Future | None = None
+        try:
+            async with asyncio.timeout(timeout):
+                for capability in sorted(set(tool.requires)):
+                    semaphore = self._capability(capability)
+                    await semaphore.acquire()
+                    held.append(semaphore)
+                future = await self._start(tool, validated, handler)
+                output = await asyncio.wrap_future(future)
+        except TimeoutError:
+            if future is None:
+                result = ToolResult(tool.tool_name, ToolStatus.BUSY, error="Concurrency limit reached", arguments=validated)
+            else:
+                result = ToolResult(
+                    tool.tool_name,
+                    ToolStatus.TIMEOUT,
+                    error=f"Timed out after {timeout * 1000.0:.0f} ms",
+                    arguments=validated,
+                )
+            return executor.finish(result, started_at, started)
+        except asyncio.CancelledError:
+            if future is not None:
+                future.cancel()
+            result = ToolResult(tool.tool_name, ToolStatus.CANCELLED, error="Cancelled", arguments=validated)
+            executor.finish(result, started_at, started)
+            raise
+        except Exception as exc:
+            result = ToolResult(tool.tool_name, ToolStatus.ERROR, error=f"{type(exc).__name__}: {exc}", arguments=validated)
+            return executor.finish(result, started_at, started)
+        finally:
+            self._release(held, future)
+        return executor.finish(executor.checked(tool, validated, output), started_at, started)
+
+    async def _start(self, tool: MoltpyTool, arguments: dict[str, Any], handler: Any) -> Future:
+        """Starts the call once the tool has a free thread-side slot, waking
+        up when the executor releases one."""
+        executor = self.executor
+        loop = asyncio.get_running_loop()
+        while True:
+            future = executor.try_start(tool, arguments, handler)
+            if future is not None:
+                return future
+            freed = loop.create_future()
+
+            def wake() -> None:
+                try:
+                    loop.call_soon_threadsafe(lambda: freed.done() or freed.set_result(None))
+                except RuntimeError:
+                    pass  # the loop has closed
+
+            cancel = executor.notify_slot_free(tool, wake)
+            try:
+                # A slot released before the waiter was registered is not missed.
+                future = executor.try_start(tool, arguments, handler)
+                if future is not None:
+                    return future
+                await freed
+            finally:
+                cancel()
+
+    @staticmethod
+    def _release(held: list[asyncio.Semaphore], future: Future | None) -> None:
+        """Frees capability slots once the handler thread has really finished;
+        a timed-out handler keeps its capabilities until it returns."""
+        if not held:
+            return
+        if future is None or future.done():
+            for semaphore in held:
+                semaphore.release()
+            return
+        loop = asyncio.get_running_loop()
+
+        def release_later(_: Future) -> None:
+            try:
+                for semaphore in held:
+                    loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                pass  # the loop has closed; its semaphores are gone with it
+
+        future.add_done_callback(release_later)
+
+    def submit(self, calls: Iterable[dict[str, Any]]) -> list[asyncio.Task]:
+        """Starts every call as its own task; cancel a task to cancel its call.
+        ``collect`` turns a finished task into its result."""
+        return [asyncio.create_task(self.run(call), name=f"moltpy-tool:{call.get('name', '')}") for call in calls]
+
+    @staticmethod
+    def collect(task: asyncio.Task, call: dict[str, Any]) -> ToolResult:
+        """Result of a finished ``submit`` task; a cancelled task becomes a
+        ``cancelled`` result."""
+        if task.cancelled():
+            name = call.get("name", "")
+            return ToolResult(str(name), ToolStatus.CANCELLED, error="Cancelled", arguments=call.get("arguments") or {})
+        return task.result()
+
+    async def run_batch(self, calls: Iterable[dict[str, Any]]) -> list[ToolResult]:
+        """Runs ``calls`` concurrently; results are in the order of ``calls``.
+        Cancelling the caller cancels every call and propagates."""
+        calls = list(calls)
+        tasks = self.submit(calls)
+        try:
+            if tasks:
+                await asyncio.wait(tasks)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+        return [self.collect(task, call) for task, call in zip(tasks, calls)]
+
+    async def as_completed(self, calls: Iterable[dict[str, Any]]) -> AsyncIterator[tuple[int, ToolResult]]:
+        """Yields ``(index, result)`` as each call finishes. Closing the
+        iterator early cancels the calls still running."""
+        calls = list(calls)
+        tasks = self.submit(calls)
+        index_of = {task: index for index, task in enumerate(tasks)}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=index_of.__getitem__):
+                    index = index_of[task]
+                    yield index, self.collect(task, calls[index])
+        finally:
+            for task in pending:
+                task.cancel()
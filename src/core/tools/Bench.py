@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from .Executor import MoltpyToolExecutor, ToolResult, ToolStatus
+from .MoltpyTool import MoltpyTool
+from .ProcessPool import MoltpyToolProcessPool, _rss_bytes
+from .ToolRegistry import MoltpyToolRegistry
+
+
+@dataclass
+class ToolBenchResult:
+    """Latency of one tool over its examples; times in milliseconds."""
+
+    tool_name: str
+    calls: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    throughput: float  # calls per second, calls run back to back
+    peak_rss_mb: float
+    isolated: bool = False
+    last_error: str | None = None
+
+
+@dataclass
+class ToolBenchRegression:
+    tool_name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else math.inf
+
+    def text(self) -> str:
+        return (
+            f"{self.tool_name}: {self.metric} {self.baseline:.3f} -> {self.current:.3f} "
+            f"({(self.ratio - 1.0) * 100.0:+.0f}%)"
+        )
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, int(math.ceil(fraction * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class MoltpyToolBench:
+    """Runs each tool's manifest ``examples`` through validation and
+    execution, the same path an agent's calls take.
+
+    Every measured round calls each example once, after ``warmup`` rounds
+    that are not recorded. The result cache is bypassed so cacheable tools
+    are measured too. Isolated tools run in ``process_pool`` when one is
+    given; their peak RSS is the worker's, otherwise it is this process's.
+
+    A handler that times out keeps running on its thread, so the executor has
+    a spare thread and the tool's remaining rounds are skipped; later tools
+    are not measured behind it.
+    """
+
+    def __init__(
+        self,
+        registry: MoltpyToolRegistry,
+        runs: int = 50,
+        warmup: int = 5,
+        default_timeout_ms: int = 30_000,
+        process_pool: MoltpyToolProcessPool | None = None,
+    ) -> None:
+        self.registry = registry
+        self.runs = max(1, int(runs))
+        self.warmup = max(0, int(warmup))
+        self.process_pool = process_pool
+        self.skipped: list[str] = []
+        self.executor = MoltpyToolExecutor(
+            registry,
+            max_workers=2,
+            per_tool_limit=1,
+            default_timeout_ms=default_timeout_ms,
+            result_cache=None,
+            process_pool=process_pool,
+        )
+
+    def run(self, names: Iterable[str] = ()) -> list[ToolBenchResult]:
+        wanted = set(names)
+        results: list[ToolBenchResult] = []
+        self.skipped = []
+        for tool in sorted(self.registry.all(), key=lambda tool: tool.tool_name):
+            if wanted and tool.tool_name not in wanted and tool.call_name not in wanted:
+                continue
+            inputs = [example.get("input") or {} for example in tool.examples if isinstance(example, dict)]
+            if not inputs or not tool.handler:
+                self.skipped.append(tool.tool_name)
+                continue
+            results.append(self.run_tool(tool, inputs))
+        return results
+
+    def run_tool(self, tool: MoltpyTool, inputs: list[dict[str, Any]]) -> ToolBenchResult:
+        execute = self.executor.execute
+        timings: list[float] = []
+        errors = 0
+        last_error = None
+
+        def record(result: ToolResult) -> None:
+            nonlocal errors, last_error
+            timings.append(result.elapsed_ms)
+            if not result.ok:
+                errors += 1
+                last_error = f"{result.status}: {result.error}"
+
+        timed_out = False
+        for _ in range(self.warmup):
+            for arguments in inputs:
+                result = execute(tool, arguments)
+                if result.status == ToolStatus.TIMEOUT:
+                    record(result)
+                    timed_out = True
+                    break
+            if timed_out:
+                break
+        pool = self.process_pool if tool.isolated else None
+        if pool is not None:
+            pool.reset_peak()
+        peak_rss = _rss_bytes()
+        started = time.perf_counter()
+        for _ in range(0 if timed_out else self.runs):
+            for arguments in inputs:
+                result = execute(tool, arguments)
+                record(result)
+                if result.status == ToolStatus.TIMEOUT:
+                    timed_out = True
+                    break
+            if pool is None:
+                peak_rss = max(peak_rss, _rss_bytes())
+            if timed_out:
+                break
+        elapsed = time.perf_counter() - started
+        if pool is not None:
+            peak_rss = pool.peak_rss
+        timings.sort()
+        return ToolBenchResult(
+            tool_name=tool.tool_name,
+            calls=len(timings),
+            errors=errors,
+            p50_ms=percentile(timings, 0.50),
+            p95_ms=percentile(timings, 0.95),
+            p99_ms=percentile(timings, 0.99),
+            mean_ms=sum(timings) / len(timings),
+            throughput=len(timings) / elapsed if elapsed > 0 else 0.0,
+            peak_rss_mb=peak_rss / (1024 * 1024),
+            isolated=pool is not None,
+            last_error=last_error,
+        )
+
+    def shutdown(self) -> None:
+        self.executor.shutdown()
+
+
+BASELINE_VERSION = 1
+
+
+def save_baseline(path: Path, results: list[ToolBenchResult], runs: int) -> None:
+    payload = {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "runs": runs,
+        "tools": {result.tool_name: asdict(result) for result in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".tmp")
+    with partial.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+    os.replace(partial, path)
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as f:
+        payload = json.load(f)
+    if not isinstance(payload, dict) or payload.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported tool bench baseline: {path}")
+    tools = payload.get("tools")
+    return tools if isinstance(tools, dict) else {}
+
+
+def compare(
+    results: list[ToolBenchResult],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float = 0.2,
+    min_delta_ms: float = 0.05,
+) -> list[ToolBenchRegression]:
+    """Regressions against ``baseline``: a latency percentile that grew by
+    more than ``threshold`` (a fraction) and by more than ``min_delta_ms``,
+    which keeps sub-millisecond jitter out, or a tool that started failing."""
+    regressions: list[ToolBenchRegression] = []
+    for result in results:
+        before = baseline.get(result.tool_name)
+        if not isinstance(before, dict):
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            old = float(before.get(metric) or 0.0)
+            new = getattr(result, metric)
+            if new - old > min_delta_ms and new > old * (1.0 + threshold):
+                regressions.append(ToolBenchRegression(result.tool_name, metric, old, new))
+        if result.errors and not before.get("errors"):
+            regressions.append(ToolBenchRegression(result.tool_name, "errors", 0.0, float(result.errors)))
+    return regressions
+
+
+def format_table(results: list[ToolBenchResult]) -> str:
+    lines = [
+        f"{'tool':<24} {'calls':>6} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'calls/s':>9} {'peak RSS':>9}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.tool_name[:24]:<24} {result.calls:>6} {result.errors:>4} {result.p50_ms:>9.3f} "
+            f"{result.p95_ms:>9.3f} {result.p99_ms:>9.3f} {result.throughput:>9.0f} "
+            f"{result.peak_rss_mb:>6.1f} MB" + (" (worker)" if result.isolated else "")
+        )
+    return "\n".join(lines)
+
+
+def run_bench_cli(argv: list[str], runtime: Any) -> int:
+    """``moltpy bench tools``; ``runtime`` must be initialized."""
+    import argparse
+
+    default_baseline = runtime.base_path / "bench" / "tools.json"
+    parser = argparse.ArgumentParser(prog="moltpy bench tools", description="Benchmark tools on their manifest examples.")
+    parser.add_argument("tools", nargs="*", help="Only these tools (tool_name or call name).")
+    parser.add_argument("--runs", type=int, default=50, help="Measured rounds over each tool's examples.")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured rounds before measuring.")
+    parser.add_argument("--baseline", type=Path, default=default_baseline, help=f"Baseline file (default: {default_baseline}).")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument("--compare", action="store_true", help="Compare with the baseline; exit 1 on regressions.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown as a fraction (default 0.2).")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args(argv)
+
+    runtime_cfg = runtime.config.get("runtime", {}) or {}
+    bench = MoltpyToolBench(
+        runtime.tools,
+        runs=args.runs,
+        warmup=args.warmup,
+        default_timeout_ms=int(runtime_cfg.get("tool_timeout_ms", 30_000)),
+        process_pool=runtime.tool_process_pool,
+    )
+    try:
+        results = bench.run(args.tools)
+    finally:
+        bench.shutdown()
+
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        print(format_table(results))
+        if bench.skipped:
+            print(f"skipped (no examples or handler): {', '.join(bench.skipped)}")
+        for result in results:
+            if result.last_error:
+                print(f"{result.tool_name}: {result.errors} failed, last {result.last_error}", file=sys.stderr)
+
+    status = 0
+    if args.compare:
+        try:
+            baseline = load_baseline(args.baseline)
+        except (OSError, ValueError) as exc:
+            print(f"Cannot read baseline {args.baseline}: {exc}", file=sys.stderr)
+            return 2
+        regressions = compare(results, baseline, threshold=args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression.text()}", file=sys.stderr)
+        missing = sorted(set(baseline) - {result.tool_name for result in results})
+        if missing and not args.tools:
+            print(f"not in this run: {', '.join(missing)}", file=sys.stderr)
+        if regressions:
+            status = 1
+        elif not args.json:
+            print(f"no regressions against {args.baseline}")
+    if args.save:
+        save_baseline(args.baseline, results, args.runs)
+        if not args.json:
+            print(f"baseline written to {args.baseline}")
+    return status
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
+
+from .MoltpyTool import MoltpyTool
+from .ResultCache import MoltpyToolResultCache
+from .Schema import SchemaValidationError
+from .ToolRegistry import MoltpyToolRegistry
+
+if TYPE_CHECKING:
+    from .ProcessPool import MoltpyToolProcessPool
+
+
+class ToolStatus:
+    OK = "ok"
+    ERROR = "error"
+    INVALID = "invalid"
+    TIMEOUT = "timeout"
+    BUSY = "busy"
+    CANCELLED = "cancelled"
+    NOT_FOUND = "not_found"
+
+
+@dataclass
+class ToolResult:
+    """Outcome of one tool invocation."""
+
+    tool_name: str
+    status: str
+    output: Any = None
+    error: str | None = None
+    arguments: dict[str, Any] = field(default_factory=dict)
+    started_at: float = 0.0
+    elapsed_ms: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status == ToolStatus.OK
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "tool_name": self.tool_name,
+            "status": self.status,
+            "output": self.output,
+            "error": self.error,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+            "cached": self.cached,
+        }
+
+
+class MoltpyToolExecutor:
+    """Runs tool handlers on a shared thread pool.
+
+    ``runtime.handler`` (``"package.module:function"``) is imported once and
+    cached. Each call is bounded by ``runtime.timeout_ms``; a handler that
+    overruns is reported as a timeout, although its thread keeps the slot
+    until the function returns, since Python threads cannot be killed. At
+    most ``runtime.max_concurrency`` calls of one tool (``per_tool_limit``
+    by default) run at a time; a call waits for a slot within its timeout and
+    is reported as busy otherwise.
+
+    With a ``result_cache``, successful results of ``runtime.cacheable``
+    tools are memoized by their validated arguments. With a
+    ``process_pool``, isolated tools (see ``MoltpyTool.isolated``) are never
+    imported here; their calls are forwarded to a worker process.
+    """
+
+    def __init__(
+        self,
+        registry: MoltpyToolRegistry,
+        max_workers: int = 8,
+        per_tool_limit: int = 4,
+        default_timeout_ms: int = 30_000,
+        result_cache: MoltpyToolResultCache | None = None,
+        process_pool: MoltpyToolProcessPool | None = None,
+    ) -> None:
+        self.registry = registry
+        self.result_cache = result_cache
+        self.process_pool = process_pool
+        self.max_workers = max(1, int(max_workers))
+        self.per_tool_limit = max(1, int(per_tool_limit))
+        self.default_timeout_ms = max(1, int(default_timeout_ms))
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="moltpy-tool")
+        self._handlers: dict[str, Callable[..., Any]] = {}
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._slot_waiters: dict[str, list[Callable[[], None]]] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.cancelled = 0
+
+    def resolve(self, handler: str) -> Callable[..., Any]:
+        """Imports ``module:function`` on first use and caches the callable."""
+        cached = self._handlers.get(handler)
+        if cached is not None:
+            return cached
+        module_name, sep, attr = handler.partition(":")
+        if not sep or not module_name or not attr:
+            raise ValueError(f"Invalid tool handler {handler!r}; expected 'module:function'.")
+        target: Any = importlib.import_module(module_name)
+        for part in attr.split("."):
+            target = getattr(target, part)
+        if not callable(target):
+            raise TypeError(f"Tool handler {handler!r} is not callable.")
+        with self._lock:
+            self._handlers[handler] = target
+        return target
+
+    def invalidate(self, handler: str | None = None) -> None:
+        """Forgets cached handlers (all of them when ``handler`` is None)."""
+        with self._lock:
+            if handler is None:
+                self._handlers.clear()
+            else:
+                self._handlers.pop(handler, None)
+
+    def swap_registry(self, registry: MoltpyToolRegistry, stale: list[MoltpyTool]) -> None:
+        """Serves later calls from ``registry`` and drops what was derived
+        from the ``stale`` tools: resolved handlers, concurrency slots and
+        cached results. Calls already running keep the tool they started
+        with."""
+        with self._lock:
+            self.registry = registry
+            for tool in stale:
+                self._slots.pop(tool.tool_name, None)
+                if tool.handler:
+                    self._handlers.pop(tool.handler, None)
+        if self.result_cache is not None:
+            for tool in stale:
+                self.result_cache.invalidate(tool.tool_name)
+
+    def timeout_for(self, tool: MoltpyTool) -> float:
+        return (tool.timeout_ms or self.default_timeout_ms) / 1000.0
+
+    def _slot(self, tool: MoltpyTool) -> threading.BoundedSemaphore:
+        slot = self._slots.get(tool.tool_name)
+        if slot is None:
+            with self._lock:
+                slot = self._slots.get(tool.tool_name)
+                if slot is None:
+                    slot = threading.BoundedSemaphore(tool.max_concurrency or self.per_tool_limit)
+                    self._slots[tool.tool_name] = slot
+        return slot
+
+    def prepare(
+        self,
+        name: str | MoltpyTool,
+        arguments: dict[str, Any] | None,
+    ) -> tuple[MoltpyTool, dict[str, Any], Callable[..., Any]] | ToolResult:
+        """Looks up, validates and resolves a call; a ``ToolResult`` means it
+        failed before reaching the handler."""
+        arguments = arguments or {}
+        tool = name if isinstance(name, MoltpyTool) else self.registry.find(name)
+        if tool is None:
+            return ToolResult(str(name), ToolStatus.NOT_FOUND, error=f"Unknown tool: {name}", arguments=arguments)
+        try:
+            validated = tool.validate_input(arguments)
+        except SchemaValidationError as exc:
+            return ToolResult(tool.tool_name, ToolStatus.INVALID, error=str(exc), arguments=arguments)
+        if not tool.handler:
+            return ToolResult(tool.tool_name, ToolStatus.ERROR, error="Tool has no runtime.handler", arguments=validated)
+        if tool.isolated and self.process_pool is not None:
+            return tool, validated, self.process_pool.bind(tool.handler, timeout=self.timeout_for(tool))
+        try:
+            handler = self.resolve(tool.handler)
+        except Exception as exc:
+            return ToolResult(
+                tool.tool_name,
+                ToolStatus.ERROR,
+                error=f"Cannot load handler {tool.handler}: {type(exc).__name__}: {exc}",
+                arguments=validated,
+            )
+        return tool, validated, handler
+
+    def execute(self, name: str | MoltpyTool, arguments: dict[str, Any] | None = None) -> ToolResult:
+        """Runs one call and waits for its result, at most ``timeout_ms``."""
+        started_at = time.time()
+        started = time.perf_counter()
+        prepared = self.prepare(name, arguments)
+        if isinstance(prepared, ToolResult):
+            return self.finish(prepared, started_at, started)
+        tool, validated, handler = prepared
+        hit = self.cached_result(tool, validated)
+        if hit is not None:
+            return self.finish(hit, started_at, started)
+        timeout = self.timeout_for(tool)
+        slot = self._slot(tool)
+        if not slot.acquire(timeout=timeout):
+            result = ToolResult(tool.tool_name, ToolStatus.BUSY, error="Concurrency limit reached", arguments=validated)
+            return self.finish(result, started_at, started)
+        try:
+            future = self._start(tool, slot, handler, validated)
+        except RuntimeError as exc:
+            return self.finish(ToolResult(tool.tool_name, ToolStatus.ERROR, error=str(exc)), started_at, started)
+        remaining = max(0.0, timeout - (time.perf_counter() - started))
+        try:
+            output = future.result(timeout=remaining)
+        except FutureTimeout:
+            future.cancel()
+            result = ToolResult(
+                tool.tool_name,
+                ToolStatus.TIMEOUT,
+                error=f"Timed out after {timeout * 1000.0:.0f} ms",
+                arguments=validated,
+            )
+            return self.finish(result, started_at, started)
+        except Exception as exc:
+            result = ToolResult(tool.tool_name, ToolStatus.ERROR, error=f"{type(exc).__name__}: {exc}", arguments=validated)
+            return self.finish(result, started_at, started)
+        return self.finish(self.checked(tool, validated, output), started_at, started)
+
+    def try_start(self, tool: MoltpyTool, arguments: dict[str, Any], handler: Callable[..., Any]) -> Future | None:
+        """Starts a prepared call if the tool has a free slot, without waiting."""
+        slot = self._slot(tool)
+        if not slot.acquire(blocking=False):
+            return None
+        return self._start(tool, slot, handler, arguments)
+
+    def notify_slot_free(self, tool: MoltpyTool, wake: Callable[[], None]) -> Callable[[], None]:
+        """Calls ``wake`` once, from the releasing thread, the next time a slot
+        of ``tool`` is released; returns a function that unregisters it.
+        Register before retrying ``try_start`` so no release is missed."""
+        with self._lock:
+            self._slot_waiters.setdefault(tool.tool_name, []).append(wake)
+
+        def cancel() -> None:
+            with self._lock:
+                waiters = self._slot_waiters.get(tool.tool_name)
+                if waiters is not None and wake in waiters:
+                    waiters.remove(wake)
+
+        return cancel
+
+    def _start(
+        self, tool: MoltpyTool, slot: threading.BoundedSemaphore, handler: Callable[..., Any], arguments: dict[str, Any]
+    ) -> Future:
+        """Submits a call whose ``slot`` is already held; the slot is released
+        when the handler returns or the queued call is cancelled."""
+        try:
+            future = self._pool.submit(handler, **arguments)
+        except RuntimeError:
+            self._release_slot(tool.tool_name, slot)
+            raise
+        future.add_done_callback(lambda _: self._release_slot(tool.tool_name, slot))
+        return future
+
+    def _release_slot(self, tool_name: str, slot: threading.BoundedSemaphore) -> None:
+        slot.release()
+        if tool_name in self._slot_waiters:
+            with self._lock:
+                waiters = self._slot_waiters.pop(tool_name, None) or []
+            for wake in waiters:
+                wake()
+
+    def execute_call(self, call: dict[str, Any]) -> ToolResult:
+        """Runs a ``{"name": ..., "arguments": {...}}`` dict as produced by
+        ``MoltpyTool.tool_call``."""
+        return self.execute(call.get("name", ""), call.get("arguments") or {})
+
+    def cached_result(self, tool: MoltpyTool, arguments: dict[str, Any]) -> ToolResult | None:
+        if self.result_cache is None or not tool.cacheable:
+            return None
+        found, output = self.result_cache.get(tool.tool_name, arguments, tool.manifest_digest())
+        if not found:
+            return None
+        return ToolResult(tool.tool_name, ToolStatus.OK, output=output, arguments=arguments, cached=True)
+
+    def checked(self, tool: MoltpyTool, arguments: dict[str, Any], output: Any) -> ToolResult:
+        """Result for a handler's return value, checked against
+        ``output_schema``; valid outputs of cacheable tools are memoized."""
+        try:
+            output = tool.validate_output(output)
+        except SchemaValidationError as exc:
+            return ToolResult(tool.tool_name, ToolStatus.INVALID, output=output, error=f"output {exc}", arguments=arguments)
+        if self.result_cache is not None and tool.cacheable:
+            self.result_cache.put(tool.tool_name, arguments, output, ttl=tool.ttl, fingerprint=tool.manifest_digest())
+        return ToolResult(tool.tool_name, ToolStatus.OK, output=output, arguments=arguments)
+
+    def finish(self, result: ToolResult, started_at: float, started: float) -> ToolResult:
+        """Stamps timing on ``result`` and counts it."""
+        result.started_at = started_at
+        result.elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self.calls += 1
+            if result.status == ToolStatus.TIMEOUT:
+                self.timeouts += 1
+            elif result.status == ToolStatus.CANCELLED:
+                self.cancelled += 1
+            elif not result.ok:
+                self.failures += 1
+        return result
+
+    def stats_text(self) -> str:
+        return (
+            f"calls={self.calls} failures={self.failures} timeouts={self.timeouts} "
+            f"cancelled={self.cancelled} handlers={len(self._handlers)}"
+        )
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+# Package that handlers of tools under ``<moltpy_path>/tools`` are imported
+# from, e.g. ``user_tools.web.search:run`` for ``tools/web/search.py``. The
+# repository's own ``src/tools`` package would shadow a second ``tools`` root.
+USER_TOOLS_PACKAGE = "user_tools"
+
+
+def mount_handler_package(name: str, path: str | Path) -> types.ModuleType:
+    """Makes ``path`` importable as the package ``name`` without an
+    ``__init__.py`` or a ``sys.path`` entry; mounting more paths under the
+    same name merges them, like a namespace package."""
+    path = str(path)
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.machinery.ModuleSpec(name, None, is_package=True)
+        spec.submodule_search_locations = []
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+    if path not in module.__path__:
+        module.__path__.append(path)
+    importlib.invalidate_caches()
+    return module
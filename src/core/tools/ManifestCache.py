@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from .MoltpyTool import MoltpyTool
+
+
+class MoltpyManifestCache:
+    """Parsed tool manifests persisted under the Moltpy data directory.
+
+    Entries are keyed by path and validated by ``mtime_ns`` and size; when
+    those changed, the content hash decides whether the file really needs to
+    be parsed again. The whole cache is one JSON document, read once on load
+    and rewritten only when something changed. ``manifest`` may be called
+    from several loader threads at once.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.parsed = 0
+
+    def load(self) -> "MoltpyManifestCache":
+        self._entries = {}
+        self._seen = set()
+        self._dirty = False
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if isinstance(payload, dict) and payload.get("version") == self.VERSION:
+            entries = payload.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+        return self
+
+    def manifest(self, path: Path) -> dict[str, Any]:
+        """Manifest data for ``path``, parsing the file only if it changed."""
+        key = str(path)
+        stat = path.stat()
+        with self._lock:
+            self._seen.add(key)
+            entry = self._entries.get(key)
+            if entry is not None and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+                self.hits += 1
+                return entry["data"]
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        reused = entry is not None and entry.get("sha256") == digest
+        data = entry["data"] if reused else MoltpyTool.parse_manifest(raw, path.suffix)
+        with self._lock:
+            if reused:
+                self.hits += 1
+            else:
+                self.parsed += 1
+            self._entries[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": digest,
+                "data": data,
+            }
+            self._dirty = True
+        return data
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            if self._entries.pop(str(path), None) is not None:
+                self._dirty = True
+
+    def prune(self) -> int:
+        """Drops entries for files not looked up since ``load``."""
+        stale = [key for key in self._entries if key not in self._seen]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+        return len(stale)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(self.path.name + ".tmp")
+        with partial.open("w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "entries": self._entries}, f, separators=(",", ":"))
+        os.replace(partial, self.path)
+        self._dirty = False
@@ -1,9 +1,25 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+from .Schema import SchemaValidationError, Validator, compile_schema, validate_many
+
+_yaml_module: Any = None
+
+
+def _yaml() -> Any:
+    global _yaml_module
+    if _yaml_module is None:
+        try:
+            import yaml
+        except ImportError as exc:
+            raise ValueError("PyYAML is required to load YAML tool files.") from exc
+        _yaml_module = yaml
+    return _yaml_module
 
 
 @dataclass
@@ -13,18 +29,22 @@ class MoltpyTool:
     tool: dict[str, Any]
     runtime: dict[str, Any] = field(default_factory=dict)
     examples: list[dict[str, Any]] = field(default_factory=list)
+    trusted: bool = field(default=True, compare=False)
+    _input_validator: Validator | None = field(default=None, init=False, repr=False, compare=False)
+    _output_validator: Validator | None = field(default=None, init=False, repr=False, compare=False)
+    _manifest_digest: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @staticmethod
     def _load_file(path: Path) -> dict[str, Any]:
-        suffix = path.suffix.lower()
+        return MoltpyTool.parse_manifest(path.read_bytes(), path.suffix)
+
+    @staticmethod
+    def parse_manifest(raw: bytes, suffix: str) -> dict[str, Any]:
+        suffix = suffix.lower()
         if suffix == ".json":
-            return json.loads(path.read_text(encoding="utf-8"))
+            return json.loads(raw.decode("utf-8"))
         if suffix in {".yml", ".yaml"}:
-            try:
-                import yaml
-            except ImportError as exc:
-                raise ValueError("PyYAML is required to load YAML tool files.") from exc
-            return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+            return _yaml().safe_load(raw.decode("utf-8")) or {}
         raise ValueError("Only JSON or YAML tool files are supported.")
 
     @classmethod
@@ -67,14 +87,80 @@ class MoltpyTool:
             "examples": self.examples,
         }
 
-    def tool_call(self, **kwargs: Any) -> dict[str, Any]:
-        input_schema = self.tool.get("input_schema", {})
-        required = input_schema.get("required", [])
-        missing = [key for key in required if key not in kwargs]
-        if missing:
-            raise ValueError(f"Missing required inputs: {', '.join(missing)}")
+    def manifest_digest(self) -> str:
+        """SHA-256 of the canonical manifest, computed on first use. Any
+        edit to the manifest, including ``runtime.version`` or the handler,
+        changes it."""
+        if self._manifest_digest is None:
+            canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"), default=str)
+            self._manifest_digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return self._manifest_digest
+
+    @property
+    def call_name(self) -> str:
+        """Name used in ``tool_call`` dicts (``tool.name``)."""
+        return self.tool.get("name", self.tool_name)
+
+    @property
+    def handler(self) -> str | None:
+        return self.runtime.get("handler")
+
+    @property
+    def timeout_ms(self) -> int | None:
+        value = self.runtime.get("timeout_ms")
+        return int(value) if value else None
 
+    @property
+    def requires(self) -> list[str]:
+        """Capabilities from ``runtime.requires`` (e.g. ``["network"]``)."""
+        return [str(name) for name in self.runtime.get("requires") or []]
+
+    @property
+    def isolated(self) -> bool:
+        """Whether the handler must run in a worker process: ``runtime.isolated``,
+        defaulting to true for tools loaded from an untrusted location."""
+        return bool(self.runtime.get("isolated", not self.trusted))
+
+    @property
+    def cacheable(self) -> bool:
+        return bool(self.runtime.get("cacheable", False))
+
+    @property
+    def ttl(self) -> float | None:
+        """Seconds a cached result stays valid (``runtime.ttl``); None = until evicted."""
+        value = self.runtime.get("ttl")
+        return float(value) if value else None
+
+    @property
+    def max_concurrency(self) -> int | None:
+        value = self.runtime.get("max_concurrency")
+        return max(1, int(value)) if value else None
+
+    def input_validator(self) -> Validator:
+        """``tool.input_schema`` compiled on first use and kept on the instance."""
+        if self._input_validator is None:
+            self._input_validator = compile_schema(self.tool.get("input_schema"))
+        return self._input_validator
+
+    def output_validator(self) -> Validator:
+        if self._output_validator is None:
+            self._output_validator = compile_schema(self.tool.get("output_schema"))
+        return self._output_validator
+
+    def validate_input(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Checked arguments with schema defaults filled in; raises
+        ``SchemaValidationError``."""
+        return self.input_validator()(arguments)
+
+    def validate_output(self, result: Any) -> Any:
+        return self.output_validator()(result)
+
+    def validate_inputs(self, calls: Iterable[dict[str, Any]]) -> list[dict[str, Any] | SchemaValidationError]:
+        """Validates many argument dicts; invalid ones come back as the error."""
+        return validate_many(self.input_validator(), calls)
+
+    def tool_call(self, **kwargs: Any) -> dict[str, Any]:
         return {
-            "name": self.tool.get("name", self.tool_name),
-            "arguments": kwargs,
+            "name": self.call_name,
+            "arguments": self.validate_input(kwargs),
         }
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import importlib
+import itertools
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+from .Handlers import mount_handler_package
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+
+class ToolWorkerError(RuntimeError):
+    """A handler failed inside a worker process, or the worker died."""
+
+
+def _rss_bytes() -> int:
+    """Resident set size of this process; peak RSS where current is unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return 0
+        return int(psutil.Process().memory_info().rss)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _worker_main(conn: Connection, preload: list[str], packages: dict[str, str]) -> None:
+    """Worker loop: mount ``packages`` (name -> directory), import
+    ``preload``, then serve ``(call_id, handler, arguments)`` messages until
+    ``None`` arrives or the pipe closes."""
+    # Ctrl-C reaches the whole process group; the parent shuts workers down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for name, path in packages.items():
+        mount_handler_package(name, path)
+    for module_name in preload:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass  # reported when a call needs it
+    handlers: dict[str, Callable[..., Any]] = {}
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        call_id, handler, arguments = message
+        try:
+            fn = handlers.get(handler)
+            if fn is None:
+                module_name, _, attr = handler.partition(":")
+                fn = importlib.import_module(module_name)
+                for part in attr.split("."):
+                    fn = getattr(fn, part)
+                handlers[handler] = fn
+            reply = (call_id, True, fn(**arguments), _rss_bytes())
+        except BaseException as exc:
+            reply = (call_id, False, f"{type(exc).__name__}: {exc}", _rss_bytes())
+        try:
+            conn.send(reply)
+        except Exception as exc:
+            conn.send((call_id, False, f"Unsendable result: {type(exc).__name__}: {exc}", _rss_bytes()))
+
+
+class _Worker:
+    def __init__(self, context: Any, preload: list[str], packages: dict[str, str]) -> None:
+        self.conn, child = context.Pipe(duplex=True)
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child, preload, packages),
+            name="moltpy-tool-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        self.calls = 0
+        self.rss = 0
+
+    def stop(self, timeout: float = 1.0) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1.0)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(1.0)
+        self.conn.close()
+
+
+class MoltpyToolProcessPool:
+    """Warm worker processes for handlers that must not run in-process.
+
+    Workers start ahead of time and import ``preload`` modules once, so a call
+    costs a pipe round trip rather than an interpreter start. A handler that
+    crashes or overruns its timeout takes only its worker down: the worker is
+    killed and replaced. Workers are also recycled after ``max_calls`` calls
+    or once their RSS exceeds ``max_rss_bytes``. Arguments and results cross
+    the pipe pickled. ``packages`` maps package names to directories that
+    workers mount before importing handlers, e.g. ``user_tools`` to
+    ``<moltpy_path>/tools``.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        preload: list[str] | None = None,
+        max_calls: int = 500,
+        max_rss_bytes: int = 512 * 1024 * 1024,
+        packages: dict[str, str] | None = None,
+    ) -> None:
+        self.size = max(1, int(workers))
+        self.preload = list(preload or [])
+        self.max_calls = max(1, int(max_calls))
+        self.max_rss_bytes = max(0, int(max_rss_bytes))
+        self.packages = {name: str(path) for name, path in (packages or {}).items()}
+        import multiprocessing  # only needed once isolated tools exist
+
+        # Workers are started from a process that already runs threads, and
+        # replacements from executor threads, where fork() can deadlock.
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        if "forkserver" in methods:
+            self._context.set_forkserver_preload([__name__])
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._workers: set[_Worker] = set()  # idle and busy
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._retired = threading.Condition(self._lock)
+        self._closed = False
+        self.calls = 0
+        self.failures = 0
+        self.recycled = 0
+        self.killed = 0
+        self.peak_rss = 0  # largest worker RSS reported since the last reset_peak()
+        for _ in range(self.size):
+            self._park(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._context, self.preload, self.packages)
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def call(self, handler: str, arguments: dict[str, Any], timeout: float | None = None) -> Any:
+        """Runs ``handler`` with ``arguments`` in a worker and returns its
+        result. Raises ``TimeoutError`` if no worker is free or the handler
+        overruns ``timeout`` seconds, ``ToolWorkerError`` if it fails."""
+        if self._closed:
+            raise ToolWorkerError("Tool process pool is closed")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No tool worker process available") from None
+        if self._closed:
+            self._park(worker)
+            raise ToolWorkerError("Tool process pool is closed")
+        call_id = next(self._ids)
+        with self._lock:
+            self.calls += 1
+        try:
+            worker.conn.send((call_id, handler, arguments))
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            answered = worker.conn.poll(remaining)
+            if answered:
+                reply_id, ok, payload, rss = worker.conn.recv()
+        except (EOFError, OSError, ValueError) as exc:
+            self._replace(worker, killed=True)
+            raise ToolWorkerError(f"Tool worker process died running {handler}: {exc}") from None
+        if not answered:
+            self._replace(worker, killed=True)
+            raise TimeoutError(f"Tool handler {handler} timed out in worker process")
+        worker.calls += 1
+        worker.rss = rss
+        if rss > self.peak_rss:
+            self.peak_rss = rss
+        self._release(worker)
+        if reply_id != call_id:
+            raise ToolWorkerError(f"Tool worker replied to call {reply_id}, expected {call_id}")
+        if not ok:
+            with self._lock:
+                self.failures += 1
+            raise ToolWorkerError(payload)
+        return payload
+
+    def bind(self, handler: str, timeout: float | None = None) -> Callable[..., Any]:
+        """Callable that runs ``handler`` in the pool with keyword arguments."""
+
+        def run(**arguments: Any) -> Any:
+            return self.call(handler, arguments, timeout=timeout)
+
+        return run
+
+    def reset_peak(self) -> None:
+        self.peak_rss = 0
+
+    def _release(self, worker: _Worker) -> None:
+        if worker.calls >= self.max_calls or (self.max_rss_bytes and worker.rss > self.max_rss_bytes):
+            self._replace(worker, killed=False)
+        else:
+            self._park(worker)
+
+    def _park(self, worker: _Worker) -> None:
+        """Returns ``worker`` to the idle queue, or stops it once the pool is
+        closed; ``shutdown`` sets ``_closed`` under the same lock."""
+        with self._lock:
+            if not self._closed:
+                self._idle.put(worker)
+                return
+        worker.stop(timeout=0.5)
+        self._retire(worker)
+
+    def _retire(self, worker: _Worker) -> None:
+        with self._lock:
+            self._workers.discard(worker)
+            self._retired.notify_all()
+
+    def _replace(self, worker: _Worker, killed: bool) -> None:
+        with self._lock:
+            if killed:
+                self.failures += 1
+                self.killed += 1
+            else:
+                self.recycled += 1
+        if killed:
+            worker.kill()
+        else:
+            worker.stop()
+        self._retire(worker)
+        if not self._closed:
+            self._park(self._spawn())
+
+    def stats_text(self) -> str:
+        return (
+            f"workers={self.size} idle={self._idle.qsize()} calls={self.calls} failures={self.failures} "
+            f"recycled={self.recycled} killed={self.killed}"
+        )
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Stops idle workers now. Busy workers stop once their call returns;
+        those still busy after ``timeout`` seconds are killed and their calls
+        fail with ``ToolWorkerError``."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.stop(timeout=0.5)
+            self._retire(worker)
+        with self._lock:
+            self._retired.wait_for(lambda: not self._workers, timeout)
+            busy = list(self._workers)
+            self._workers.clear()
+        for worker in busy:
+            worker.kill()
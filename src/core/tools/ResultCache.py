@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class _CachedResult:
+    output: Any
+    expires_at: float | None
+    size: int
+
+
+class MoltpyToolResultCache:
+    """LRU cache of tool outputs for manifests with ``runtime.cacheable``.
+
+    Keys are the tool name plus a digest of the tool's manifest and the
+    validated arguments, so a call that relies on a schema default and one
+    that passes the same value explicitly share an entry, while a persisted
+    result is not served once the manifest (its version, handler or schema)
+    has changed. ``runtime.ttl`` (seconds) bounds an entry's
+    age; expiry uses wall-clock time so persisted entries stay meaningful
+    across restarts. Memory is bounded by entry count and by the JSON size of
+    the stored outputs, evicting least recently used entries first.
+    """
+
+    VERSION = 2
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024, path: str | Path | None = None) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.path = Path(path) if path is not None else None
+        self._entries: OrderedDict[tuple[str, str], _CachedResult] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(tool_name: str, arguments: dict[str, Any], fingerprint: str = "") -> tuple[str, str]:
+        """``fingerprint`` identifies the tool's definition, e.g.
+        ``MoltpyTool.manifest_digest()``."""
+        canonical = json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+        return tool_name, hashlib.sha256(f"{fingerprint}\n{canonical}".encode("utf-8")).hexdigest()
+
+    def get(self, tool_name: str, arguments: dict[str, Any], fingerprint: str = "") -> tuple[bool, Any]:
+        """``(True, output)`` on a live hit, ``(False, None)`` otherwise."""
+        key = self.key(tool_name, arguments, fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= time.time():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            output = entry.output
+        return True, copy.deepcopy(output)
+
+    def put(
+        self, tool_name: str, arguments: dict[str, Any], output: Any, ttl: float | None = None, fingerprint: str = ""
+    ) -> None:
+        try:
+            size = len(json.dumps(output, separators=(",", ":")))
+        except (TypeError, ValueError):
+            return  # only JSON-shaped outputs are cached
+        if size > self.max_bytes:
+            return
+        key = self.key(tool_name, arguments, fingerprint)
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = _CachedResult(copy.deepcopy(output), expires_at, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def invalidate(self, tool_name: str | None = None) -> int:
+        """Drops entries for ``tool_name`` (everything when None)."""
+        with self._lock:
+            keys = [key for key in self._entries if tool_name is None or key[0] == tool_name]
+            for key in keys:
+                self._drop(key)
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats_text(self) -> str:
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100.0) if total else 0.0
+        return (
+            f"entries={len(self._entries)} size={self._bytes / 1024:.1f}KiB hits={self.hits} "
+            f"misses={self.misses} hit_rate={rate:.0f}% evicted={self.evictions}"
+        )
+
+    def load(self) -> "MoltpyToolResultCache":
+        """Reads persisted entries, skipping expired ones."""
+        if self.path is None:
+            return self
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if not isinstance(payload, dict) or payload.get("version") != self.VERSION:
+            return self
+        now = time.time()
+        for item in payload.get("entries") or []:
+            try:
+                tool_name, digest, expires_at, output = item
+            except (TypeError, ValueError):
+                continue
+            if expires_at is not None and expires_at <= now:
+                continue
+            size = len(json.dumps(output, separators=(",", ":")))
+            with self._lock:
+                self._drop((tool_name, digest))
+                self._entries[(tool_name, digest)] = _CachedResult(output, expires_at, size)
+                self._bytes += size
+        with self._lock:
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return self
+
+    def save(self) -> None:
+        """Writes live entries in LRU order (oldest first) and replaces the
+        previous file atomically."""
+        if self.path is None:
+            return
+        now = time.time()
+        with self._lock:
+            entries = [
+                [tool_name, digest, entry.expires_at, entry.output]
+                for (tool_name, digest), entry in self._entries.items()
+                if entry.expires_at is None or entry.expires_at > now
+            ]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(self.path.name + ".tmp")
+        with partial.open("w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "entries": entries}, f, separators=(",", ":"))
+        os.replace(partial, self.path)
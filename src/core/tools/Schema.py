@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import copy
+import re
+from typing import Any, Callable, Iterable
+
+Validator = Callable[[Any], Any]
+
+
+class SchemaValidationError(ValueError):
+    """A value that does not match a tool schema.
+
+    ``path`` lists the keys and indexes leading to the offending value; it is
+    filled in as the error propagates out of nested validators.
+    """
+
+    def __init__(self, message: str, path: list[str | int] | None = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.path: list[str | int] = path or []
+
+    def location(self) -> str:
+        text = "$"
+        for part in self.path:
+            text += f"[{part}]" if isinstance(part, int) else f".{part}"
+        return text
+
+    def __str__(self) -> str:
+        return f"{self.location()}: {self.message}" if self.path else self.message
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": _is_integer,
+    "number": _is_number,
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+    "null": lambda value: value is None,
+}
+
+# Exact classes accepted without calling the slower predicates above.
+_EXACT_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+    "null": (type(None),),
+}
+
+_IMMUTABLE = (str, int, float, bool, type(None))
+
+
+def _default_factory(default: Any) -> Callable[[], Any]:
+    if isinstance(default, _IMMUTABLE):
+        return lambda: default
+    return lambda: copy.deepcopy(default)
+
+
+def compile_schema(schema: dict[str, Any] | None) -> Validator:
+    """Compiles a JSON-schema subset into a single validating callable.
+
+    The returned function checks a value and returns it with ``default``
+    values filled in for absent object properties. Objects that need defaults
+    are copied, so the caller's input is never modified. Supported keywords:
+    ``type``, ``enum``, ``const``, ``properties``, ``required``,
+    ``additionalProperties``, ``items``, ``minItems``/``maxItems``,
+    ``minLength``/``maxLength``, ``pattern``, ``minimum``/``maximum``,
+    ``exclusiveMinimum``/``exclusiveMaximum``, ``anyOf`` and ``allOf``.
+    Unknown keywords are ignored.
+    """
+    if not schema:
+        return lambda value: value
+    if not isinstance(schema, dict):
+        raise TypeError("Schema must be a dict.")
+
+    checks: list[Validator] = []
+
+    declared = schema.get("type")
+    # A lone "object" type is enforced by the property check itself.
+    strict = declared == "object" and _has_object_keywords(schema)
+    if declared is not None and not strict:
+        checks.append(_compile_type(declared))
+
+    if "enum" in schema:
+        options = list(schema["enum"])
+
+        def check_enum(value: Any) -> Any:
+            if value not in options:
+                raise SchemaValidationError(f"must be one of {options!r}")
+            return value
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        constant = schema["const"]
+
+        def check_const(value: Any) -> Any:
+            if value != constant:
+                raise SchemaValidationError(f"must equal {constant!r}")
+            return value
+
+        checks.append(check_const)
+
+    checks.extend(_compile_string(schema))
+    checks.extend(_compile_number(schema))
+    checks.extend(_compile_array(schema))
+    checks.extend(_compile_object(schema, strict))
+    checks.extend(_compile_combinators(schema))
+
+    if not checks:
+        return lambda value: value
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+
+        def check_both(value: Any) -> Any:
+            return second(first(value))
+
+        return check_both
+    chain = tuple(checks)
+
+    def check_all(value: Any) -> Any:
+        for check in chain:
+            value = check(value)
+        return value
+
+    return check_all
+
+
+def _compile_type(declared: str | list[str]) -> Validator:
+    names = [declared] if isinstance(declared, str) else list(declared)
+    unknown = [name for name in names if name not in _TYPE_CHECKS]
+    if unknown:
+        raise ValueError(f"Unsupported schema type: {', '.join(unknown)}")
+    exact = frozenset(cls for name in names for cls in _EXACT_TYPES[name])
+    type_checks = tuple(_TYPE_CHECKS[name] for name in names)
+    expected = " or ".join(names)
+
+    def check_type(value: Any) -> Any:
+        if type(value) in exact:
+            return value
+        for type_check in type_checks:
+            if type_check(value):
+                return value
+        raise SchemaValidationError(f"expected {expected}, got {type(value).__name__}")
+
+    return check_type
+
+
+def _compile_string(schema: dict[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
+    if min_length is not None or max_length is not None:
+        low = int(min_length or 0)
+        high = None if max_length is None else int(max_length)
+
+        def check_length(value: Any) -> Any:
+            if isinstance(value, str):
+                if len(value) < low:
+                    raise SchemaValidationError(f"shorter than {low} characters")
+                if high is not None and len(value) > high:
+                    raise SchemaValidationError(f"longer than {high} characters")
+            return value
+
+        checks.append(check_length)
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any) -> Any:
+            if isinstance(value, str) and pattern.search(value) is None:
+                raise SchemaValidationError(f"does not match {pattern.pattern!r}")
+            return value
+
+        checks.append(check_pattern)
+    return checks
+
+
+def _compile_number(schema: dict[str, Any]) -> list[Validator]:
+    bounds = [
+        (schema.get("minimum"), lambda value, bound: value < bound, "less than"),
+        (schema.get("maximum"), lambda value, bound: value > bound, "greater than"),
+        (schema.get("exclusiveMinimum"), lambda value, bound: value <= bound, "not greater than"),
+        (schema.get("exclusiveMaximum"), lambda value, bound: value >= bound, "not less than"),
+    ]
+    active = tuple((bound, fails, label) for bound, fails, label in bounds if _is_number(bound))
+    if not active:
+        return []
+
+    def check_bounds(value: Any) -> Any:
+        if _is_number(value):
+            for bound, fails, label in active:
+                if fails(value, bound):
+                    raise SchemaValidationError(f"{label} {bound}")
+        return value
+
+    return [check_bounds]
+
+
+def _compile_array(schema: dict[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+    if min_items is not None or max_items is not None:
+        low = int(min_items or 0)
+        high = None if max_items is None else int(max_items)
+
+        def check_size(value: Any) -> Any:
+            if isinstance(value, list):
+                if len(value) < low:
+                    raise SchemaValidationError(f"fewer than {low} items")
+                if high is not None and len(value) > high:
+                    raise SchemaValidationError(f"more than {high} items")
+            return value
+
+        checks.append(check_size)
+    if isinstance(schema.get("items"), dict):
+        item_check = compile_schema(schema["items"])
+
+        def check_items(value: Any) -> Any:
+            if not isinstance(value, list):
+                return value
+            result = value
+            for index, item in enumerate(value):
+                try:
+                    checked = item_check(item)
+                except SchemaValidationError as exc:
+                    exc.path.insert(0, index)
+                    raise
+                if checked is not item:
+                    if result is value:
+                        result = list(value)
+                    result[index] = checked
+            return result
+
+        checks.append(check_items)
+    return checks
+
+
+def _has_object_keywords(schema: dict[str, Any]) -> bool:
+    return bool(schema.get("properties") or schema.get("required")) or schema.get("additionalProperties", True) is not True
+
+
+def _compile_object(schema: dict[str, Any], strict: bool) -> list[Validator]:
+    if not _has_object_keywords(schema):
+        return []
+    properties = schema.get("properties") or {}
+    required = tuple(schema.get("required") or ())
+    additional = schema.get("additionalProperties", True)
+
+    property_checks = {name: compile_schema(sub) for name, sub in properties.items()}
+    defaults = tuple(
+        (name, _default_factory(sub["default"]))
+        for name, sub in properties.items()
+        if isinstance(sub, dict) and "default" in sub
+    )
+    extra_check: Validator | None = compile_schema(additional) if isinstance(additional, dict) else None
+    closed = additional is False
+
+    def check_object(value: Any) -> Any:
+        if not isinstance(value, dict):
+            if strict:
+                raise SchemaValidationError(f"expected object, got {type(value).__name__}")
+            return value
+        for name in required:
+            if name not in value:
+                missing = [key for key in required if key not in value]
+                raise SchemaValidationError(f"missing required properties: {', '.join(missing)}")
+        result = value
+        for name, item in value.items():
+            check = property_checks.get(name)
+            if check is None:
+                if closed:
+                    raise SchemaValidationError("additional property not allowed", [name])
+                check = extra_check
+                if check is None:
+                    continue
+            try:
+                checked = check(item)
+            except SchemaValidationError as exc:
+                exc.path.insert(0, name)
+                raise
+            if checked is not item:
+                if result is value:
+                    result = dict(value)
+                result[name] = checked
+        for name, make_default in defaults:
+            if name not in value:
+                if result is value:
+                    result = dict(value)
+                result[name] = make_default()
+        return result
+
+    return [check_object]
+
+
+def _compile_combinators(schema: dict[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+    if isinstance(schema.get("allOf"), list):
+        parts = tuple(compile_schema(sub) for sub in schema["allOf"])
+
+        def check_all_of(value: Any) -> Any:
+            for part in parts:
+                value = part(value)
+            return value
+
+        checks.append(check_all_of)
+    if isinstance(schema.get("anyOf"), list):
+        options = tuple(compile_schema(sub) for sub in schema["anyOf"])
+
+        def check_any_of(value: Any) -> Any:
+            errors: list[str] = []
+            for option in options:
+                try:
+                    return option(value)
+                except SchemaValidationError as exc:
+                    errors.append(str(exc))
+            raise SchemaValidationError(f"matches none of anyOf ({'; '.join(errors)})")
+
+        checks.append(check_any_of)
+    return checks
+
+
+def validate_many(validator: Validator, values: Iterable[Any]) -> list[Any]:
+    """Runs ``validator`` over ``values``; failures come back as the
+    ``SchemaValidationError`` in place of the value instead of being raised."""
+    results: list[Any] = []
+    append = results.append
+    for value in values:
+        try:
+            append(validator(value))
+        except SchemaValidationError as exc:
+            append(exc)
+    return results
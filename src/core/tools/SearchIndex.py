@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Iterable, Iterator
+
+from .MoltpyTool import MoltpyTool
+
+# Entries taken from each postings list per round of ``search``: small
+# rounds stop close to the threshold, growing ones bound the round count.
+_FIRST_CHUNK = 16
+_MAX_CHUNK = 64
+
+_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+# Term weights per field; a term's frequency in a document is the weighted sum.
+FIELD_WEIGHTS = {
+    "tool_name": 3.0,
+    "call_name": 3.0,
+    "properties": 2.0,
+    "description": 1.0,
+    "examples": 0.5,
+}
+
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has in into is it its of on or that the this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords; ``snake_case``,
+    ``dotted.names`` and ``camelCase`` are split into their parts."""
+    words = (word.lower() for word in _WORD.findall(text))
+    return [word for word in words if word not in STOPWORDS]
+
+
+def _example_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield str(key)
+            yield from _example_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _example_strings(item)
+
+
+def _property_names(schema: Any) -> Iterator[str]:
+    if not isinstance(schema, dict):
+        return
+    properties = schema.get("properties")
+    if isinstance(properties, dict):
+        for name, sub in properties.items():
+            yield str(name)
+            yield from _property_names(sub)
+    yield from _property_names(schema.get("items"))
+
+
+def tool_terms(tool: MoltpyTool) -> Counter[str]:
+    """Weighted term frequencies for one tool."""
+    fields = {
+        "tool_name": tool.tool_name,
+        "call_name": tool.call_name,
+        "description": tool.description or "",
+        "properties": " ".join(_property_names(tool.tool.get("input_schema"))),
+        "examples": " ".join(_example_strings(tool.examples)),
+    }
+    terms: Counter[str] = Counter()
+    for name, text in fields.items():
+        weight = FIELD_WEIGHTS[name]
+        for term in tokenize(text):
+            terms[term] += weight
+    return terms
+
+
+class MoltpyToolIndex:
+    """In-memory BM25 index over tool manifests.
+
+    Each term keeps its postings as a list ordered by BM25 impact (the
+    per-document part of the score), so ``search`` can stop early with
+    Fagin's threshold algorithm instead of scoring every matching tool.
+    Adding or removing a tool only touches the lists of its own terms.
+
+    Length normalization uses an average document length that is frozen
+    until it drifts by more than ``drift``; crossing that bound re-derives
+    the norms and rebuilds impact lists lazily, one term at a time.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, drift: float = 0.1) -> None:
+        self.k1 = k1
+        self.b = b
+        self.drift = drift
+        self._postings: dict[str, dict[str, float]] = {}
+        self._terms: dict[str, Counter[str]] = {}
+        self._lengths: dict[str, float] = {}
+        self._total_length = 0.0
+        self._average = 0.0
+        self._norms: dict[str, float] = {}
+        # term -> {tool_name: impact} and the same pairs as (-impact, tool_name), ascending
+        self._impacts: dict[str, dict[str, float]] = {}
+        self._ranked: dict[str, list[tuple[float, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, tool_name: str) -> bool:
+        return tool_name in self._terms
+
+    def _norm(self, length: float) -> float:
+        return self.k1 * (1.0 - self.b + self.b * length / self._average)
+
+    def add(self, tool: MoltpyTool) -> None:
+        """Indexes ``tool``, replacing any entry with the same ``tool_name``."""
+        self.remove(tool.tool_name)
+        terms = tool_terms(tool)
+        name = tool.tool_name
+        length = sum(terms.values())
+        if self._average <= 0.0:
+            self._average = length or 1.0
+        self._terms[name] = terms
+        self._lengths[name] = length
+        self._total_length += length
+        norm = self._norms[name] = self._norm(length)
+        k1_plus = self.k1 + 1.0
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[name] = tf
+            ranked = self._ranked.get(term)
+            if ranked is not None:
+                impact = tf * k1_plus / (tf + norm)
+                self._impacts[term][name] = impact
+                insort(ranked, (-impact, name))
+
+    def remove(self, tool_name: str) -> bool:
+        terms = self._terms.pop(tool_name, None)
+        if terms is None:
+            return False
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(tool_name, None)
+                if not posting:
+                    del self._postings[term]
+            ranked = self._ranked.get(term)
+            if ranked is not None:
+                impact = self._impacts[term].pop(tool_name, None)
+                if impact is not None:
+                    at = bisect_left(ranked, (-impact, tool_name))
+                    if at < len(ranked) and ranked[at][1] == tool_name:
+                        del ranked[at]
+                if not ranked:
+                    del self._ranked[term]
+                    del self._impacts[term]
+        self._total_length -= self._lengths.pop(tool_name, 0.0)
+        self._norms.pop(tool_name, None)
+        if not self._terms:
+            self._average = 0.0
+        return True
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._terms.clear()
+        self._lengths.clear()
+        self._norms.clear()
+        self._impacts.clear()
+        self._ranked.clear()
+        self._total_length = 0.0
+        self._average = 0.0
+
+    def _check_drift(self) -> None:
+        current = self._total_length / len(self._terms)
+        if abs(current - self._average) <= self.drift * self._average:
+            return
+        self._average = current
+        self._norms = {name: self._norm(length) for name, length in self._lengths.items()}
+        self._impacts.clear()
+        self._ranked.clear()
+
+    def _ranked_postings(self, term: str) -> tuple[list[tuple[float, str]], dict[str, float]] | None:
+        ranked = self._ranked.get(term)
+        if ranked is not None:
+            return ranked, self._impacts[term]
+        posting = self._postings.get(term)
+        if not posting:
+            return None
+        k1_plus = self.k1 + 1.0
+        norms = self._norms
+        impacts = {name: tf * k1_plus / (tf + norms[name]) for name, tf in posting.items()}
+        ranked = sorted((-impact, name) for name, impact in impacts.items())
+        self._impacts[term] = impacts
+        self._ranked[term] = ranked
+        return ranked, impacts
+
+    def search(self, query: str, k: int = 5) -> list[tuple[str, float]]:
+        """Top ``k`` ``(tool_name, score)`` pairs for ``query``, best first;
+        ties are broken by ``tool_name``."""
+        if k <= 0 or not self._terms:
+            return []
+        self._check_drift()
+        count = len(self._terms)
+        lists: list[tuple[float, list[tuple[float, str]], dict[str, float]]] = []
+        for term in set(tokenize(query)):
+            found = self._ranked_postings(term)
+            if found is None:
+                continue
+            ranked, impacts = found
+            idf = math.log(1.0 + (count - len(ranked) + 0.5) / (len(ranked) + 0.5))
+            lists.append((idf, ranked, impacts))
+        if not lists:
+            return []
+
+        # Threshold algorithm over impact-ordered lists, in rounds: a tool not
+        # yet seen scores at most the sum of each list's next impact, so once
+        # the k-th best score reaches that bound we can stop. When several
+        # terms are common, that bound stays high for long; but as soon as the
+        # k-th best score exceeds what a tool lacking term t could reach, every
+        # winner must contain t, and intersecting the postings of those
+        # required terms leaves only a few candidates to score.
+        getters = [(idf, impacts.get) for idf, _ranked, impacts in lists]
+        maxima = [idf * -ranked[0][0] for idf, ranked, _impacts in lists]
+        ceiling = sum(maxima)
+        scores: dict[str, float] = {}
+        best: list[float] = []  # min-heap of the k best scores so far
+
+        def score_all(names: Iterable[str]) -> None:
+            for name in names:
+                if name in scores:
+                    continue
+                score = 0.0
+                for term_idf, get in getters:
+                    score += term_idf * get(name, 0.0)
+                scores[name] = score
+                if len(best) < k:
+                    heapq.heappush(best, score)
+                elif score > best[0]:
+                    heapq.heapreplace(best, score)
+
+        depth = 0
+        chunk = _FIRST_CHUNK
+        while True:
+            end = depth + chunk
+            threshold = 0.0
+            exhausted = True
+            for idf, ranked, _impacts in lists:
+                if depth >= len(ranked):
+                    continue
+                exhausted = False
+                score_all(name for _negative_impact, name in ranked[depth:end])
+                if end < len(ranked):
+                    threshold -= idf * ranked[end][0]
+            if exhausted or (len(best) >= k and best[0] >= threshold):
+                break
+            if len(best) >= k and len(lists) > 1:
+                required = [
+                    impacts
+                    for (_idf, _ranked, impacts), maximum in zip(lists, maxima)
+                    if ceiling - maximum < best[0]
+                ]
+                if len(required) > 1:
+                    required.sort(key=len)
+                    score_all(set(required[0]).intersection(*required[1:]))
+                    break
+            depth = end
+            chunk = min(chunk * 2, _MAX_CHUNK)
+        floor = best[0] if len(best) >= k else 0.0
+        ranked_hits = sorted(
+            ((name, score) for name, score in scores.items() if score >= floor),
+            key=lambda hit: (-hit[1], hit[0]),
+        )
+        return ranked_hits[:k]
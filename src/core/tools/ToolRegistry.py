@@ -1,37 +1,220 @@
 from __future__ import annotations
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
+from .ManifestCache import MoltpyManifestCache
 from .MoltpyTool import MoltpyTool
+from .SearchIndex import MoltpyToolIndex
+
+TOOL_SUFFIXES = {".json", ".yml", ".yaml"}
+
+
+@dataclass
+class ToolLoadError:
+    path: Path
+    error: str
+
+
+@dataclass
+class ToolConflict:
+    tool_name: str
+    kept: Path
+    shadowed: Path
+
+
+@dataclass
+class ToolLoadReport:
+    """Outcome of one ``load_tools`` call."""
+
+    scanned: int = 0
+    loaded: int = 0
+    errors: list[ToolLoadError] = field(default_factory=list)
+    conflicts: list[ToolConflict] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def summary_text(self) -> str:
+        return (
+            f"scanned={self.scanned} loaded={self.loaded} errors={len(self.errors)} "
+            f"conflicts={len(self.conflicts)} time={self.elapsed * 1000.0:.1f}ms"
+        )
+
+
+def _scan_dir(root: Path) -> list[Path]:
+    found: list[Path] = []
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            if os.path.splitext(name)[1].lower() in TOOL_SUFFIXES:
+                found.append(Path(dirpath, name))
+    return found
 
 
 @dataclass
 class MoltpyToolRegistry:
     tools: dict[str, MoltpyTool] = field(default_factory=dict)
+    sources: dict[str, Path] = field(default_factory=dict)
+    report: ToolLoadReport = field(default_factory=ToolLoadReport)
+    index: MoltpyToolIndex = field(default_factory=MoltpyToolIndex, repr=False)
+    call_names: dict[str, str] = field(default_factory=dict, repr=False)  # tool.name -> tool_name
 
-    def load_tools(self, paths: Iterable[str | Path]) -> "MoltpyToolRegistry":
+    def load_tools(
+        self,
+        paths: Iterable[str | Path],
+        cache: MoltpyManifestCache | None = None,
+        max_workers: int | None = None,
+        untrusted: Iterable[str | Path] = (),
+    ) -> "MoltpyToolRegistry":
+        """Loads every tool file under ``paths``.
+
+        Directory walking and parsing run on a thread pool. A file that fails
+        to load is recorded in ``report.errors`` and skipped. When two files
+        declare the same ``tool_name`` the one that sorts later wins: files
+        are ordered by position of their root in ``paths`` and then by path
+        relative to that root, so user tools override core tools regardless
+        of scan order. Each override is recorded in ``report.conflicts``.
+
+        With a ``cache``, unchanged manifests come from the cache instead of
+        being parsed again; entries for vanished files are pruned and the
+        cache is saved once at the end. Tools found under an ``untrusted``
+        root are marked ``trusted=False`` so their handlers run isolated.
+        """
+        started = time.perf_counter()
+        report = ToolLoadReport()
+        untrusted_roots = [Path(root).resolve() for root in untrusted]
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="moltpy-tool-load") as pool:
+            files = self._discover(paths, pool)
+            report.scanned = len(files)
+            results = list(pool.map(lambda path: self._load_file(path, cache), files))
+
+        for path, outcome in zip(files, results):
+            if isinstance(outcome, ToolLoadError):
+                report.errors.append(outcome)
+                continue
+            if untrusted_roots:
+                resolved = path.resolve()
+                outcome.trusted = not any(resolved.is_relative_to(root) for root in untrusted_roots)
+            previous = self.sources.get(outcome.tool_name)
+            if previous is not None and previous != path:
+                report.conflicts.append(ToolConflict(outcome.tool_name, kept=path, shadowed=previous))
+            self.add(outcome, source=path)
+            report.loaded += 1
+
+        if cache is not None:
+            cache.prune()
+            try:
+                cache.save()
+            except OSError as exc:
+                report.errors.append(ToolLoadError(cache.path, f"cache not saved: {exc}"))
+        report.elapsed = time.perf_counter() - started
+        self.report = report
+        return self
+
+    @staticmethod
+    def _discover(paths: Iterable[str | Path], pool: ThreadPoolExecutor) -> list[Path]:
+        """Tool files in load order; each top-level subfolder is walked in parallel."""
+        ordered: list[Path] = []
         for base in paths:
             base_path = Path(base)
-            if not base_path.exists():
+            if base_path.is_file():
+                if base_path.suffix.lower() in TOOL_SUFFIXES:
+                    ordered.append(base_path)
                 continue
-
-            if base_path.is_file() and base_path.suffix.lower() in {".json", ".yml", ".yaml"}:
-                tool = MoltpyTool.from_file(base_path)
-                self.tools[tool.tool_name] = tool
+            if not base_path.is_dir():
                 continue
+            found: list[Path] = []
+            subdirs: list[Path] = []
+            try:
+                with os.scandir(base_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            subdirs.append(Path(entry.path))
+                        elif os.path.splitext(entry.name)[1].lower() in TOOL_SUFFIXES:
+                            found.append(Path(entry.path))
+            except OSError:
+                continue
+            for batch in pool.map(_scan_dir, subdirs):
+                found.extend(batch)
+            found.sort(key=lambda path: path.relative_to(base_path).as_posix())
+            ordered.extend(found)
+        return ordered
 
-            for file_path in base_path.rglob("*"):
-                if file_path.suffix.lower() not in {".json", ".yml", ".yaml"}:
-                    continue
-                tool = MoltpyTool.from_file(file_path)
-                self.tools[tool.tool_name] = tool
+    @staticmethod
+    def _load_file(path: Path, cache: MoltpyManifestCache | None) -> MoltpyTool | ToolLoadError:
+        try:
+            if cache is None:
+                return MoltpyTool.from_file(path)
+            return MoltpyTool.from_dict(cache.manifest(path))
+        except Exception as exc:
+            return ToolLoadError(path, f"{type(exc).__name__}: {exc}")
 
-        return self
+    def add(self, tool: MoltpyTool, source: Path | None = None) -> None:
+        """Registers ``tool`` (replacing one with the same name) and indexes it."""
+        previous = self.tools.get(tool.tool_name)
+        if previous is not None and previous.call_name != tool.call_name:
+            self._forget_call_name(previous)
+        self.tools[tool.tool_name] = tool
+        self.call_names.setdefault(tool.call_name, tool.tool_name)
+        if source is not None:
+            self.sources[tool.tool_name] = source
+        self.index.add(tool)
+
+    def remove(self, tool_name: str) -> MoltpyTool | None:
+        tool = self.tools.pop(tool_name, None)
+        self.sources.pop(tool_name, None)
+        self.index.remove(tool_name)
+        if tool is not None:
+            self._forget_call_name(tool)
+        return tool
+
+    def _forget_call_name(self, tool: MoltpyTool) -> None:
+        """Unmaps ``tool.call_name`` if it points at ``tool``; another tool
+        declaring the same call name (the earliest registered) takes over."""
+        if self.call_names.get(tool.call_name) != tool.tool_name:
+            return
+        del self.call_names[tool.call_name]
+        for other in self.tools.values():
+            if other.call_name == tool.call_name and other.tool_name != tool.tool_name:
+                self.call_names[tool.call_name] = other.tool_name
+                break
+
+    def search(self, query: str, k: int = 5) -> list[MoltpyTool]:
+        """The ``k`` tools most relevant to ``query`` (BM25 over names,
+        descriptions, input property names and examples)."""
+        return [self.tools[name] for name, _score in self.index.search(query, k)]
+
+    def diff(self, other: "MoltpyToolRegistry") -> tuple[list[str], list[str], list[str]]:
+        """Tool names added in ``other``, changed (manifest, source file or
+        trust differ) and removed from it, each sorted."""
+        added = sorted(other.tools.keys() - self.tools.keys())
+        removed = sorted(self.tools.keys() - other.tools.keys())
+        changed = sorted(
+            name
+            for name in self.tools.keys() & other.tools.keys()
+            if self.tools[name] != other.tools[name]
+            or self.tools[name].trusted != other.tools[name].trusted
+            or self.sources.get(name) != other.sources.get(name)
+        )
+        return added, changed, removed
 
     def get(self, tool_name: str) -> MoltpyTool | None:
         return self.tools.get(tool_name)
 
+    def find(self, name: str) -> MoltpyTool | None:
+        """Tool by ``tool_name`` or by the ``tool.name`` used in call dicts."""
+        tool = self.tools.get(name)
+        if tool is not None:
+            return tool
+        tool_name = self.call_names.get(name)
+        return self.tools.get(tool_name) if tool_name is not None else None
+
     def all(self) -> list[MoltpyTool]:
         return list(self.tools.values())
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterable
+
+from .ToolRegistry import TOOL_SUFFIXES
+
+# path -> (mtime_ns, size)
+Snapshot = dict[str, tuple[int, int]]
+
+
+class MoltpyToolWatcher:
+    """Polls tool directories for added, removed or edited manifests.
+
+    A poll walks the directories and stats every tool file, comparing
+    ``(mtime_ns, size)`` with the previous poll; nothing is read or parsed.
+    That is cheap enough to run on the heartbeat every few seconds for
+    hundreds of tool files and needs no platform-specific notification API.
+    """
+
+    def __init__(self, paths: Iterable[str | Path]) -> None:
+        self.paths = [Path(path) for path in paths]
+        self._snapshot: Snapshot = self.snapshot()
+        self.polls = 0
+
+    def snapshot(self) -> Snapshot:
+        found: Snapshot = {}
+        for base in self.paths:
+            if base.is_file():
+                self._stat(str(base), found)
+                continue
+            for dirpath, _dirnames, filenames in os.walk(base):
+                for name in filenames:
+                    if os.path.splitext(name)[1].lower() in TOOL_SUFFIXES:
+                        self._stat(os.path.join(dirpath, name), found)
+        return found
+
+    @staticmethod
+    def _stat(path: str, found: Snapshot) -> None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return  # vanished between listing and stat
+        found[path] = (stat.st_mtime_ns, stat.st_size)
+
+    def poll(self) -> list[str]:
+        """Paths added, removed or modified since the previous poll."""
+        self.polls += 1
+        current = self.snapshot()
+        previous = self._snapshot
+        self._snapshot = current
+        if current == previous:
+            return []
+        return sorted(path for path in current.keys() | previous.keys() if current.get(path) != previous.get(path))
+
+    def reset(self) -> None:
+        """Takes the current state as the baseline, e.g. after a manual reload."""
+        self._snapshot = self.snapshot()
@@ -1,4 +1,52 @@
+from .Executor import MoltpyToolExecutor, ToolResult, ToolStatus
+from .Handlers import USER_TOOLS_PACKAGE, mount_handler_package
+from .ManifestCache import MoltpyManifestCache
 from .MoltpyTool import MoltpyTool
-from .ToolRegistry import MoltpyToolRegistry
+from .ResultCache import MoltpyToolResultCache
+from .Schema import SchemaValidationError, compile_schema
+from .SearchIndex import MoltpyToolIndex
+from .ToolRegistry import MoltpyToolRegistry, ToolConflict, ToolLoadError, ToolLoadReport
+from .Watcher import MoltpyToolWatcher
 
-__all__ = ["MoltpyTool", "MoltpyToolRegistry"]
+__all__ = [
+    "USER_TOOLS_PACKAGE",
+    "MoltpyManifestCache",
+    "MoltpyTool",
+    "MoltpyToolBatchRunner",
+    "MoltpyToolBench",
+    "MoltpyToolExecutor",
+    "MoltpyToolIndex",
+    "MoltpyToolProcessPool",
+    "MoltpyToolRegistry",
+    "MoltpyToolResultCache",
+    "MoltpyToolWatcher",
+    "SchemaValidationError",
+    "ToolConflict",
+    "ToolLoadError",
+    "ToolLoadReport",
+    "ToolResult",
+    "ToolStatus",
+    "ToolWorkerError",
+    "compile_schema",
+    "mount_handler_package",
+    "run_bench_cli",
+]
+
+
+def __getattr__(name: str):
+    # The benchmark harness is only loaded by ``moltpy bench tools``.
+    if name in {"MoltpyToolBench", "run_bench_cli"}:
+        from . import Bench
+
+        return getattr(Bench, name)
+    # Worker processes need multiprocessing; only isolated tools start them.
+    if name in {"MoltpyToolProcessPool", "ToolWorkerError"}:
+        from . import ProcessPool
+
+        return getattr(ProcessPool, name)
+    # The batch runner pulls in asyncio; only async callers need it.
+    if name == "MoltpyToolBatchRunner":
+        from .Batch import MoltpyToolBatchRunner
+
+        return MoltpyToolBatchRunner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
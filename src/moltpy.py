@@ -1,10 +1,66 @@
-from core import MoltpyLogger
-from core.bootstrap import MoltpyRuntime
-from tui import MoltpyTui
+import sys
+import time
 
-Moltpy = MoltpyRuntime.get_instance()
-Moltpy.initialize()
-Logger = MoltpyLogger.for_class(Moltpy)
+_STARTED = time.perf_counter()
 
-tui = MoltpyTui(Moltpy, Logger)
-tui.run()
+
+def main(argv: list[str]) -> int:
+    profiler = None
+    if "--profile-startup" in argv:
+        argv = [arg for arg in argv if arg != "--profile-startup"]
+        from core.Profiler import MoltpyStartupProfiler
+
+        profiler = MoltpyStartupProfiler(started_at=_STARTED).install()
+
+    from core import MoltpyLogger
+    from core.bootstrap import MoltpyRuntime
+
+    if argv and argv[0] == "logs":
+        from core.logs import run_logs_cli
+
+        return run_logs_cli(argv[1:], MoltpyRuntime.get_instance().locate_log_path())
+
+    if argv[:2] == ["bench", "tools"]:
+        from core.tools import run_bench_cli
+
+        MoltpyLogger.configure(use_rich=False)
+        Moltpy = MoltpyRuntime.get_instance().initialize()
+        Moltpy.pause_heartbeat()  # keep scheduled jobs out of the measurements
+        try:
+            return run_bench_cli(argv[2:], Moltpy)
+        finally:
+            Moltpy.shutdown()
+
+    headless = "--headless" in argv
+    if profiler is not None or headless:
+        MoltpyLogger.configure(use_rich=False)
+
+    Moltpy = MoltpyRuntime.get_instance()
+    Moltpy.initialize()
+    Logger = MoltpyLogger.for_class(Moltpy)
+
+    if profiler is not None:
+        profiler.uninstall()
+        MoltpyLogger.flush()
+        print(profiler.report(Moltpy.startup_phases), file=sys.stderr)
+        Moltpy.shutdown()
+        return 0
+
+    if headless:
+        try:
+            while Moltpy.heartbeat_thread_alive():
+                time.sleep(0.5)
+        except KeyboardInterrupt:
+            Logger.info("Moltpy execution interrupted by user.")
+        Moltpy.shutdown()
+        return 0
+
+    from tui import MoltpyTui
+
+    tui = MoltpyTui(Moltpy, Logger)
+    tui.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
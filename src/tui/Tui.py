@@ -17,10 +17,14 @@ from rich.text import Text
 
 from core import MoltpyLogger
 
-try:
-    import psutil  # type: ignore
-except Exception:
-    psutil = None
+
+def _psutil():
+    # Optional, and only needed for ``status full``.
+    try:
+        import psutil  # type: ignore
+    except Exception:
+        return None
+    return psutil
 
 
 class LogBuffer:
@@ -186,9 +190,11 @@ class ReplBuffer:
 
 
 class MoltpyTui:
-    COMMANDS = ["reload", "stop", "start", "restart", "pause", "resume", "status", "tools", "help", "exit", "quit"]
+    COMMANDS = ["reload", "stop", "start", "restart", "pause", "resume", "status", "tools", "memory", "help", "exit", "quit"]
     ARG_SUGGESTIONS = {
         "status": ["short", "full"],
+        "tools": ["reload"],
+        "memory": ["notes", "summarize", "similar"],
     }
 
     def __init__(self, runtime, logger) -> None:
@@ -205,7 +211,7 @@ class MoltpyTui:
         self.repl = ReplBuffer(self.COMMANDS, self.ARG_SUGGESTIONS)
         self._running = True
         MoltpyLogger.configure(emit_to_console=False)
-        MoltpyLogger.add_sink(self._logger_sink)
+        MoltpyLogger.add_sink(self._logger_sink, rich=True)
 
     def _logger_sink(self, level: int, line: str, rich_text: Text | None) -> None:
         self.log_buffer.append(line, rich_text)
@@ -295,6 +301,7 @@ class MoltpyTui:
                 log_file = "yes" if self.runtime.log_path() is not None else "no"
                 cpu_text = "n/a"
                 mem_text = "n/a"
+                psutil = _psutil()
                 if psutil is not None:
                     try:
                         proc = psutil.Process(os.getpid())
@@ -313,6 +320,14 @@ class MoltpyTui:
                     interval=self.runtime.heartbeat_interval(),
                     last=last_hb_text,
                 )
+                self.logger.info("Heartbeat timing: {timing}", timing=self.runtime.heartbeat_timing_text())
+                self.logger.info("Heartbeat workers: {pool}", pool=self.runtime.heartbeat_pool_text())
+                jobs = self.runtime.heartbeat_jobs()
+                self.logger.info(
+                    "Heartbeat jobs: {count} | {names}",
+                    count=len(jobs),
+                    names=", ".join(sorted(job.name for job in jobs)) or "none",
+                )
                 self.logger.info(
                     "Uptime: {uptime} | CPU: {cpu} | MEM: {mem}",
                     uptime=self.runtime.uptime_text(),
@@ -341,9 +356,29 @@ class MoltpyTui:
                     file=log_file,
                     path=rel_path(log_path),
                 )
+                queue_depth = self.runtime.log_queue_depth()
+                if queue_depth is not None:
+                    self.logger.info(
+                        "Log queue: depth={depth} | dropped={dropped}",
+                        depth=queue_depth,
+                        dropped=self.runtime.log_queue_dropped(),
+                    )
+                self.logger.info("Tool calls: {stats}", stats=self.runtime.tool_executor_text())
+                self.logger.info("Tool cache: {stats}", stats=self.runtime.tool_cache_text())
                 self.logger.info("Env: {env}", env=self.runtime.config.get("env", "unknown"))
             else:
                 self.logger.info("Runtime status: {status}", status=self.runtime.status_line())
+        elif cmd == "tools" and args[:1] == ["reload"]:
+            added, changed, removed = self.runtime.reload_tools()
+            self.logger.info(
+                "Tools reloaded: {count} loaded, {added} added, {changed} changed, {removed} removed",
+                count=len(self.runtime.tools.all()),
+                added=len(added),
+                changed=len(changed),
+                removed=len(removed),
+            )
+            for failure in self.runtime.tools.report.errors:
+                self.logger.warning("Tool load failed: {path}: {error}", path=failure.path, error=failure.error)
         elif cmd == "tools":
             tools = sorted(self.runtime.tools.all(), key=lambda tool: tool.tool_name.lower())
             if not tools:
@@ -356,9 +391,39 @@ class MoltpyTui:
                         self.logger.info("- {name}: {desc}", name=tool.tool_name, desc=description)
                     else:
                         self.logger.info("- {name}", name=tool.tool_name)
+            report = self.runtime.tools.report
+            self.logger.info("Tool load: {summary}", summary=report.summary_text())
+            for failure in report.errors:
+                self.logger.warning("Tool load failed: {path}: {error}", path=failure.path, error=failure.error)
+            for conflict in report.conflicts:
+                self.logger.warning(
+                    "Tool conflict: {name} from {kept} (overrides {shadowed})",
+                    name=conflict.tool_name,
+                    kept=conflict.kept,
+                    shadowed=conflict.shadowed,
+                )
+        elif cmd == "memory" and args == ["notes", "summarize"]:
+            moved = self.runtime.summarize_notes(final=True)
+            self.logger.info("Summarized {count} short-term note(s) into long-term memory", count=moved)
+            self.logger.info("Summaries: {stats}", stats=self.runtime.note_summarizer().stats_text())
+        elif cmd == "memory" and args[:1] == ["similar"] and len(args) > 1:
+            text = " ".join(parts[2:])
+            self.runtime.sync_similarity()
+            hits = self.runtime.similar(text, 5)
+            if not hits:
+                self.logger.info("Similar notes: none")
+            for key, score in hits:
+                store, _, note_id = key.partition(":")
+                if store == "stm":
+                    note = self.runtime.notes().note_get_by_id(int(note_id))
+                    title = note.title if note else None
+                else:
+                    row = self.runtime.long_term_memory().get_note_nowait(int(note_id)).result()
+                    title = row["title"] if row else None
+                self.logger.info("- {key} {score}: {title}", key=key, score=f"{score:.2f}", title=title or "(deleted)")
         elif cmd == "help":
             self.logger.info(
-                "Commands: reload, stop, start, restart, pause, resume, status, tools, help, exit, quit (Tab=autocomplete, Up/Down=history)"
+                "Commands: reload, stop, start, restart, pause, resume, status, tools [reload], memory notes summarize, memory similar <text>, help, exit, quit (Tab=autocomplete, Up/Down=history)"
             )
         elif cmd in {"exit", "quit"}:
             self.stop()
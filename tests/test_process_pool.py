@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.tools.Handlers import USER_TOOLS_PACKAGE  # noqa: E402
+from core.tools.ProcessPool import MoltpyToolProcessPool  # noqa: E402
+
+
+def test_worker_imports_handler_from_user_tools(tmp_path):
+    handler_dir = tmp_path / "tools" / "web"
+    handler_dir.mkdir(parents=True)
+    (handler_dir / "search.py").write_text("def run(query):\n    return {'results': [query]}\n")
+
+    pool = MoltpyToolProcessPool(
+        workers=1,
+        preload=[f"{USER_TOOLS_PACKAGE}.web.search"],
+        packages={USER_TOOLS_PACKAGE: str(tmp_path / "tools")},
+    )
+    try:
+        result = pool.call(f"{USER_TOOLS_PACKAGE}.web.search:run", {"query": "moltpy"}, timeout=10)
+    finally:
+        pool.shutdown()
+    assert result == {"results": ["moltpy"]}